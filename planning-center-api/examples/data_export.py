@@ -15,22 +15,19 @@ from planning_center_api.utils import (
 
 
 async def export_people_to_json():
-    """Export all people to JSON file."""
+    """Export all people to a gzipped NDJSON file."""
 
     async with PCOClient(app_id="your_app_id", secret="your_secret") as client:
-        print("Exporting people to JSON...")
+        print("Exporting people to NDJSON...")
 
+        # Rows are written as pages arrive, so memory stays flat
         exporter = PCODataExporter(client)
-        people_data = await exporter.export_people_to_dict(
-            include=["emails", "phone_numbers", "addresses"]
+        output_file = Path("people_export.ndjson.gz")
+        count = await exporter.export_people(
+            output_file, include=["emails", "phone_numbers", "addresses"]
         )
 
-        # Save to file
-        output_file = Path("people_export.json")
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(people_data, f, indent=2, default=str)
-
-        print(f"Exported {len(people_data)} people to {output_file}")
+        print(f"Exported {count} people to {output_file}")
 
 
 async def export_people_to_csv():
@@ -59,15 +56,10 @@ async def export_people_to_csv():
             }
 
             # Get primary email if available
-            if person.relationships and hasattr(person.relationships, "emails"):
-                emails_data = person.get_relationship_data("emails")
-                if emails_data and isinstance(emails_data, list):
-                    for email in emails_data:
-                        if email.get("attributes", {}).get("primary"):
-                            person_data["primary_email"] = email.get(
-                                "attributes", {}
-                            ).get("address", "")
-                            break
+            for email in person.related("emails") or []:
+                if email.get_attribute("primary"):
+                    person_data["primary_email"] = email.get_attribute("address", "")
+                    break
 
             people_data.append(person_data)
 
@@ -164,65 +156,37 @@ async def generate_people_report():
                 "addresses": [],
             }
 
-            # Extract related data
-            if person.relationships:
-                # Emails
-                emails_data = person.get_relationship_data("emails")
-                if emails_data and isinstance(emails_data, list):
-                    for email in emails_data:
-                        person_data["emails"].append(
-                            {
-                                "address": email.get("attributes", {}).get(
-                                    "address", ""
-                                ),
-                                "location": email.get("attributes", {}).get(
-                                    "location", ""
-                                ),
-                                "primary": email.get("attributes", {}).get(
-                                    "primary", False
-                                ),
-                            }
-                        )
-
-                # Phone numbers
-                phones_data = person.get_relationship_data("phone_numbers")
-                if phones_data and isinstance(phones_data, list):
-                    for phone in phones_data:
-                        person_data["phone_numbers"].append(
-                            {
-                                "number": phone.get("attributes", {}).get("number", ""),
-                                "location": phone.get("attributes", {}).get(
-                                    "location", ""
-                                ),
-                                "primary": phone.get("attributes", {}).get(
-                                    "primary", False
-                                ),
-                            }
-                        )
-
-                # Addresses
-                addresses_data = person.get_relationship_data("addresses")
-                if addresses_data and isinstance(addresses_data, list):
-                    for address in addresses_data:
-                        person_data["addresses"].append(
-                            {
-                                "street": address.get("attributes", {}).get(
-                                    "street", ""
-                                ),
-                                "city": address.get("attributes", {}).get("city", ""),
-                                "state": address.get("attributes", {}).get("state", ""),
-                                "zip": address.get("attributes", {}).get("zip", ""),
-                                "country": address.get("attributes", {}).get(
-                                    "country", ""
-                                ),
-                                "location": address.get("attributes", {}).get(
-                                    "location", ""
-                                ),
-                                "primary": address.get("attributes", {}).get(
-                                    "primary", False
-                                ),
-                            }
-                        )
+            # Extract related data from the included resources
+            for email in person.related("emails") or []:
+                person_data["emails"].append(
+                    {
+                        "address": email.get_attribute("address", ""),
+                        "location": email.get_attribute("location", ""),
+                        "primary": email.get_attribute("primary", False),
+                    }
+                )
+
+            for phone in person.related("phone_numbers") or []:
+                person_data["phone_numbers"].append(
+                    {
+                        "number": phone.get_attribute("number", ""),
+                        "location": phone.get_attribute("location", ""),
+                        "primary": phone.get_attribute("primary", False),
+                    }
+                )
+
+            for address in person.related("addresses") or []:
+                person_data["addresses"].append(
+                    {
+                        "street": address.get_attribute("street", ""),
+                        "city": address.get_attribute("city", ""),
+                        "state": address.get_attribute("state", ""),
+                        "zip": address.get_attribute("zip", ""),
+                        "country": address.get_attribute("country", ""),
+                        "location": address.get_attribute("location", ""),
+                        "primary": address.get_attribute("primary", False),
+                    }
+                )
 
             report["people"].append(person_data)
 
@@ -4,6 +4,7 @@ from .client import PCOClient
 from .config import PCOConfig, PCOProduct
 from .exceptions import (
     PCOAuthenticationError,
+    PCOCircuitOpenError,
     PCOError,
     PCONotFoundError,
     PCOPermissionError,
@@ -26,6 +27,7 @@ __all__ = [
     "PCOValidationError",
     "PCONotFoundError",
     "PCOServerError",
+    "PCOCircuitOpenError",
     "PCOBaseModel",
     "PCOResource",
     "PCOCollection",
@@ -0,0 +1,339 @@
+"""Response caching for Planning Center API."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+# Response headers kept alongside a persisted body
+PERSISTED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+@dataclass
+class PCOCacheStats:
+    """Counters describing how a response cache is performing."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    """A cached response body and its expiry time."""
+
+    content: bytes
+    expires_at: float
+
+
+class PCOResponseCache:
+    """In-memory cache of GET response bodies with TTL and LRU eviction.
+
+    Entries are keyed by request URL and query string. Each entry expires
+    after the TTL configured for its endpoint, and the least recently used
+    entries are evicted once the cached bodies exceed ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        default_ttl: float = 60.0,
+        ttls: dict[str, float] | None = None,
+    ):
+        """Initialize the response cache.
+
+        Args:
+            max_bytes: Upper bound on the total size of cached bodies
+            default_ttl: Seconds an entry stays fresh when its endpoint has
+                no TTL of its own (0 disables caching for those endpoints)
+            ttls: Per-endpoint TTLs in seconds, e.g. ``{"funds": 3600}``
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = ttls or {}
+        self.stats = PCOCacheStats()
+        self.size = 0
+        # Bumped on every invalidation so in-flight fetches started before
+        # it don't store stale bodies afterwards
+        self.generation = 0
+
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Get the TTL for an endpoint, falling back to its first segment."""
+        if endpoint in self.ttls:
+            return self.ttls[endpoint]
+        return self.ttls.get(endpoint.split("/", 1)[0], self.default_ttl)
+
+    def get(self, key: str) -> bytes | None:
+        """Get a fresh cached body, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.content
+
+    def set(
+        self, key: str, content: bytes, ttl: float, generation: int | None = None
+    ) -> None:
+        """Store a body for ``ttl`` seconds.
+
+        Args:
+            key: Cache key
+            content: Response body
+            ttl: Seconds the entry stays fresh
+            generation: Value of ``generation`` when the fetch started; the
+                body is dropped if the cache was invalidated since then
+        """
+        if ttl <= 0 or len(content) > self.max_bytes:
+            return
+        if generation is not None and generation != self.generation:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _CacheEntry(content, time.monotonic() + ttl)
+        self.size += len(content)
+
+        while self.size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def invalidate(self, prefix: str) -> int:
+        """Remove every entry for a URL and anything beneath it.
+
+        Args:
+            prefix: URL of a collection or resource
+
+        Returns:
+            Number of entries removed
+        """
+        self.generation += 1
+        stale = [key for key in self._entries if _is_under(key, prefix)]
+        for key in stale:
+            self._remove(key)
+        self.stats.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self.generation += 1
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+        self.size = 0
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and release its size."""
+        entry = self._entries.pop(key)
+        self.size -= len(entry.content)
+
+
+@dataclass
+class PCOCachedResponse:
+    """A response body read back from the persistent HTTP cache."""
+
+    content: bytes
+    headers: dict[str, str]
+    expires_at: float
+
+    def is_fresh(self) -> bool:
+        """Check whether the entry can be used without revalidation."""
+        return time.time() < self.expires_at
+
+    def validators(self) -> dict[str, str]:
+        """Get the conditional request headers for revalidating the entry."""
+        validators = {}
+        if "etag" in self.headers:
+            validators["If-None-Match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            validators["If-Modified-Since"] = self.headers["last-modified"]
+        return validators
+
+    def to_response(self, method: str, url: str) -> httpx.Response:
+        """Rebuild an ``httpx.Response`` from the cached entry."""
+        return httpx.Response(
+            200,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request(method, url),
+        )
+
+
+class PCOHttpCache:
+    """Persistent SQLite cache of GET responses shared between runs.
+
+    Bodies are stored zlib-compressed together with their ``ETag`` and
+    ``Last-Modified`` headers. An entry younger than ``ttl`` is served as-is;
+    an older one is revalidated with a conditional request, and a
+    ``304 Not Modified`` answer reuses the stored body. Entries are
+    namespaced by a fingerprint of the credentials, so several organisations
+    can share one file.
+    """
+
+    def __init__(self, path: str | Path, ttl: float = 0.0):
+        """Initialize the HTTP cache.
+
+        Args:
+            path: SQLite database file
+            ttl: Seconds an entry is served without revalidation
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+        # Operations run in worker threads, so the one connection is guarded
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        with self._lock:
+            self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the table if it doesn't exist yet."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS http_cache_url ON http_cache (url)"
+            )
+        return self._connection
+
+    @staticmethod
+    def make_key(request_key: str, authorization: str | None) -> str:
+        """Namespace a request key by the credentials that made it."""
+        fingerprint = hashlib.sha256((authorization or "").encode()).hexdigest()
+        return f"{fingerprint[:16]}|{request_key}"
+
+    def get(self, key: str) -> PCOCachedResponse | None:
+        """Read an entry, fresh or not."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT headers, body, expires_at FROM http_cache WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+
+        headers, body, expires_at = row
+        return PCOCachedResponse(
+            content=zlib.decompress(body),
+            headers=json.loads(headers),
+            expires_at=expires_at,
+        )
+
+    def store(self, key: str, url: str, response: httpx.Response) -> bool:
+        """Persist a successful response if it can be served or revalidated.
+
+        Returns:
+            True if the response was stored
+        """
+        headers = {
+            name: response.headers[name]
+            for name in PERSISTED_HEADERS
+            if name in response.headers
+        }
+        revalidatable = "etag" in headers or "last-modified" in headers
+        if response.status_code != 200 or not (revalidatable or self.ttl > 0):
+            return False
+
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    json.dumps(headers),
+                    zlib.compress(response.content),
+                    time.time() + self.ttl,
+                ),
+            )
+        return True
+
+    def refresh(self, key: str) -> None:
+        """Restart an entry's TTL after a successful revalidation."""
+        with self._lock:
+            self._connect().execute(
+                "UPDATE http_cache SET expires_at = ? WHERE key = ?",
+                (time.time() + self.ttl, key),
+            )
+
+    def invalidate(self, prefix: str) -> int:
+        """Remove every entry for a URL and anything beneath it.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            cursor = self._connect().execute(
+                "DELETE FROM http_cache WHERE url = :prefix "
+                "OR substr(url, 1, length(:prefix) + 1) "
+                "IN (:prefix || '/', :prefix || '?')",
+                {"prefix": prefix},
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._connect().execute("DELETE FROM http_cache")
+
+    def close(self) -> None:
+        """Close the connection to the cache database; it reopens on use."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def _is_under(key: str, prefix: str) -> bool:
+    """Check whether a cache key is ``prefix`` or a path/query beneath it."""
+    return key.startswith(prefix) and key[len(prefix) : len(prefix) + 1] in (
+        "",
+        "/",
+        "?",
+    )
@@ -0,0 +1,130 @@
+"""Circuit breakers for Planning Center products."""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from .exceptions import PCOCircuitOpenError
+
+
+class PCOCircuitState(Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"  # requests flow normally
+    OPEN = "open"  # requests fail fast until the recovery timeout passes
+    HALF_OPEN = "half_open"  # a few trial requests decide whether to close
+
+
+@dataclass
+class PCOCircuitEvent:
+    """A circuit breaker changing state."""
+
+    key: str
+    previous: PCOCircuitState
+    state: PCOCircuitState
+    failures: int
+
+
+class PCOCircuitBreaker:
+    """Circuit breaker for the requests to one product, e.g. ``giving/v2``.
+
+    After ``failure_threshold`` consecutive failures (network errors and 5xx
+    responses) the circuit opens and requests fail at once with
+    ``PCOCircuitOpenError`` instead of waiting on a product that is down.
+    Once ``recovery_timeout`` seconds have passed it lets up to
+    ``half_open_calls`` trial requests through: a success closes it again,
+    a failure reopens it for another timeout.
+    """
+
+    _clock: Callable[[], float] = staticmethod(time.monotonic)
+
+    def __init__(
+        self,
+        key: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_calls: int = 1,
+        listener: Callable[[PCOCircuitEvent], Any] | None = None,
+    ):
+        """Initialize the circuit breaker.
+
+        Args:
+            key: Name of what the breaker protects, used in errors and events
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open
+            half_open_calls: Trial requests allowed at once when half-open
+            listener: Called with a ``PCOCircuitEvent`` on every state change
+        """
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_calls = half_open_calls
+        self.listener = listener
+
+        self.failures = 0
+        self._state = PCOCircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+
+    @property
+    def state(self) -> PCOCircuitState:
+        """Current state, moving from open to half-open once it's time."""
+        if (
+            self._state is PCOCircuitState.OPEN
+            and self._clock() - self._opened_at >= self.recovery_timeout
+        ):
+            self._transition(PCOCircuitState.HALF_OPEN)
+        return self._state
+
+    def before_request(self) -> None:
+        """Admit a request, or raise ``PCOCircuitOpenError`` to fail fast."""
+        state = self.state
+        if state is PCOCircuitState.CLOSED:
+            return
+        if state is PCOCircuitState.HALF_OPEN and self._trials < self.half_open_calls:
+            self._trials += 1
+            return
+
+        retry_after = max(self._opened_at + self.recovery_timeout - self._clock(), 0)
+        raise PCOCircuitOpenError(
+            f"Circuit for {self.key} is {state.value} after "
+            f"{self.failures} consecutive failures",
+            key=self.key,
+            retry_after=retry_after,
+        )
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy product."""
+        self.failures = 0
+        self._release()
+        if self._state is not PCOCircuitState.CLOSED:
+            self._transition(PCOCircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Record a request that failed because the product is unhealthy."""
+        self.failures += 1
+        self._release()
+        if self._state is PCOCircuitState.HALF_OPEN or (
+            self._state is PCOCircuitState.CLOSED
+            and self.failures >= self.failure_threshold
+        ):
+            self._opened_at = self._clock()
+            self._transition(PCOCircuitState.OPEN)
+
+    def record_abandoned(self) -> None:
+        """Record a request that ended without an outcome, e.g. cancelled."""
+        self._release()
+
+    def _release(self) -> None:
+        """Free the trial slot held by a finished request."""
+        if self._state is PCOCircuitState.HALF_OPEN and self._trials:
+            self._trials -= 1
+
+    def _transition(self, state: PCOCircuitState) -> None:
+        """Change state and tell the listener."""
+        previous, self._state = self._state, state
+        self._trials = 0
+        if self.listener is not None:
+            self.listener(PCOCircuitEvent(self.key, previous, state, self.failures))
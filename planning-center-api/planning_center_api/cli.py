@@ -3,6 +3,8 @@
 import asyncio
 import json
 import sys
+import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +14,9 @@ from click import Context
 from .client import PCOClient
 from .config import PCOConfig, PCOProduct
 from .exceptions import PCOError
+from .mirror import PCOMirror
+from .sync import PCOSyncEngine
+from .utils import PCODataExporter
 
 
 @click.group()
@@ -35,6 +40,18 @@ from .exceptions import PCOError
     type=click.Path(exists=True, path_type=Path),
     help="Configuration file path",
 )
+@click.option(
+    "--http-cache",
+    envvar="PCO_HTTP_CACHE",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="SQLite file for caching GET responses between runs",
+)
+@click.option(
+    "--mirror",
+    envvar="PCO_MIRROR",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="SQLite mirror kept current by 'sync' and used for people lookups",
+)
 @click.pass_context
 def cli(
     ctx: Context,
@@ -42,6 +59,8 @@ def cli(
     secret: str | None,
     access_token: str | None,
     config_file: Path | None,
+    http_cache: Path | None,
+    mirror: Path | None,
 ):
     """Planning Center API CLI tool."""
     # Load configuration
@@ -58,8 +77,12 @@ def cli(
         if access_token:
             config.access_token = access_token
 
+    if http_cache:
+        config.http_cache_path = str(http_cache)
+
     ctx.ensure_object(dict)
     ctx.obj["config"] = config
+    ctx.obj["mirror"] = mirror
 
 
 @cli.command()
@@ -327,7 +350,7 @@ def search_people(
 
         include_list = include.split(",") if include else None
 
-        async with PCOClient(config=config) as client:
+        async with PCOClient(config=config, mirror=_open_mirror(ctx)) as client:
             try:
                 result = await client.search_people(
                     query=query,
@@ -367,7 +390,7 @@ def find_by_email(
 
         include_list = include.split(",") if include else None
 
-        async with PCOClient(config=config) as client:
+        async with PCOClient(config=config, mirror=_open_mirror(ctx)) as client:
             try:
                 result = await client.get_people_by_email(
                     email=email,
@@ -388,6 +411,195 @@ def find_by_email(
     asyncio.run(_find())
 
 
+@cli.command()
+@click.option(
+    "--product", type=click.Choice([p.value for p in PCOProduct]), required=True
+)
+@click.option("--resource", required=True, help="Resource type")
+@click.option("--per-page", type=int, default=100, help="Number of items per page")
+@click.option("--include", help="Comma-separated list of related resources to include")
+@click.option(
+    "--overlap",
+    type=float,
+    default=300.0,
+    help="Seconds before the last sync to fetch again",
+)
+@click.option("--full", is_flag=True, help="Forget the watermark and pull everything")
+@click.pass_context
+def sync(
+    ctx: Context,
+    product: str,
+    resource: str,
+    per_page: int,
+    include: str | None,
+    overlap: float,
+    full: bool,
+):
+    """Bring the local mirror up to date with a resource type."""
+    mirror = _open_mirror(ctx)
+    if mirror is None:
+        raise click.UsageError("Set --mirror or PCO_MIRROR to the mirror file.")
+
+    async def _sync():
+        config = ctx.obj["config"]
+        product_enum = PCOProduct(product)
+
+        include_list = include.split(",") if include else None
+
+        async with PCOClient(config=config) as client:
+            engine = PCOSyncEngine(client, mirror.path, overlap=overlap)
+            if full:
+                engine.store.reset(product_enum, resource)
+            try:
+                result = await engine.sync(
+                    product_enum,
+                    resource,
+                    mirror.sink(),
+                    per_page=per_page,
+                    include=include_list,
+                    result_mode="raw",
+                )
+            except PCOError as e:
+                click.echo(f"Error: {e.message}", err=True)
+                sys.exit(1)
+
+            resumed = " (resumed)" if result.resumed else ""
+            click.echo(
+                f"Synced {result.upserts} {resource}{resumed}, "
+                f"up to {result.watermark or 'nothing yet'}"
+            )
+
+    asyncio.run(_sync())
+
+
+@cli.command()
+@click.option(
+    "--product", type=click.Choice([p.value for p in PCOProduct]), required=True
+)
+@click.option(
+    "--resource",
+    "resources",
+    multiple=True,
+    required=True,
+    help="Resource type; repeat to export several concurrently",
+)
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path("."),
+    help="Directory for the <resource>.<format> files",
+)
+@click.option(
+    "--format", "export_format", type=click.Choice(["ndjson", "csv"]), default="ndjson"
+)
+@click.option("--per-page", type=int, default=100, help="Number of items per page")
+@click.option("--include", help="Comma-separated list of related resources to include")
+@click.option("--filter", help="Filter parameters as JSON")
+@click.option("--restart", is_flag=True, help="Ignore checkpoints and start over")
+@click.pass_context
+def export(
+    ctx: Context,
+    product: str,
+    resources: tuple[str, ...],
+    output_dir: Path,
+    export_format: str,
+    per_page: int,
+    include: str | None,
+    filter: str | None,
+    restart: bool,
+):
+    """Export resources to files, resuming interrupted exports."""
+
+    async def _export():
+        config = ctx.obj["config"]
+        product_enum = PCOProduct(product)
+
+        include_list = include.split(",") if include else None
+        filter_params = json.loads(filter) if filter else None
+        paths = {r: output_dir / f"{r}.{export_format}" for r in resources}
+
+        async with PCOClient(config=config) as client:
+            exporter = PCODataExporter(client)
+
+            async def run(resource: str) -> int:
+                path = paths[resource]
+                if restart:
+                    path.with_name(f"{path.name}.checkpoint").unlink(missing_ok=True)
+                return await exporter.export_resumable(
+                    product_enum,
+                    resource,
+                    path,
+                    format=export_format,
+                    filter_params=filter_params,
+                    include=include_list,
+                    per_page=per_page,
+                    progress=_progress_reporter(resource),
+                )
+
+            results = await asyncio.gather(
+                *(run(resource) for resource in resources), return_exceptions=True
+            )
+
+        failed = False
+        for resource, result in zip(resources, results, strict=True):
+            if isinstance(result, BaseException):
+                message = result.message if isinstance(result, PCOError) else result
+                click.echo(
+                    f"Error exporting {resource}: {message} (run again to resume)",
+                    err=True,
+                )
+                failed = True
+            else:
+                click.echo(f"Exported {result} {resource} to {paths[resource]}")
+        if failed:
+            sys.exit(1)
+
+    asyncio.run(_export())
+
+
+def _progress_reporter(label: str) -> Callable[[int, int | None], None]:
+    """Build a progress callback that prints rows written and an ETA."""
+    started = time.monotonic()
+    first: int | None = None
+
+    def report(rows: int, total: int | None) -> None:
+        nonlocal first
+        if first is None:
+            first = rows
+            if rows:
+                click.echo(f"{label}: resuming after {rows} rows", err=True)
+            return
+
+        line = f"{label}: {rows}/{total} rows" if total else f"{label}: {rows} rows"
+        if total:
+            line += f" ({min(rows * 100 // total, 100)}%"
+            elapsed = time.monotonic() - started
+            if rows > first and elapsed > 0:
+                rate = (rows - first) / elapsed
+                line += f", ETA {_format_duration(max(total - rows, 0) / rate)}"
+            line += ")"
+        click.echo(line, err=True)
+
+    return report
+
+
+def _format_duration(seconds: float) -> str:
+    """Format seconds as e.g. ``1h02m03s``, ``2m05s`` or ``45s``."""
+    minutes, seconds = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m{seconds:02d}s"
+    if minutes:
+        return f"{minutes}m{seconds:02d}s"
+    return f"{seconds}s"
+
+
+def _open_mirror(ctx: Context) -> PCOMirror | None:
+    """Open the mirror given with --mirror, if any."""
+    path = ctx.obj.get("mirror")
+    return PCOMirror(path) if path else None
+
+
 def _print_table(data: Any) -> None:
     """Print data in table format."""
     if hasattr(data, "data") and isinstance(data.data, list):
@@ -1,16 +1,45 @@
 """Main Planning Center API client."""
 
-from collections.abc import AsyncGenerator
+import asyncio
+import re
+from collections import deque
+from collections.abc import AsyncGenerator, Mapping
+from datetime import datetime, timedelta
+from itertools import islice, pairwise
 from typing import Any, TypeVar
 
 from dotenv import load_dotenv
 
+from .cache import PCOCacheStats
 from .config import API_ENDPOINTS, PCOConfig, PCOProduct
 from .http_client import PCOHttpClient
-from .models.base import PCOCollection, PCOResource
+from .loader import PCOBatchLoader
+from .mirror import PCOMirror
+from .models.base import PCOCollection, PCOResource, Resolver
+from .models.compact import PCOCompactResource
+from .models.identity import PCOIdentityMap
+from .models.raw import PCORawCollection, PCORawResource
+from .pagination import (
+    format_timestamp,
+    keyset_value,
+    parse_timestamp,
+    range_params,
+    truncate_timestamp,
+)
 
 T = TypeVar("T", bound=PCOResource)
 
+# Collection types a paginated GET can return, depending on the result mode
+PAGE_TYPES = (PCOCollection, PCORawCollection)
+
+# Count probes spent looking for each parallel_scan split point, and how far
+# from an even split (as a fraction of the range) is close enough
+SCAN_SPLIT_PROBES = 8
+SCAN_SPLIT_TOLERANCE = 0.1
+
+# Resource types whose collection isn't the plural of the type name
+IRREGULAR_RESOURCES = {"Person": "people"}
+
 
 class PCOClient:
     """Main client for Planning Center API operations."""
@@ -22,6 +51,7 @@ class PCOClient:
         access_token: str | None = None,
         webhook_secret: str | None = None,
         config: PCOConfig | None = None,
+        mirror: PCOMirror | None = None,
     ):
         """Initialize the Planning Center API client.
 
@@ -31,6 +61,8 @@ class PCOClient:
             access_token: OAuth access token
             webhook_secret: Webhook secret for signature verification
             config: Custom configuration object
+            mirror: Local mirror that answers people lookups by email, phone
+                or search instead of the API
         """
         if config:
             self.config = config
@@ -42,7 +74,11 @@ class PCOClient:
                 webhook_secret=webhook_secret,
             )
 
+        self.mirror = mirror
         self._http_client: PCOHttpClient | None = None
+        self._loader = PCOBatchLoader(
+            self._fetch_by_ids, max_batch_size=self.config.max_per_page
+        )
 
     @classmethod
     def from_env(cls) -> "PCOClient":
@@ -105,8 +141,15 @@ class PCOClient:
         include: list[str] | None = None,
         filter_params: dict[str, Any] | None = None,
         sort: str | None = None,
+        result_mode: str = "model",
         **kwargs: Any,
-    ) -> PCOResource | PCOCollection:
+    ) -> (
+        PCOResource
+        | PCOCollection
+        | PCORawResource
+        | PCORawCollection
+        | PCOCompactResource
+    ):
         """Get a resource or collection of resources.
 
         Args:
@@ -118,6 +161,9 @@ class PCOClient:
             include: Related resources to include
             filter_params: Filter parameters
             sort: Sort order
+            result_mode: "model" for validated Pydantic models, "raw" for
+                read-only views that skip validation, or "compact" for
+                slotted records suited to very large result sets
             **kwargs: Additional query parameters
 
         Returns:
@@ -136,6 +182,7 @@ class PCOClient:
             include=include,
             filter_params=filter_params,
             sort=sort,
+            result_mode=result_mode,
             **kwargs,
         )
 
@@ -145,6 +192,7 @@ class PCOClient:
         resource: str,
         data: dict[str, Any],
         include: list[str] | None = None,
+        idempotent: bool = False,
     ) -> PCOResource:
         """Create a new resource.
 
@@ -153,6 +201,8 @@ class PCOClient:
             resource: Resource type
             data: Resource data
             include: Related resources to include
+            idempotent: Whether creating twice is harmless, allowing the
+                request to be retried after server errors
 
         Returns:
             Created resource
@@ -166,6 +216,7 @@ class PCOClient:
             endpoint=endpoint,
             data=data,
             include=include,
+            idempotent=idempotent,
         )
 
     async def update(
@@ -175,6 +226,7 @@ class PCOClient:
         resource_id: str,
         data: dict[str, Any],
         include: list[str] | None = None,
+        idempotent: bool = False,
     ) -> PCOResource:
         """Update an existing resource.
 
@@ -184,6 +236,8 @@ class PCOClient:
             resource_id: Resource ID
             data: Updated resource data
             include: Related resources to include
+            idempotent: Whether applying the update twice is harmless,
+                allowing the request to be retried after server errors
 
         Returns:
             Updated resource
@@ -198,6 +252,7 @@ class PCOClient:
             resource_id=resource_id,
             data=data,
             include=include,
+            idempotent=idempotent,
         )
 
     async def delete(
@@ -226,6 +281,32 @@ class PCOClient:
             resource_id=resource_id,
         )
 
+    # Response cache helpers
+
+    async def invalidate_cache(self, product: PCOProduct, resource: str) -> int:
+        """Drop cached responses for a resource type.
+
+        Writes made through this client invalidate the cache automatically;
+        use this after changes made elsewhere (e.g. on a webhook).
+
+        Args:
+            product: Planning Center product
+            resource: Resource type
+
+        Returns:
+            Number of cache entries removed
+        """
+        client = self._ensure_client()
+        return await client.invalidate_cache(
+            self._get_product_base(product),
+            self._get_resource_endpoint(product, resource),
+        )
+
+    def get_cache_stats(self) -> PCOCacheStats | None:
+        """Get response cache counters, or None when caching is disabled."""
+        client = self._ensure_client()
+        return client.cache.stats if client.cache else None
+
     # Pagination helpers
 
     async def paginate_all(
@@ -236,10 +317,25 @@ class PCOClient:
         include: list[str] | None = None,
         filter_params: dict[str, Any] | None = None,
         sort: str | None = None,
+        max_concurrent_pages: int | None = None,
+        result_mode: str = "model",
+        identity_map: PCOIdentityMap | None = None,
+        keyset: str | None = None,
         **kwargs: Any,
-    ) -> AsyncGenerator[PCOResource, None]:
+    ) -> AsyncGenerator[PCOResource | PCORawResource | PCOCompactResource, None]:
         """Paginate through all resources of a type.
 
+        When ``max_concurrent_pages`` is greater than one and the first page
+        reports ``meta.total_count``, the remaining offsets are fetched
+        concurrently within a sliding window. Items are still yielded in
+        order and at most that many pages are held in memory.
+
+        With ``keyset`` the collection is ordered by that key and each page
+        is requested with a range filter on the last key seen instead of a
+        growing offset, so every page costs the same and records inserted
+        during the scan don't shift the ones after them. Pages are fetched
+        one at a time in this mode.
+
         Args:
             product: Planning Center product
             resource: Resource type
@@ -247,40 +343,567 @@ class PCOClient:
             include: Related resources to include
             filter_params: Filter parameters
             sort: Sort order
+            max_concurrent_pages: Pages to fetch ahead concurrently
+                (defaults to ``config.max_concurrent_pages``)
+            result_mode: "model" for validated Pydantic models, "raw" for
+                read-only views that skip validation, or "compact" for
+                slotted records suited to very large result sets
+            identity_map: Map shared across pages so that each included
+                resource is held only once
+            keyset: Key to page by, ``"id"`` or an attribute such as
+                ``"updated_at"``; can't be combined with ``sort``
             **kwargs: Additional query parameters
 
         Yields:
             Individual resources
         """
-        offset = 0
+        if keyset is not None:
+            if sort is not None:
+                raise ValueError("Keyset pagination orders by its key; drop sort")
+            pages = self._iter_keyset_pages(
+                product=product,
+                resource=resource,
+                key=keyset,
+                per_page=per_page,
+                include=include,
+                filter_params=filter_params,
+                result_mode=result_mode,
+                **kwargs,
+            )
+        else:
+            pages = self._iter_pages(
+                product=product,
+                resource=resource,
+                per_page=per_page,
+                include=include,
+                filter_params=filter_params,
+                sort=sort,
+                max_concurrent_pages=max_concurrent_pages,
+                result_mode=result_mode,
+                **kwargs,
+            )
+
+        async for collection in pages:
+            if identity_map is not None:
+                identity_map.add_included(collection)
+            for item in collection.data:
+                yield item
+
+    async def _iter_pages(
+        self,
+        product: PCOProduct,
+        resource: str,
+        per_page: int | None = None,
+        max_concurrent_pages: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[PCOCollection | PCORawCollection, None]:
+        """Yield the pages of a collection in order, prefetching when possible."""
         per_page = per_page or self.config.default_per_page
+        window = max_concurrent_pages or self.config.max_concurrent_pages
+        # Never schedule more pages than the rate limiter would let through
+        window = max(1, min(window, self.config.rate_limit_requests))
 
+        async def fetch(page_offset: int) -> Any:
+            return await self.get(
+                product=product,
+                resource=resource,
+                per_page=per_page,
+                offset=page_offset,
+                **kwargs,
+            )
+
+        offset = 0
+        collection = await fetch(offset)
+        if not isinstance(collection, PAGE_TYPES) or not collection.data:
+            return
+        yield collection
+
+        total_count = collection.meta.total_count if collection.meta else None
+        if window > 1 and total_count is not None:
+            offsets = iter(range(per_page, total_count, per_page))
+            pending: deque[asyncio.Task[Any]] = deque(
+                asyncio.create_task(fetch(page_offset))
+                for page_offset in islice(offsets, window)
+            )
+            try:
+                while pending:
+                    page = await pending.popleft()
+                    for page_offset in islice(offsets, 1):
+                        pending.append(asyncio.create_task(fetch(page_offset)))
+
+                    if not isinstance(page, PAGE_TYPES) or not page.data:
+                        return
+                    offset += per_page
+                    collection = page
+                    yield collection
+            finally:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        # Follow the remaining pages one at a time (e.g. records added mid-scan)
+        while collection.links and collection.links.has_next_page():
+            offset += per_page
+            page = await fetch(offset)
+            if not isinstance(page, PAGE_TYPES) or not page.data:
+                return
+            collection = page
+            yield collection
+
+    async def _iter_keyset_pages(
+        self,
+        product: PCOProduct,
+        resource: str,
+        key: str,
+        per_page: int | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[PCOCollection | PCORawCollection, None]:
+        """Yield the pages of a collection ordered by ``key``, seeking by key.
+
+        IDs are unique, so each page asks for IDs greater than the last one.
+        Other keys can repeat, so pages ask for values from the last one on
+        and drop the resources at that value that were already yielded. When
+        no key can be used to move forward (a full page sharing one value, or
+        a resource without the key) the same query is followed by offset for
+        as long as ``links.next`` is present.
+        """
+        per_page = min(
+            per_page or self.config.default_per_page, self.config.max_per_page
+        )
+        operator = "gt" if key == "id" else "gte"
+
+        last: Any = None
+        seen_at_last: set[str] = set()
+        offset = 0
         while True:
-            collection = await self.get(
+            query = dict(kwargs)
+            if last is not None:
+                query[f"where[{key}][{operator}]"] = last
+            page = await self.get(
                 product=product,
                 resource=resource,
                 per_page=per_page,
-                offset=offset,
-                include=include,
+                offset=offset or None,
+                sort=key,
+                **query,
+            )
+            if not isinstance(page, PAGE_TYPES) or not page.data:
+                return
+
+            page_size = len(page.data)
+            fresh = [item for item in page.data if item.id not in seen_at_last]
+            if len(fresh) < page_size:
+                page.data[:] = fresh
+
+            advanced = True
+            next_key = keyset_value(page.data[-1], key) if page.data else None
+            if next_key is not None and next_key != last:
+                last = next_key
+                offset = 0
+                seen_at_last = (
+                    set()
+                    if key == "id"
+                    else {
+                        item.id
+                        for item in page.data
+                        if keyset_value(item, key) == next_key
+                    }
+                )
+            elif page.links and page.links.has_next_page():
+                offset += page_size
+                seen_at_last.update(item.id for item in page.data)
+            else:
+                advanced = False
+
+            if page.data:
+                yield page
+            if not advanced or page_size < per_page:
+                return
+
+    async def count(
+        self,
+        product: PCOProduct,
+        resource: str,
+        filter_params: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> int | None:
+        """Count the resources of a type without fetching them.
+
+        Requests a single-item page and reads its ``meta.total_count``.
+
+        Args:
+            product: Planning Center product
+            resource: Resource type
+            filter_params: Filter parameters
+            **kwargs: Additional query parameters
+
+        Returns:
+            Number of matching resources, or None if the API doesn't report it
+        """
+        page = await self.get(
+            product=product,
+            resource=resource,
+            per_page=1,
+            filter_params=filter_params,
+            result_mode="raw",
+            **kwargs,
+        )
+        meta = getattr(page, "meta", None)
+        return meta.total_count if meta else None
+
+    # Parallel scans
+
+    async def parallel_scan(
+        self,
+        product: PCOProduct,
+        resource: str,
+        field: str = "created_at",
+        partitions: int = 8,
+        per_page: int | None = None,
+        include: list[str] | None = None,
+        filter_params: dict[str, Any] | None = None,
+        result_mode: str = "model",
+        **kwargs: Any,
+    ) -> AsyncGenerator[PCOResource | PCORawResource | PCOCompactResource, None]:
+        """Scan a whole collection as several time ranges at once.
+
+        The range between the oldest and newest ``field`` value is split into
+        up to ``partitions`` ranges, each holding about the same number of
+        resources according to ``meta.total_count`` probes. Every range is
+        then paginated concurrently, all through the client's rate limiter.
+
+        Resources are yielded as their pages arrive, so they are ordered by
+        ``field`` within a range but not across ranges. Resources whose
+        ``field`` moves past the newest value after the scan starts are not
+        included.
+
+        Args:
+            product: Planning Center product
+            resource: Resource type
+            field: Timestamp attribute to partition on, e.g. ``"updated_at"``
+            partitions: Maximum number of ranges scanned concurrently
+            per_page: Number of items per page
+            include: Related resources to include
+            filter_params: Filter parameters
+            result_mode: "model", "raw" or "compact", as for ``paginate_all``
+            **kwargs: Additional query parameters
+
+        Yields:
+            Individual resources
+        """
+        per_page = min(
+            per_page or self.config.default_per_page, self.config.max_per_page
+        )
+        partitions = max(1, min(partitions, self.config.rate_limit_requests))
+        ranges = await self._plan_scan(
+            product, resource, field, partitions, per_page, filter_params, **kwargs
+        )
+        if not ranges:
+            return
+
+        # Pages travel through an unbounded queue, with the semaphore keeping
+        # at most one buffered page per range
+        queue: asyncio.Queue[Any] = asyncio.Queue()
+        slots = asyncio.Semaphore(len(ranges))
+
+        async def scan(start: str, end: str) -> None:
+            try:
+                async for page in self._iter_pages(
+                    product=product,
+                    resource=resource,
+                    per_page=per_page,
+                    max_concurrent_pages=1,
+                    include=include,
+                    filter_params=filter_params,
+                    sort=field,
+                    result_mode=result_mode,
+                    **range_params(field, start, end),
+                    **kwargs,
+                ):
+                    await slots.acquire()
+                    queue.put_nowait(page)
+            except Exception as e:
+                queue.put_nowait(e)
+            finally:
+                queue.put_nowait(None)
+
+        tasks = [asyncio.create_task(scan(start, end)) for start, end in ranges]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                page = await queue.get()
+                if page is None:
+                    remaining -= 1
+                    continue
+                if isinstance(page, Exception):
+                    raise page
+                slots.release()
+                for item in page.data:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _plan_scan(
+        self,
+        product: PCOProduct,
+        resource: str,
+        field: str,
+        partitions: int,
+        per_page: int,
+        filter_params: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> list[tuple[str, str]]:
+        """Split a collection into ``field`` ranges of similar size.
+
+        The range holding the most resources is split in two until there are
+        ``partitions`` ranges. Each split point is found by bisecting the
+        range with count probes until both sides hold about as many
+        resources. Without ``meta.total_count`` the time span is split evenly
+        instead.
+
+        Returns:
+            ``(start, end)`` timestamps of the non-empty ranges, end exclusive
+        """
+
+        async def probe(sort: str, **query: Any) -> Any:
+            return await self.get(
+                product=product,
+                resource=resource,
+                per_page=1,
                 filter_params=filter_params,
                 sort=sort,
+                result_mode="raw",
+                **query,
                 **kwargs,
             )
 
-            if not isinstance(collection, PCOCollection):
+        oldest = await probe(field)
+        if not isinstance(oldest, PAGE_TYPES) or not oldest.data:
+            return []
+        newest = await probe(f"-{field}")
+        # Whole seconds, so that split points format without loss
+        start = truncate_timestamp(parse_timestamp(keyset_value(oldest.data[0], field)))
+        end = truncate_timestamp(
+            parse_timestamp(keyset_value(newest.data[0], field))
+        ) + timedelta(seconds=1)
+
+        total = oldest.meta.total_count if oldest.meta else None
+        if total is None:
+            step = (end - start) / partitions
+            bounds = {truncate_timestamp(start + step * i) for i in range(partitions)}
+            return [
+                (format_timestamp(a), format_timestamp(b))
+                for a, b in pairwise([*sorted(bounds), end])
+            ]
+
+        async def count(a: datetime, b: datetime) -> int | None:
+            page = await probe(field, **range_params(field, a, b))
+            return page.meta.total_count if page.meta else None
+
+        # [count, start, end, splittable] of each range, in time order
+        parts: list[list[Any]] = [[total, start, end, True]]
+        while len(parts) < partitions:
+            candidates = [
+                i
+                for i, (size, a, b, splittable) in enumerate(parts)
+                if splittable and size > per_page and b - a > timedelta(seconds=1)
+            ]
+            if not candidates:
                 break
+            i = max(candidates, key=lambda i: parts[i][0])
+            size, a, b, _ = parts[i]
+
+            # Bisect for the point that leaves about half the resources on
+            # each side
+            target = size / 2
+            best: tuple[datetime, int] | None = None
+            low, high = a, b
+            for _ in range(SCAN_SPLIT_PROBES):
+                middle = truncate_timestamp(low + (high - low) / 2)
+                if middle <= low:
+                    break
+                left = await count(a, middle)
+                if left is None:
+                    break
+                if best is None or abs(left - target) < abs(best[1] - target):
+                    best = (middle, left)
+                if abs(left - target) <= size * SCAN_SPLIT_TOLERANCE:
+                    break
+                if left < target:
+                    low = middle
+                else:
+                    high = middle
+
+            if best is None or best[1] in (0, size):
+                parts[i][3] = False
+                continue
+            middle, left = best
+            parts[i : i + 1] = [[left, a, middle, True], [size - left, middle, b, True]]
+
+        return [
+            (format_timestamp(a), format_timestamp(b))
+            for size, a, b, _ in parts
+            if size > 0
+        ]
+
+    # Relationship helpers
+
+    async def fetch_related(
+        self,
+        product: PCOProduct,
+        resources: list[Any],
+        relationship_name: str,
+        resource: str | None = None,
+        follow_links: bool = False,
+    ) -> list[Any]:
+        """Resolve a relationship for several resources, fetching what's missing.
+
+        Related resources are first resolved from the included resources, as
+        ``related`` does. Those that weren't included are fetched with one
+        ``where[id]`` collection request per related type and page of IDs,
+        rather than one request each. Afterwards ``related`` on each resource
+        resolves the fetched resources too.
+
+        A relationship sent without data has no IDs to batch on. With
+        ``follow_links`` its ``links.related`` URL is fetched instead, which
+        costs one request per such resource; otherwise it resolves as
+        ``related`` does.
 
-            if not collection.data:
-                break
+        Args:
+            product: Planning Center product of the related resources
+            resources: Resources whose relationship to resolve
+            relationship_name: Relationship name, e.g. ``"emails"``
+            resource: Resource type to fetch missing resources from (defaults
+                to the plural of the related type, e.g. ``"phone_numbers"``)
+            follow_links: Fetch relationships without data from their
+                ``links.related`` URL
 
-            for item in collection.data:
-                yield item
+        Returns:
+            The resolved relationship of each resource, as ``related`` returns
+        """
+        missing: dict[str, set[str]] = {}
+        links: dict[int, tuple[str, str]] = {}
+        for position, item in enumerate(resources):
+            linkage = item.get_relationship_data(relationship_name)
+            if linkage is None:
+                if follow_links:
+                    link = self._link_endpoint(_related_link(item, relationship_name))
+                    if link is not None:
+                        links[position] = link
+                continue
+            identifiers = linkage if isinstance(linkage, list) else [linkage]
+            for identifier in identifiers:
+                if identifier is None:
+                    continue
+                resolver = item.resolver
+                if (
+                    resolver is None
+                    or resolver(identifier["type"], identifier["id"]) is None
+                ):
+                    missing.setdefault(identifier["type"], set()).add(identifier["id"])
+
+        fetched: dict[tuple[str, str], Any] = {}
+        for resource_type, ids in missing.items():
+            for related in await self.get_many(
+                product, resource or _resource_for_type(resource_type), sorted(ids)
+            ):
+                if related is not None:
+                    fetched[(related.type, related.id)] = related
+
+        if fetched:
+            for item in resources:
+                item.bind_resolver(_chain_resolver(item.resolver, fetched))
+        results = [item.related(relationship_name) for item in resources]
+
+        linked = await asyncio.gather(
+            *(self._get_link(*link) for link in links.values())
+        )
+        for position, related in zip(links, linked, strict=True):
+            results[position] = related
+        return results
+
+    def _link_endpoint(self, url: str | None) -> tuple[str, str] | None:
+        """Split an API URL into its product base and endpoint, if it has them."""
+        prefix = f"{self.config.base_url}/"
+        if not url or not url.startswith(prefix):
+            return None
+        parts = url[len(prefix) :].split("?")[0].strip("/").split("/")
+        if len(parts) < 3 or parts[1] != self.config.api_version:
+            return None
+        return parts[0], "/".join(parts[2:])
+
+    async def _get_link(self, product_base: str, endpoint: str) -> Any:
+        """Get the resource behind a link, or every resource following its pages."""
+        client = self._ensure_client()
+        per_page = self.config.max_per_page
+        resources: list[Any] = []
+        offset = 0
+        while True:
+            page = await client.get(
+                product=product_base,
+                endpoint=endpoint,
+                per_page=per_page,
+                offset=offset or None,
+            )
+            if not isinstance(page, PAGE_TYPES):
+                return page
+            resources.extend(page.data)
+            if not (page.links and page.links.has_next_page()) or not page.data:
+                return resources
+            offset += len(page.data)
 
-            # Check if there are more pages
-            if collection.links and collection.links.has_next_page():
-                offset += per_page
-            else:
-                break
+    # Batched loading by ID
+
+    async def load(
+        self, product: PCOProduct, resource: str, resource_id: str
+    ) -> PCOResource:
+        """Get a resource by ID, batched with other loads.
+
+        Loads of the same resource type requested by any coroutine within one
+        event loop tick are sent together as ``where[id]`` collection
+        requests, so many concurrent lookups cost a few page-sized calls.
+
+        Args:
+            product: Planning Center product
+            resource: Resource type
+            resource_id: Resource ID
+
+        Returns:
+            The resource
+
+        Raises:
+            PCONotFoundError: If no resource has that ID
+        """
+        return await self._loader.load(product, resource, resource_id)
+
+    async def get_many(
+        self, product: PCOProduct, resource: str, ids: list[str]
+    ) -> list[PCOResource | None]:
+        """Get several resources by ID with as few requests as possible.
+
+        Args:
+            product: Planning Center product
+            resource: Resource type
+            ids: Resource IDs
+
+        Returns:
+            The resource for each ID, or None where it doesn't exist
+        """
+        return await self._loader.load_many(product, resource, ids)
+
+    async def _fetch_by_ids(
+        self, product: PCOProduct, resource: str, ids: list[str]
+    ) -> list[Any]:
+        """Fetch resources by ID with a single ``where[id]`` request."""
+        page = await self.get(
+            product=product,
+            resource=resource,
+            per_page=len(ids),
+            filter_params={"id": ids},
+        )
+        return list(page.data) if isinstance(page, PAGE_TYPES) else []
 
     # People-specific convenience methods
 
@@ -450,7 +1073,9 @@ class PCOClient:
         per_page: int | None = None,
         include: list[str] | None = None,
     ) -> PCOCollection:
-        """Search for people by name or email."""
+        """Search for people by name or email, locally when a mirror is set."""
+        if self.mirror is not None:
+            return await asyncio.to_thread(self.mirror.search_people, query)
         return await self.get_people(
             per_page=per_page,
             include=include,
@@ -462,7 +1087,9 @@ class PCOClient:
         email: str,
         include: list[str] | None = None,
     ) -> PCOCollection:
-        """Get people by email address."""
+        """Get people by email address, locally when a mirror is set."""
+        if self.mirror is not None:
+            return await asyncio.to_thread(self.mirror.get_people_by_email, email)
         return await self.get_people(
             include=include,
             filter_params={"email": email},
@@ -473,7 +1100,9 @@ class PCOClient:
         phone: str,
         include: list[str] | None = None,
     ) -> PCOCollection:
-        """Get people by phone number."""
+        """Get people by phone number, locally when a mirror is set."""
+        if self.mirror is not None:
+            return await asyncio.to_thread(self.mirror.get_people_by_phone, phone)
         return await self.get_people(
             include=include,
             filter_params={"phone": phone},
@@ -1111,3 +1740,52 @@ class PCOClient:
             include=include,
             **kwargs,
         )
+
+
+def _resource_for_type(resource_type: str) -> str:
+    """Guess the resource path for a JSON API type, e.g. ``PhoneNumber``."""
+    if resource_type in IRREGULAR_RESOURCES:
+        return IRREGULAR_RESOURCES[resource_type]
+    name = re.sub(r"(?<!^)(?=[A-Z])", "_", resource_type).lower()
+    if name.endswith(("s", "x", "ch", "sh")):
+        return f"{name}es"
+    if name.endswith("y") and name[-2:-1] not in ("a", "e", "i", "o", "u"):
+        return f"{name[:-1]}ies"
+    return f"{name}s"
+
+
+def _related_link(item: Any, relationship_name: str) -> str | None:
+    """Get the ``links.related`` URL of a resource's relationship, if sent."""
+    relationships = item.relationships
+    if not relationships:
+        return None
+    if isinstance(relationships, Mapping):
+        relationship = relationships.get(relationship_name)
+    else:
+        relationship = getattr(relationships, relationship_name, None)
+    # Relationships are stored as extra fields, which stay plain dicts
+    if isinstance(relationship, Mapping):
+        links = relationship.get("links") or {}
+        related = links.get("related") if isinstance(links, Mapping) else None
+    else:
+        related = (
+            relationship.links.related if relationship and relationship.links else None
+        )
+    # JSON:API allows a link to be a URL or an object with an href
+    if isinstance(related, Mapping):
+        return related.get("href")
+    return getattr(related, "href", related)
+
+
+def _chain_resolver(
+    resolver: Resolver | None, fetched: dict[tuple[str, str], Any]
+) -> Resolver:
+    """Resolve through ``resolver`` first and then the fetched resources."""
+
+    def resolve(resource_type: str, resource_id: str) -> Any:
+        resolved = resolver(resource_type, resource_id) if resolver else None
+        if resolved is None:
+            resolved = fetched.get((resource_type, resource_id))
+        return resolved
+
+    return resolve
@@ -1,7 +1,13 @@
 """Configuration and constants for Planning Center API."""
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .circuit_breaker import PCOCircuitEvent
+    from .retry import PCORetryPolicy
 
 
 class PCOProduct(Enum):
@@ -39,14 +45,45 @@ class PCOConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
     backoff_factor: float = 2.0
+    retry_policy: "PCORetryPolicy | None" = None  # overrides the three above
+    coalesce_requests: bool = True  # share one response between identical GETs
+    json_backend: str = "pydantic"  # "pydantic", "orjson" or "json"
+
+    # Circuit Breaker (one per product)
+    circuit_breaker_enabled: bool = True
+    circuit_failure_threshold: int = 5  # consecutive failures that open it
+    circuit_recovery_timeout: float = 30.0  # seconds before a trial request
+    circuit_half_open_calls: int = 1  # trial requests allowed at once
+    circuit_listener: "Callable[[PCOCircuitEvent], Any] | None" = None
+
+    # Connection Pool
+    max_connections: int | None = 100  # None for no limit
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0  # seconds an idle connection is kept
+    pool_timeout: float | None = None  # free connection wait, None for timeout
+    http2: bool = False  # multiplex requests over one connection (needs h2)
+    prewarm_connections: int = 0  # connections opened on entering the client
+    transport: Any = None  # httpx.AsyncBaseTransport replacing the default
 
     # Rate Limiting
     rate_limit_requests: int = 100
     rate_limit_window: int = 60  # seconds
+    adaptive_rate_limit: bool = True  # follow X-PCO-API-Request-Rate-* headers
+    rate_limit_backend: str = "memory"  # "memory" or "sqlite" (shared per host)
+    rate_limit_path: str | None = None  # SQLite file for the shared backend
+
+    # Response Caching
+    cache_enabled: bool = False
+    cache_max_bytes: int = 32 * 1024 * 1024
+    cache_default_ttl: float = 60.0  # seconds, 0 disables caching by default
+    cache_ttls: dict[str, float] = field(default_factory=dict)  # per endpoint
+    http_cache_path: str | None = None  # SQLite file for the persistent cache
+    http_cache_ttl: float = 0.0  # seconds served before revalidating
 
     # Pagination
     default_per_page: int = 25
     max_per_page: int = 100
+    max_concurrent_pages: int = 1  # pages fetched ahead by paginate_all
 
     def get_auth_headers(self) -> dict[str, str]:
         """Get authentication headers for API requests."""
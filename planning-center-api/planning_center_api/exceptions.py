@@ -76,6 +76,21 @@ class PCOServerError(PCOError):
         super().__init__(message, status_code=500, **kwargs)
 
 
+class PCOCircuitOpenError(PCOError):
+    """Raised without sending a request while a product's circuit is open."""
+
+    def __init__(
+        self,
+        message: str = "Circuit open",
+        key: str | None = None,
+        retry_after: float | None = None,
+        **kwargs,
+    ):
+        super().__init__(message, **kwargs)
+        self.key = key
+        self.retry_after = retry_after
+
+
 class PCOWebhookError(PCOError):
     """Raised when webhook processing fails."""
 
@@ -0,0 +1,517 @@
+"""Streaming export writers for Planning Center resources."""
+
+import asyncio
+import csv
+import io
+import json
+import os
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from .serialization import dumps
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+# Receives each chunk of encoded (and possibly compressed) output
+ExportSink = Callable[[bytes], Awaitable[Any]]
+
+
+@dataclass
+class PCOExportCheckpoint:
+    """Where an interrupted export stopped, saved after every page."""
+
+    product: str
+    resource: str
+    format: str
+    cursor: str | None = None  # ID of the last resource written
+    position: int = 0  # file size up to and including that resource
+    rows: int = 0
+    fields: list[str] | None = None  # CSV columns, kept for the header
+
+    @classmethod
+    def load(cls, path: str | Path) -> "PCOExportCheckpoint | None":
+        """Read a checkpoint file, or None if there is none."""
+        try:
+            return cls(**json.loads(Path(path).read_text()))
+        except FileNotFoundError:
+            return None
+
+    def save(self, path: str | Path) -> None:
+        """Write the checkpoint file atomically, so a crash can't corrupt it."""
+        path = Path(path)
+        temporary = path.with_name(f"{path.name}.tmp")
+        temporary.write_text(json.dumps(asdict(self)))
+        os.replace(temporary, path)
+
+
+class PCOExportWriter(ABC):
+    """Base for writers that stream resources to a file or async sink.
+
+    Rows are encoded as they are written and collected in a buffer, which
+    is handed on whenever it reaches ``buffer_size`` bytes, so memory use
+    doesn't grow with the number of resources. Output can be gzip-compressed
+    on the fly. Subclasses implement ``_encode``.
+    """
+
+    def __init__(
+        self,
+        target: str | Path | ExportSink,
+        compress: bool | None = None,
+        buffer_size: int = 1024 * 1024,
+        json_backend: str = "pydantic",
+        offset: int = 0,
+    ):
+        """Initialize the writer.
+
+        Args:
+            target: Output file path, or coroutine function receiving chunks
+            compress: Gzip the output (defaults to whether the path ends in
+                ``.gz``; sinks are not compressed by default)
+            buffer_size: Bytes collected before they are written out
+            json_backend: JSON backend used to encode values
+            offset: Byte offset at which to continue an existing file; what
+                follows it is cut off
+        """
+        self.target = target
+        self.buffer_size = buffer_size
+        self.json_backend = json_backend
+        self.rows = 0
+        self.position = offset  # bytes handed on so far, including offset
+
+        if isinstance(target, str | Path):
+            self.path: Path | None = Path(target).expanduser()
+            self._sink: ExportSink | None = None
+            if compress is None:
+                compress = self.path.suffix == ".gz"
+        else:
+            self.path = None
+            self._sink = target
+
+        if offset and (compress or self.path is None):
+            raise ValueError("Only uncompressed files can be continued at an offset")
+
+        # wbits=31 produces a gzip stream rather than raw zlib
+        self._compressor = zlib.compressobj(wbits=31) if compress else None
+        self._buffer = bytearray()
+        self._file: BinaryIO | None = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def write(self, resource: Any) -> None:
+        """Encode a resource and buffer it, flushing when the buffer is full."""
+        self._buffer += self._encode(resource)
+        self.rows += 1
+        if len(self._buffer) >= self.buffer_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write out the buffered output, so ``position`` is on disk."""
+        if not self._buffer:
+            return
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        await self._emit(data)
+
+    async def close(self) -> None:
+        """Flush the remaining output and finish the file or sink stream."""
+        if self.rows == 0 and self.position == 0:
+            # An empty export still gets whatever precedes the rows
+            self._buffer += self._header()
+        await self.flush()
+        if self._compressor is not None:
+            await self._emit(self._compressor.flush())
+            self._compressor = None
+        if self._file is None and self.path is not None:
+            # Nothing new was written, but the file still has to be created or
+            # cut off
+            self._file = await asyncio.to_thread(self._open_file)
+        if self._file is not None:
+            await asyncio.to_thread(self._file.close)
+            self._file = None
+
+    async def _emit(self, data: bytes) -> None:
+        """Send a chunk to the sink or append it to the file."""
+        if not data:
+            return
+        if self._sink is not None:
+            await self._sink(data)
+        else:
+            if self._file is None:
+                self._file = await asyncio.to_thread(self._open_file)
+            await asyncio.to_thread(self._append, data)
+        self.position += len(data)
+
+    def _open_file(self) -> BinaryIO:
+        """Open the output file, cut off at the position writing continues."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.position == 0:
+            return open(self.path, "wb")
+        file = open(self.path, "r+b")
+        file.truncate(self.position)
+        file.seek(self.position)
+        return file
+
+    def _append(self, data: bytes) -> None:
+        """Write a chunk and flush it past Python's file buffer."""
+        self._file.write(data)
+        self._file.flush()
+
+    @abstractmethod
+    def _encode(self, resource: Any) -> Any:
+        """Encode one resource as a row of output, in the form ``write`` buffers."""
+
+    def _header(self) -> bytes:
+        """Encode what precedes the first row; nothing by default."""
+        return b""
+
+
+class PCONDJSONWriter(PCOExportWriter):
+    """Writes each resource as one JSON object per line."""
+
+    def _encode(self, resource: Any) -> bytes:
+        """Encode the resource's ``model_dump`` as a JSON line."""
+        return dumps(resource.model_dump(), self.json_backend) + b"\n"
+
+
+class PCOCSVWriter(PCOExportWriter):
+    """Writes resources as CSV rows of their ID, type and attributes.
+
+    The columns are ``fields`` or, by default, the attributes of the first
+    resource written; attributes outside them are left out. Nested values are
+    written as JSON.
+    """
+
+    def __init__(
+        self,
+        target: str | Path | ExportSink,
+        fields: list[str] | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize the CSV writer.
+
+        Args:
+            target: Output file path, or coroutine function receiving chunks
+            fields: Attribute columns, after ``id`` and ``type``
+            **kwargs: Options of ``PCOExportWriter``
+        """
+        super().__init__(target, **kwargs)
+        self.fields = fields
+        self._text = io.StringIO()
+        self._csv = csv.writer(self._text)
+
+    def _encode(self, resource: Any) -> bytes:
+        """Encode the resource as a CSV row, after the header if it's first."""
+        if self.fields is None:
+            self.fields = list(resource.attributes)
+        header = self._header() if self.rows == 0 else b""
+        return header + self._row(
+            [
+                resource.id,
+                resource.type,
+                *(self._cell(resource.get_attribute(f)) for f in self.fields),
+            ]
+        )
+
+    def _header(self) -> bytes:
+        """Encode the header row, once the columns are known."""
+        if self.fields is None:
+            return b""
+        return self._row(["id", "type", *self.fields])
+
+    def _row(self, values: list[Any]) -> bytes:
+        """Encode one CSV row."""
+        self._csv.writerow(values)
+        row = self._text.getvalue()
+        self._text.seek(0)
+        self._text.truncate()
+        return row.encode()
+
+    def _cell(self, value: Any) -> Any:
+        """Format an attribute value for a CSV cell."""
+        if value is None:
+            return ""
+        if isinstance(value, dict | list):
+            return dumps(value, self.json_backend).decode()
+        return value
+
+
+def check_arrow() -> None:
+    """Raise if pyarrow, needed for columnar exports, is not installed."""
+    if pa is None:
+        raise ImportError(
+            "Parquet and Arrow exports require pyarrow: "
+            "pip install 'planning-center-api[arrow]'"
+        )
+
+
+class PCOColumnarWriter(PCOExportWriter):
+    """Base for writers of columnar files with a column per attribute.
+
+    Rows hold the resource ``id`` and ``type`` followed by its attributes;
+    nested values are stored as JSON strings, and attributes named ``id`` or
+    ``type`` become ``attributes.id`` and ``attributes.type``. Rows are
+    buffered until ``row_group_size`` of them are collected and then written
+    as one row group, so memory stays bounded.
+
+    The schema is inferred from the first row group and widened when later
+    ones bring new attributes or wider types (integers to floats, anything
+    mixed to strings). Row groups written before a widening are kept in a
+    segment file beside the output and rewritten in the final schema when
+    the writer closes. Only file paths are supported as targets, and the
+    output is compressed by the file format itself rather than gzipped.
+    """
+
+    def __init__(
+        self,
+        target: str | Path,
+        row_group_size: int = 10_000,
+        compression: str | None = None,
+        **kwargs: Any,
+    ):
+        """Initialize the columnar writer.
+
+        Args:
+            target: Output file path
+            row_group_size: Rows buffered before a row group is written
+            compression: Codec used by the file format, e.g. ``"zstd"``
+            **kwargs: Options of ``PCOExportWriter``
+        """
+        check_arrow()
+        if not isinstance(target, str | Path):
+            raise TypeError(f"{type(self).__name__} can only write to a file path")
+        kwargs.pop("compress", None)
+        kwargs.pop("buffer_size", None)
+        super().__init__(target, **kwargs)
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.schema: Any = None
+
+        self._pending: list[dict[str, Any]] = []
+        self._segments: list[Path] = []
+        self._writer: Any = None
+
+    async def write(self, resource: Any) -> None:
+        """Buffer a resource's row, writing a row group when enough are held."""
+        self._pending.append(self._encode(resource))
+        self.rows += 1
+        if len(self._pending) >= self.row_group_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write the buffered rows as a row group."""
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        await asyncio.to_thread(self._write_rows, rows)
+
+    async def close(self) -> None:
+        """Write the remaining rows and assemble the output file."""
+        await self.flush()
+        await asyncio.to_thread(self._finish)
+
+    def _encode(self, resource: Any) -> dict[str, Any]:
+        """Flatten a resource into a row of columns."""
+        row = {"id": resource.id, "type": resource.type}
+        for key, value in resource.attributes.items():
+            if key in row:
+                key = f"attributes.{key}"
+            if isinstance(value, dict | list):
+                value = dumps(value, self.json_backend).decode()
+            row[key] = value
+        return row
+
+    def _write_rows(self, rows: list[dict[str, Any]]) -> None:
+        """Write rows as a row group, widening the schema if they need it."""
+        columns: dict[str, Any] = {}
+        for row in rows:
+            for key in row:
+                columns.setdefault(key, None)
+        arrays = {key: _to_array([row.get(key) for row in rows]) for key in columns}
+        batch_schema = pa.schema([(key, array.type) for key, array in arrays.items()])
+
+        schema = (
+            batch_schema
+            if self.schema is None
+            else _widen_schema(self.schema, batch_schema)
+        )
+        if self.schema is None or not schema.equals(self.schema):
+            self._close_segment()
+            self.schema = schema
+        if self._writer is None:
+            self._open_segment()
+
+        table = pa.Table.from_batches(
+            [_conform(pa.RecordBatch.from_pydict(arrays), self.schema)]
+        )
+        self._writer.write_table(table)
+
+    def _open_segment(self) -> None:
+        """Start a segment file with the current schema."""
+        path = self.path.with_name(f"{self.path.name}.part{len(self._segments)}")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._segments.append(path)
+        self._writer = self._open(path, self.schema)
+
+    def _close_segment(self) -> None:
+        """Finish the current segment file, if one is open."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _finish(self) -> None:
+        """Move a single segment into place, or merge several into the output."""
+        self._close_segment()
+        if not self._segments:
+            self.schema = self.schema or pa.schema([])
+            self._open(self.path, self.schema).close()
+            return
+        if len(self._segments) == 1:
+            self._segments.pop().replace(self.path)
+            return
+
+        writer = self._open(self.path, self.schema)
+        try:
+            for segment in self._segments:
+                for batch in self._read(segment):
+                    writer.write_table(
+                        pa.Table.from_batches([_conform(batch, self.schema)])
+                    )
+        finally:
+            writer.close()
+        for segment in self._segments:
+            segment.unlink()
+        self._segments.clear()
+
+    @abstractmethod
+    def _open(self, path: Path, schema: Any) -> Any:
+        """Open a file writer for ``schema``."""
+
+    @abstractmethod
+    def _read(self, path: Path) -> Iterator[Any]:
+        """Read a segment file back one record batch at a time."""
+
+
+class PCOParquetWriter(PCOColumnarWriter):
+    """Writes resources to a Parquet file, Snappy-compressed by default."""
+
+    def _open(self, path: Path, schema: Any) -> Any:
+        return pq.ParquetWriter(path, schema, compression=self.compression or "snappy")
+
+    def _read(self, path: Path) -> Iterator[Any]:
+        yield from pq.ParquetFile(path).iter_batches()
+
+
+class PCOArrowWriter(PCOColumnarWriter):
+    """Writes resources to an Arrow IPC (Feather v2) file."""
+
+    def _open(self, path: Path, schema: Any) -> Any:
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        return pa.ipc.new_file(path, schema, options=options)
+
+    def _read(self, path: Path) -> Iterator[Any]:
+        with pa.memory_map(str(path)) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i)
+
+
+def _to_array(values: list[Any]) -> Any:
+    """Build an Arrow array, falling back to strings for mixed values."""
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if value is None else str(value) for value in values])
+
+
+def _widen_type(current: Any, other: Any) -> Any:
+    """Get a type that can hold the values of both types."""
+    if current.equals(other) or pa.types.is_null(other):
+        return current
+    if pa.types.is_null(current):
+        return other
+    try:
+        return (
+            pa.unify_schemas(
+                [pa.schema([("value", current)]), pa.schema([("value", other)])],
+                promote_options="permissive",
+            )
+            .field("value")
+            .type
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return pa.string()
+
+
+def _widen_schema(schema: Any, other: Any) -> Any:
+    """Widen ``schema`` to hold ``other``, appending columns it lacks."""
+    fields = [
+        (
+            pa.field(field.name, _widen_type(field.type, other.field(field.name).type))
+            if field.name in other.names
+            else field
+        )
+        for field in schema
+    ]
+    fields += [field for field in other if field.name not in schema.names]
+    return pa.schema(fields)
+
+
+def _conform(batch: Any, schema: Any) -> Any:
+    """Cast a record batch to ``schema``, filling missing columns with nulls."""
+    columns = []
+    for field in schema:
+        if field.name in batch.schema.names:
+            column = batch.column(field.name)
+            if not column.type.equals(field.type):
+                column = column.cast(field.type)
+        else:
+            column = pa.nulls(batch.num_rows, field.type)
+        columns.append(column)
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+# Writer class for each export format
+EXPORT_FORMATS: dict[str, type[PCOExportWriter]] = {
+    "ndjson": PCONDJSONWriter,
+    "csv": PCOCSVWriter,
+    "parquet": PCOParquetWriter,
+    "arrow": PCOArrowWriter,
+}
+
+
+def create_writer(
+    format: str, target: str | Path | ExportSink, **kwargs: Any
+) -> PCOExportWriter:
+    """Create the export writer for a format.
+
+    Args:
+        format: One of ``EXPORT_FORMATS``
+        target: Output file path, or coroutine function receiving chunks
+        **kwargs: Options of the writer class
+
+    Returns:
+        Writer for the format
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unknown export format '{format}', expected one of "
+            f"{tuple(EXPORT_FORMATS)}"
+        )
+    return EXPORT_FORMATS[format](target, **kwargs)
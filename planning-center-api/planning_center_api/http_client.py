@@ -5,12 +5,28 @@ from typing import Any
 
 import httpx
 from httpx import Response
+from pydantic import ValidationError
 
 from .auth import PCOAuth
+from .cache import PCOCachedResponse, PCOHttpCache, PCOResponseCache
+from .circuit_breaker import PCOCircuitBreaker
 from .config import PCOConfig
 from .exceptions import raise_for_status
-from .models.base import PCOCollection, PCOResource
-from .rate_limiter import PCORateLimiter
+from .models.base import PCOCollection, PCOResource, PCOResourceDocument
+from .models.compact import PCOCompactCollection, PCOCompactResource
+from .models.raw import PCORawCollection, PCORawResource
+from .rate_limiter import create_rate_limiter, parse_numeric_header
+from .retry import IDEMPOTENT_METHODS, PCORetryBudget, PCORetryPolicy
+from .serialization import check_json_backend, dumps, loads, validate_json
+
+try:
+    import h2
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
+
+# "model" validates responses into Pydantic models, "raw" wraps the decoded
+# JSON in read-only views and "compact" packs it into slotted records
+RESULT_MODES = ("model", "raw", "compact")
 
 
 class PCOHttpClient:
@@ -19,21 +35,59 @@ class PCOHttpClient:
     def __init__(self, config: PCOConfig):
         self.config = config
         self.auth = PCOAuth(config)
-        self.rate_limiter = PCORateLimiter(
-            max_requests=config.rate_limit_requests,
-            window_seconds=config.rate_limit_window,
-            backoff_factor=config.backoff_factor,
-            max_retries=config.max_retries,
-        )
+        check_json_backend(config.json_backend)
+        if config.http2 and h2 is None and config.transport is None:
+            raise ImportError(
+                "HTTP/2 requires the h2 package: "
+                "pip install 'planning-center-api[http2]'"
+            )
+        self.rate_limiter = create_rate_limiter(config)
+        self.retry_policy = PCORetryPolicy.from_config(config)
+        self.retry_budget = PCORetryBudget.from_policy(self.retry_policy)
+
+        self.cache: PCOResponseCache | None = None
+        if config.cache_enabled:
+            self.cache = PCOResponseCache(
+                max_bytes=config.cache_max_bytes,
+                default_ttl=config.cache_default_ttl,
+                ttls=config.cache_ttls,
+            )
+
+        self.http_cache: PCOHttpCache | None = None
+        if config.http_cache_path:
+            self.http_cache = PCOHttpCache(
+                config.http_cache_path, ttl=config.http_cache_ttl
+            )
+
+        # Circuit breakers by product base path, created on first use
+        self.circuit_breakers: dict[str, PCOCircuitBreaker] = {}
 
         self._client: httpx.AsyncClient | None = None
+        self._in_flight: dict[str, asyncio.Task[Response]] = {}
 
     async def __aenter__(self):
         """Async context manager entry."""
+        config = self.config
         self._client = httpx.AsyncClient(
-            timeout=httpx.Timeout(self.config.timeout),
+            timeout=httpx.Timeout(
+                config.timeout,
+                pool=(
+                    config.pool_timeout
+                    if config.pool_timeout is not None
+                    else config.timeout
+                ),
+            ),
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            http2=config.http2,
+            transport=config.transport,
             headers=self.auth.get_headers(),
         )
+        if config.prewarm_connections:
+            await self.prewarm(config.prewarm_connections)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -41,6 +95,39 @@ class PCOHttpClient:
         if self._client:
             await self._client.aclose()
             self._client = None
+        await asyncio.to_thread(self.rate_limiter.close)
+        if self.http_cache is not None:
+            await asyncio.to_thread(self.http_cache.close)
+
+    async def prewarm(self, connections: int) -> None:
+        """Open pooled connections ahead of the first requests.
+
+        Sends concurrent ``HEAD`` requests to ``base_url``, so the TCP and
+        TLS handshakes are done before paginating. Each one takes a token
+        from the rate limiter like any request; none of them belongs to a
+        product, so no circuit breaker sees them. Over HTTP/2 one connection
+        carries every request, so one is opened. Failures are ignored;
+        requests open connections as usual.
+
+        Args:
+            connections: Number of connections to open
+        """
+        if not self._client:
+            raise RuntimeError(
+                "HTTP client not initialized. Use async context manager."
+            )
+        if self.config.http2:
+            connections = 1
+        if self.config.max_keepalive_connections is not None:
+            connections = min(connections, self.config.max_keepalive_connections)
+
+        async def head() -> None:
+            await self.rate_limiter.acquire()
+            await self._client.head(self.config.base_url)
+
+        await asyncio.gather(
+            *(head() for _ in range(connections)), return_exceptions=True
+        )
 
     async def _make_request(
         self,
@@ -49,61 +136,216 @@ class PCOHttpClient:
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        idempotent: bool = False,
     ) -> Response:
-        """Make an HTTP request with rate limiting and retry logic."""
+        """Make an HTTP request with rate limiting and retry logic.
+
+        Retries follow ``retry_policy`` within the client's ``retry_budget``.
+        Pass ``idempotent`` for a POST or PATCH that is safe to repeat.
+        """
         if not self._client:
             raise RuntimeError(
                 "HTTP client not initialized. Use async context manager."
             )
 
-        # Apply rate limiting
-        await self.rate_limiter.acquire()
-
         # Prepare request
         request_headers = self.auth.get_headers()
         if headers:
             request_headers.update(headers)
 
+        body = None
+        if json_data is not None:
+            body = dumps(json_data, self.config.json_backend)
+
+        # Serve GETs from the persistent cache, revalidating stale entries
+        cache_key: str | None = None
+        cached: PCOCachedResponse | None = None
+        if method == "GET" and self.http_cache is not None:
+            request_key = self._request_key(url, params)
+            cache_key = self.http_cache.make_key(
+                request_key, request_headers.get("Authorization")
+            )
+            cached = await asyncio.to_thread(self.http_cache.get, cache_key)
+            if cached is not None:
+                if cached.is_fresh():
+                    return cached.to_response(method, url)
+                request_headers.update(cached.validators())
+
         # Make request with retry logic
-        for attempt in range(self.config.max_retries + 1):
+        idempotent = idempotent or method in IDEMPOTENT_METHODS
+        status_attempts: dict[int, int] = {}
+        error_attempts = 0
+        self.retry_budget.record_request()
+
+        breaker = self._circuit_breaker(url)
+
+        while True:
+            # Fail fast, before spending rate budget, while the product is down
+            if breaker is not None:
+                breaker.before_request()
+
             try:
+                # Apply rate limiting to every attempt, retries included. It
+                # waits inside the try so that a caller cancelled here still
+                # frees a half-open trial slot taken above.
+                await self.rate_limiter.acquire()
                 response = await self._client.request(
                     method=method,
                     url=url,
                     params=params,
-                    json=json_data,
+                    content=body,
                     headers=request_headers,
                 )
+            except httpx.RequestError as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                if not (
+                    self.retry_policy.should_retry_error(e, error_attempts, idempotent)
+                    and self.retry_budget.try_retry()
+                ):
+                    raise
+                await asyncio.sleep(self.retry_policy.delay(error_attempts))
+                error_attempts += 1
+                continue
+            except BaseException:
+                if breaker is not None:
+                    breaker.record_abandoned()
+                raise
+
+            if breaker is not None:
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
+            if self.config.adaptive_rate_limit:
+                await self.rate_limiter.observe_headers(response.headers)
+
+            status = response.status_code
+            attempt = status_attempts.get(status, 0)
+            if (
+                self.retry_policy.should_retry_status(status, attempt, idempotent)
+                and self.retry_budget.try_retry()
+            ):
+                delay = self.retry_policy.delay(
+                    attempt, parse_numeric_header(response.headers, "Retry-After")
+                )
+                if status == 429:
+                    # Also drain the bucket so other requests hold back
+                    await self.rate_limiter.handle_rate_limit_error(delay, attempt)
+                else:
+                    await asyncio.sleep(delay)
+                status_attempts[status] = attempt + 1
+                continue
+
+            if cached is not None and status == 304:
+                await asyncio.to_thread(self.http_cache.refresh, cache_key)
+                return cached.to_response(method, url)
+
+            # Raise for error status codes that weren't retried
+            if status >= 400:
+                try:
+                    error_data = response.json()
+                except Exception:
+                    error_data = {"error": response.text}
+                raise_for_status(status, error_data)
+
+            if cache_key is not None:
+                await asyncio.to_thread(
+                    self.http_cache.store, cache_key, request_key, response
+                )
 
-                # Handle rate limiting
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    retry_after_int = int(retry_after) if retry_after else None
-                    await self.rate_limiter.handle_rate_limit_error(retry_after_int)
-                    continue
-
-                # Raise for other error status codes
-                if response.status_code >= 400:
-                    try:
-                        error_data = response.json()
-                    except Exception:
-                        error_data = {"error": response.text}
-                    raise_for_status(response.status_code, error_data)
+            return response
+
+    def _circuit_breaker(self, url: str) -> PCOCircuitBreaker | None:
+        """Get the circuit breaker for a URL's product, e.g. ``giving/v2``."""
+        if not self.config.circuit_breaker_enabled:
+            return None
+
+        path = url.removeprefix(self.config.base_url).lstrip("/")
+        key = "/".join(path.split("/", 2)[:2])
+        breaker = self.circuit_breakers.get(key)
+        if breaker is None:
+            breaker = self.circuit_breakers[key] = PCOCircuitBreaker(
+                key,
+                failure_threshold=self.config.circuit_failure_threshold,
+                recovery_timeout=self.config.circuit_recovery_timeout,
+                half_open_calls=self.config.circuit_half_open_calls,
+                listener=self.config.circuit_listener,
+            )
+        return breaker
 
-                return response
+    async def _get_response(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> Response:
+        """Make a GET request, sharing one response between identical callers.
+
+        Concurrent GETs for the same URL and query parameters wait on a single
+        in-flight request instead of each sending their own.
+        """
+        if not self.config.coalesce_requests:
+            return await self._make_request("GET", url, params=params)
+
+        key = self._request_key(url, params)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._make_request("GET", url, params=params))
+            self._in_flight[key] = task
+
+            def _forget(finished: asyncio.Task[Response]) -> None:
+                self._in_flight.pop(key, None)
+                if not finished.cancelled():
+                    # Mark the exception retrieved even if every caller left
+                    finished.exception()
+
+            task.add_done_callback(_forget)
+
+        # Shield the shared request so one caller's cancellation can't fail
+        # it for everyone else
+        return await asyncio.shield(task)
+
+    async def _get_content(
+        self, url: str, params: dict[str, Any] | None, endpoint: str
+    ) -> bytes:
+        """Get a GET response body, from the response cache when enabled."""
+        if self.cache is None:
+            response = await self._get_response(url, params=params)
+            return response.content
+
+        key = self._request_key(url, params)
+        content = self.cache.get(key)
+        if content is None:
+            generation = self.cache.generation
+            response = await self._get_response(url, params=params)
+            content = response.content
+            self.cache.set(
+                key, content, self.cache.ttl_for(endpoint), generation=generation
+            )
+        return content
 
-            except httpx.RequestError as e:
-                print(f"Request error: {e}")
-                if attempt == self.config.max_retries:
-                    raise
+    async def invalidate_cache(self, product: str, endpoint: str) -> int:
+        """Drop cached responses for an endpoint and the resources beneath it.
 
-                # Exponential backoff for network errors
-                wait_time = self.config.retry_delay * (
-                    self.config.backoff_factor**attempt
-                )
-                await asyncio.sleep(wait_time)
+        Args:
+            product: Product base path (e.g. ``people/v2``)
+            endpoint: Endpoint path (e.g. ``people``)
 
-        raise RuntimeError("Max retries exceeded")
+        Returns:
+            Number of cache entries removed
+        """
+        url = self._build_url(product, endpoint)
+        removed = 0
+        if self.cache is not None:
+            removed += self.cache.invalidate(url)
+        if self.http_cache is not None:
+            removed += await asyncio.to_thread(self.http_cache.invalidate, url)
+        return removed
+
+    @staticmethod
+    def _request_key(url: str, params: dict[str, Any] | None) -> str:
+        """Build a canonical key for a URL and its query parameters."""
+        query = httpx.QueryParams(sorted((params or {}).items()))
+        return f"{url}?{query}" if query else url
 
     def _build_url(
         self, product: str, endpoint: str, resource_id: str | None = None
@@ -164,9 +406,26 @@ class PCOHttpClient:
         include: list[str] | None = None,
         filter_params: dict[str, Any] | None = None,
         sort: str | None = None,
+        result_mode: str = "model",
         **kwargs: Any,
-    ) -> PCOResource | PCOCollection:
-        """Make a GET request to the API."""
+    ) -> (
+        PCOResource
+        | PCOCollection
+        | PCORawResource
+        | PCORawCollection
+        | PCOCompactResource
+    ):
+        """Make a GET request to the API.
+
+        ``result_mode="raw"`` returns read-only ``PCORawResource`` and
+        ``PCORawCollection`` views instead of validated models, and
+        ``result_mode="compact"`` returns ``PCOCompactResource`` records in a
+        ``PCOCompactCollection``.
+        """
+        if result_mode not in RESULT_MODES:
+            raise ValueError(
+                f"Unknown result mode '{result_mode}', expected one of {RESULT_MODES}"
+            )
         url = self._build_url(product, endpoint, resource_id)
         params = self._build_params(
             per_page=per_page,
@@ -177,17 +436,60 @@ class PCOHttpClient:
             **kwargs,
         )
 
-        response = await self._make_request("GET", url, params=params)
-        data = response.json()
+        content = await self._get_content(url, params, endpoint)
+        if result_mode == "raw":
+            return self._decode_raw_document(content, PCORawCollection)
+        if result_mode == "compact":
+            return self._decode_raw_document(content, PCOCompactCollection)
+        return self._decode_document(content, collection=resource_id is None)
+
+    def _decode_document(
+        self, content: bytes, collection: bool
+    ) -> PCOResource | PCOCollection:
+        """Decode a response body into a resource or collection.
+
+        The expected shape is validated straight from the bytes in one pass,
+        a single resource as the ``data`` member of its document; only if that
+        fails is the body decoded generically to find out whether it holds a
+        single resource or a collection.
+        """
+        backend = self.config.json_backend
+        try:
+            if collection:
+                return validate_json(PCOCollection, content, backend)
+            return validate_json(PCOResourceDocument, content, backend).data
+        except ValidationError:
+            pass
+
+        data = loads(content, backend)
 
         # Determine if this is a single resource or collection
-        if "data" in data:
-            if isinstance(data["data"], list):
-                return PCOCollection(**data)
-            else:
-                return PCOResource(**data)
-        else:
-            return PCOResource(**data)
+        if isinstance(data.get("data"), list):
+            return PCOCollection(**data)
+        if isinstance(data.get("data"), dict):
+            return PCOResourceDocument(**data).data
+        return PCOResource(**data)
+
+    def _decode_raw_document(
+        self, content: bytes, collection_class: type[PCORawCollection]
+    ) -> Any:
+        """Decode a response body without validation.
+
+        Args:
+            content: Response body
+            collection_class: ``PCORawCollection`` or ``PCOCompactCollection``;
+                single resources are wrapped in its ``resource_class``
+
+        Returns:
+            Collection or resource of the requested kind
+        """
+        document = loads(content, self.config.json_backend)
+        data = document.get("data")
+        if isinstance(data, list):
+            return collection_class.from_document(document)
+        return collection_class.resource_class(
+            data if isinstance(data, dict) else document
+        )
 
     async def post(
         self,
@@ -195,17 +497,25 @@ class PCOHttpClient:
         endpoint: str,
         data: dict[str, Any],
         include: list[str] | None = None,
+        idempotent: bool = False,
     ) -> PCOResource:
-        """Make a POST request to create a resource."""
+        """Make a POST request to create a resource.
+
+        It is retried after server errors only if ``idempotent``.
+        """
         url = self._build_url(product, endpoint)
         params = {}
         if include:
             params["include"] = ",".join(include)
 
-        response = await self._make_request("POST", url, params=params, json_data=data)
-        response_data = response.json()
+        try:
+            response = await self._make_request(
+                "POST", url, params=params, json_data=data, idempotent=idempotent
+            )
+        finally:
+            await self.invalidate_cache(product, endpoint)
 
-        return PCOResource(**response_data)
+        return self._decode_document(response.content, collection=False)
 
     async def patch(
         self,
@@ -214,17 +524,25 @@ class PCOHttpClient:
         resource_id: str,
         data: dict[str, Any],
         include: list[str] | None = None,
+        idempotent: bool = False,
     ) -> PCOResource:
-        """Make a PATCH request to update a resource."""
+        """Make a PATCH request to update a resource.
+
+        It is retried after server errors only if ``idempotent``.
+        """
         url = self._build_url(product, endpoint, resource_id)
         params = {}
         if include:
             params["include"] = ",".join(include)
 
-        response = await self._make_request("PATCH", url, params=params, json_data=data)
-        response_data = response.json()
+        try:
+            response = await self._make_request(
+                "PATCH", url, params=params, json_data=data, idempotent=idempotent
+            )
+        finally:
+            await self.invalidate_cache(product, endpoint)
 
-        return PCOResource(**response_data)
+        return self._decode_document(response.content, collection=False)
 
     async def delete(
         self,
@@ -235,6 +553,9 @@ class PCOHttpClient:
         """Make a DELETE request to delete a resource."""
         url = self._build_url(product, endpoint, resource_id)
 
-        response = await self._make_request("DELETE", url)
+        try:
+            response = await self._make_request("DELETE", url)
+        finally:
+            await self.invalidate_cache(product, endpoint)
 
         return response.status_code in [200, 204]
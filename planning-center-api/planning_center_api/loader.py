@@ -0,0 +1,119 @@
+"""Batched loading of resources by ID for Planning Center API."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .exceptions import PCONotFoundError
+
+# Fetches the resources with the given IDs from a product's resource type
+BatchFetch = Callable[[Any, str, list[str]], Awaitable[list[Any]]]
+
+
+class PCOBatchLoader:
+    """Coalesces fetch-by-ID calls made in the same event loop tick.
+
+    IDs requested by any number of coroutines are collected per
+    ``(product, resource)`` until the current tick ends, then fetched with as
+    few ``where[id]`` collection requests as ``max_batch_size`` allows. Each
+    caller receives its own resource, and an ID requested several times is
+    fetched once.
+    """
+
+    def __init__(self, fetch: BatchFetch, max_batch_size: int = 100):
+        """Initialize the batch loader.
+
+        Args:
+            fetch: Coroutine function fetching ``(product, resource, ids)``
+            max_batch_size: Most IDs sent in a single request
+        """
+        self.fetch = fetch
+        self.max_batch_size = max_batch_size
+
+        self._pending: dict[tuple[Any, str], dict[str, list[asyncio.Future]]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, product: Any, resource: str, resource_id: str) -> Any:
+        """Load a single resource, batched with other loads in this tick.
+
+        Raises:
+            PCONotFoundError: If no resource has that ID
+        """
+        return await self._enqueue(product, resource, resource_id)
+
+    async def load_many(
+        self, product: Any, resource: str, resource_ids: list[str]
+    ) -> list[Any]:
+        """Load several resources, returning None for IDs that don't exist."""
+        # Enqueue every ID before yielding so they all join the current batch
+        futures = [self._enqueue(product, resource, id_) for id_ in resource_ids]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(
+                result, PCONotFoundError
+            ):
+                raise result
+        return [
+            None if isinstance(result, PCONotFoundError) else result
+            for result in results
+        ]
+
+    def _enqueue(self, product: Any, resource: str, resource_id: str) -> asyncio.Future:
+        """Add an ID to the batch for this tick, scheduling it if it's new."""
+        loop = asyncio.get_running_loop()
+        key = (product, resource)
+        future = loop.create_future()
+
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = {}
+            loop.call_soon(self._dispatch, key)
+        batch.setdefault(str(resource_id), []).append(future)
+        return future
+
+    def _dispatch(self, key: tuple[Any, str]) -> None:
+        """Start fetching the IDs collected for ``key`` during the last tick."""
+        batch = self._pending.pop(key)
+        ids = list(batch)
+        for start in range(0, len(ids), self.max_batch_size):
+            chunk = {
+                id_: batch[id_] for id_ in ids[start : start + self.max_batch_size]
+            }
+            task = asyncio.create_task(self._run(key, chunk))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self, key: tuple[Any, str], batch: dict[str, list[asyncio.Future]]
+    ) -> None:
+        """Fetch one batch and resolve its callers' futures."""
+        product, resource = key
+        try:
+            found = {
+                item.id: item
+                for item in await self.fetch(product, resource, list(batch))
+            }
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        except BaseException:
+            # A cancelled fetch must not leave its callers waiting forever
+            for futures in batch.values():
+                for future in futures:
+                    future.cancel()
+            raise
+
+        for id_, futures in batch.items():
+            item = found.get(id_)
+            for future in futures:
+                if future.done():
+                    continue
+                if item is None:
+                    future.set_exception(
+                        PCONotFoundError(f"{resource} {id_} not found")
+                    )
+                else:
+                    future.set_result(item)
@@ -0,0 +1,373 @@
+"""Local SQLite mirror of Planning Center resources."""
+
+import asyncio
+import json
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+from .models.base import PCOCollection, PCOResource
+
+# Attributes searched by search_people
+SEARCH_ATTRIBUTES = ("name", "first_name", "last_name", "nickname")
+
+
+class PCOMirror:
+    """SQLite copy of Planning Center resources for local lookups.
+
+    Each resource is stored as one row of JSON attributes and relationships,
+    keyed by type and ID, with its relationship linkage copied into an edge
+    table. ``Email`` addresses and ``PhoneNumber`` numbers are indexed, as
+    are ``updated_at`` and the relationship edges (which is how household
+    members are found). Resources read back are ``PCOResource`` models whose
+    ``related`` resolves from the mirror.
+
+    Keep the mirror current with ``PCOSyncEngine``, passing ``sink()`` as
+    the sink, or with ``pco-cli sync``.
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize the mirror.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS resources (
+                type TEXT NOT NULL,
+                id TEXT NOT NULL,
+                attributes TEXT NOT NULL,
+                relationships TEXT,
+                updated_at TEXT,
+                PRIMARY KEY (type, id)
+            );
+            CREATE INDEX IF NOT EXISTS resources_updated_at
+                ON resources (type, updated_at);
+
+            CREATE TABLE IF NOT EXISTS edges (
+                type TEXT NOT NULL,
+                id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                related_type TEXT NOT NULL,
+                related_id TEXT NOT NULL,
+                PRIMARY KEY (type, id, name, related_type, related_id)
+            );
+            CREATE INDEX IF NOT EXISTS edges_related
+                ON edges (related_type, related_id);
+
+            CREATE TABLE IF NOT EXISTS emails (
+                id TEXT PRIMARY KEY,
+                address TEXT NOT NULL,
+                person_id TEXT
+            );
+            CREATE INDEX IF NOT EXISTS emails_address ON emails (address);
+
+            CREATE TABLE IF NOT EXISTS phone_numbers (
+                id TEXT PRIMARY KEY,
+                number TEXT NOT NULL,
+                person_id TEXT
+            );
+            CREATE INDEX IF NOT EXISTS phone_numbers_number
+                ON phone_numbers (number);
+            """
+        )
+
+    def __len__(self) -> int:
+        """Return the number of mirrored resources."""
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM resources"
+            ).fetchone()
+        return count
+
+    # Writes
+
+    def upsert(self, resource: Any, related: bool = True) -> None:
+        """Insert or replace a resource.
+
+        Args:
+            resource: ``PCOResource``, raw or compact resource
+            related: Also store the related resources that ``related``
+                resolves, such as included emails
+        """
+        self.upsert_many([resource], related=related)
+
+    def upsert_many(self, resources: list[Any], related: bool = True) -> None:
+        """Insert or replace several resources in one transaction."""
+        documents = []
+        for resource in resources:
+            document = resource.model_dump()
+            documents.append(document)
+            if related:
+                for name in document.get("relationships") or {}:
+                    resolved = resource.related(name)
+                    if isinstance(resolved, list):
+                        documents.extend(item.model_dump() for item in resolved)
+                    elif resolved is not None:
+                        documents.append(resolved.model_dump())
+
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                for document in documents:
+                    self._write(document)
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+    def sink(self, batch_size: int = 100, related: bool = True) -> "PCOMirrorSink":
+        """Create an async sync sink writing to this mirror in batches."""
+        return PCOMirrorSink(self, batch_size=batch_size, related=related)
+
+    def delete(self, resource_type: str, resource_id: str) -> None:
+        """Remove a resource, e.g. after a ``people.v2.events.person.destroyed``
+        webhook."""
+        with self._lock:
+            self._connection.execute("BEGIN")
+            try:
+                self._remove(resource_type, resource_id)
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+    def _write(self, document: dict[str, Any]) -> None:
+        """Store one resource document; must run inside a transaction."""
+        resource_type, resource_id = document["type"], document["id"]
+        attributes = document.get("attributes") or {}
+        relationships = {
+            name: {"data": (relationship or {}).get("data")}
+            for name, relationship in (document.get("relationships") or {}).items()
+        }
+
+        self._remove(resource_type, resource_id)
+        self._connection.execute(
+            "INSERT INTO resources VALUES (?, ?, ?, ?, ?)",
+            (
+                resource_type,
+                resource_id,
+                json.dumps(attributes, default=str),
+                json.dumps(relationships) if relationships else None,
+                attributes.get("updated_at"),
+            ),
+        )
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO edges VALUES (?, ?, ?, ?, ?)",
+            [
+                (resource_type, resource_id, name, item["type"], item["id"])
+                for name, relationship in relationships.items()
+                for item in _linkage_items(relationship["data"])
+            ],
+        )
+
+        person = _linked_id(relationships.get("person"))
+        if resource_type == "Email" and attributes.get("address"):
+            self._connection.execute(
+                "INSERT INTO emails VALUES (?, ?, ?)",
+                (resource_id, attributes["address"].strip().lower(), person),
+            )
+        elif resource_type == "PhoneNumber" and attributes.get("number"):
+            self._connection.execute(
+                "INSERT INTO phone_numbers VALUES (?, ?, ?)",
+                (resource_id, _digits(attributes["number"]), person),
+            )
+
+    def _remove(self, resource_type: str, resource_id: str) -> None:
+        """Delete a resource and its index rows; must run inside a transaction."""
+        key = (resource_type, resource_id)
+        self._connection.execute("DELETE FROM resources WHERE type = ? AND id = ?", key)
+        self._connection.execute("DELETE FROM edges WHERE type = ? AND id = ?", key)
+        if resource_type == "Email":
+            self._connection.execute("DELETE FROM emails WHERE id = ?", (resource_id,))
+        elif resource_type == "PhoneNumber":
+            self._connection.execute(
+                "DELETE FROM phone_numbers WHERE id = ?", (resource_id,)
+            )
+
+    # Reads
+
+    def get(self, resource_type: str, resource_id: str) -> PCOResource | None:
+        """Get a mirrored resource by type and ID."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT type, id, attributes, relationships FROM resources "
+                "WHERE type = ? AND id = ?",
+                (resource_type, resource_id),
+            ).fetchone()
+        return self._to_resource(row) if row else None
+
+    def updated_since(self, resource_type: str, since: str) -> PCOCollection:
+        """Get the resources of a type updated at or after ``since``."""
+        return self._query(
+            "SELECT type, id, attributes, relationships FROM resources "
+            "WHERE type = ? AND updated_at >= ? ORDER BY updated_at",
+            (resource_type, since),
+        )
+
+    def get_people_by_email(self, email: str) -> PCOCollection:
+        """Get the people with an email address, ignoring case."""
+        return self._people_linked_to(
+            "Email",
+            "SELECT id, person_id FROM emails WHERE address = ?",
+            email.strip().lower(),
+        )
+
+    def get_people_by_phone(self, phone: str) -> PCOCollection:
+        """Get the people with a phone number, ignoring its formatting."""
+        return self._people_linked_to(
+            "PhoneNumber",
+            "SELECT id, person_id FROM phone_numbers WHERE number = ?",
+            _digits(phone),
+        )
+
+    def get_household_people(self, household_id: str) -> PCOCollection:
+        """Get the members of a household."""
+        return self._query(
+            "SELECT type, id, attributes, relationships FROM resources "
+            "WHERE type = 'Person' AND id IN ("
+            "SELECT id FROM edges WHERE type = 'Person' "
+            "AND related_type = 'Household' AND related_id = :household "
+            "UNION SELECT related_id FROM edges WHERE type = 'Household' "
+            "AND id = :household AND related_type = 'Person')",
+            {"household": household_id},
+        )
+
+    def search_people(self, query: str) -> PCOCollection:
+        """Find people by a case-insensitive match on their names or email."""
+        pattern = f"%{_escape_like(query.strip())}%"
+        names = " OR ".join(
+            f"json_extract(attributes, '$.{name}') LIKE :pattern ESCAPE '\\'"
+            for name in SEARCH_ATTRIBUTES
+        )
+        matches = self._query(
+            "SELECT type, id, attributes, relationships FROM resources "
+            f"WHERE type = 'Person' AND ({names})",
+            {"pattern": pattern},
+        )
+        if "@" in query:
+            seen = {person.id for person in matches.data}
+            for person in self.get_people_by_email(query).data:
+                if person.id not in seen:
+                    matches.data.append(person)
+        return matches
+
+    def _people_linked_to(
+        self, resource_type: str, sql: str, value: str
+    ) -> PCOCollection:
+        """Get the people owning the matching emails or phone numbers.
+
+        The owner comes from the resource's own ``person`` relationship or,
+        failing that, from a person's relationship to it.
+        """
+        with self._lock:
+            rows = self._connection.execute(sql, (value,)).fetchall()
+            people = {person for _, person in rows if person}
+            unowned = [id_ for id_, person in rows if not person]
+            if unowned:
+                placeholders = ",".join("?" * len(unowned))
+                people.update(
+                    id_
+                    for (id_,) in self._connection.execute(
+                        "SELECT id FROM edges WHERE type = 'Person' "
+                        f"AND related_type = ? AND related_id IN ({placeholders})",
+                        (resource_type, *unowned),
+                    )
+                )
+
+        resources = (self.get("Person", person) for person in sorted(people))
+        return PCOCollection(data=[person for person in resources if person])
+
+    def _query(self, sql: str, params: Any) -> PCOCollection:
+        """Run a query selecting resource rows and wrap them in a collection."""
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return PCOCollection(data=[self._to_resource(row) for row in rows])
+
+    def _to_resource(self, row: tuple[str, str, str, str | None]) -> PCOResource:
+        """Build a resource from a row, resolving its relationships locally."""
+        resource_type, resource_id, attributes, relationships = row
+        resource = PCOResource(
+            id=resource_id,
+            type=resource_type,
+            attributes=json.loads(attributes),
+            relationships=json.loads(relationships) if relationships else None,
+        )
+        resource.bind_resolver(self.get)
+        return resource
+
+    def close(self) -> None:
+        """Close the connection to the mirror database."""
+        self._connection.close()
+
+
+class PCOMirrorSink:
+    """``PCOSyncEngine`` sink that upserts resources into a mirror in batches.
+
+    Resources are held until ``batch_size`` of them are collected and then
+    written with ``upsert_many`` in a worker thread, one transaction per
+    batch, so the event loop isn't blocked on SQLite. The engine calls
+    ``flush`` before each checkpoint and at the end of a run.
+    """
+
+    def __init__(self, mirror: PCOMirror, batch_size: int = 100, related: bool = True):
+        """Initialize the sink.
+
+        Args:
+            mirror: Mirror written to
+            batch_size: Resources written per transaction
+            related: Also store the related resources, as for ``upsert``
+        """
+        self.mirror = mirror
+        self.batch_size = batch_size
+        self.related = related
+
+        self._pending: list[Any] = []
+
+    async def __call__(self, resource: Any) -> None:
+        """Buffer a resource, writing the batch once it is full."""
+        self._pending.append(resource)
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write the buffered resources."""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        await asyncio.to_thread(self.mirror.upsert_many, batch, related=self.related)
+
+
+def _escape_like(value: str) -> str:
+    """Escape the LIKE wildcards in a value matched with ``ESCAPE '\\'``."""
+    return re.sub(r"([\\%_])", r"\\\1", value)
+
+
+def _linkage_items(data: Any) -> list[dict[str, str]]:
+    """Get the resource identifiers of relationship data as a list."""
+    if isinstance(data, list):
+        return data
+    return [data] if data else []
+
+
+def _linked_id(relationship: dict[str, Any] | None) -> str | None:
+    """Get the ID a to-one relationship points at."""
+    data = (relationship or {}).get("data")
+    return data.get("id") if isinstance(data, dict) else None
+
+
+def _digits(number: str) -> str:
+    """Reduce a phone number to its digits, so formatting doesn't matter."""
+    return re.sub(r"\D", "", number)
@@ -5,16 +5,21 @@ from .base import (
     PCOCollection,
     PCOErrorResponse,
     PCOResource,
+    PCOResourceDocument,
     PCOWebhookPayload,
 )
+from .compact import PCOCompactCollection, PCOCompactResource
+from .identity import PCOIdentityMap
 from .links import PCOLink, PCOLinks
 from .meta import PCOMeta
+from .raw import PCORawCollection, PCORawResource
 from .relationships import PCORelationship, PCORelationships
 
 # Rebuild models to resolve forward references
 PCOResource.model_rebuild()
 PCOWebhookPayload.model_rebuild()
 PCOCollection.model_rebuild()
+PCOResourceDocument.model_rebuild()
 PCOErrorResponse.model_rebuild()
 
 __all__ = [
@@ -25,6 +30,11 @@ __all__ = [
     "PCOLinks",
     "PCOLink",
     "PCOMeta",
+    "PCORawResource",
+    "PCORawCollection",
+    "PCOCompactResource",
+    "PCOCompactCollection",
+    "PCOIdentityMap",
     "PCORelationship",
     "PCORelationships",
 ]
@@ -1,9 +1,10 @@
 """Base Pydantic models for Planning Center API."""
 
+from collections.abc import Callable
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Self, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 if TYPE_CHECKING:
     from .links import PCOLinks
@@ -11,6 +12,29 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# Looks up a resource by type and ID, returning None when it isn't available
+Resolver = Callable[[str, str], Any]
+
+
+class _Transient:
+    """Private model state left out of model equality and pickling."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any = None):
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Transient)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _Transient, ()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "_Transient":
+        return _Transient(self.value)
+
+    __hash__ = None
+
 
 class PCOBaseModel(BaseModel):
     """Base model for all Planning Center API models."""
@@ -60,6 +84,10 @@ class PCOResource(PCOBaseModel, Generic[T]):
     links: "PCOLinks | None" = None
     meta: dict[str, Any] | None = None
 
+    # Resolves related resources, set by the collection or identity map
+    # holding the resource
+    _resolver: _Transient = PrivateAttr(default_factory=_Transient)
+
     def get_attribute(self, key: str, default: Any = None) -> Any:
         """Get an attribute value with optional default."""
         return self.attributes.get(key, default)
@@ -75,8 +103,76 @@ class PCOResource(PCOBaseModel, Generic[T]):
         if not self.relationships:
             return None
         relationship = getattr(self.relationships, relationship_name, None)
+        # Relationships are stored as extra fields, which stay plain dicts
+        if isinstance(relationship, dict):
+            return relationship.get("data")
         return relationship.data if relationship else None
 
+    def related(self, relationship_name: str) -> Any:
+        """Resolve a relationship from the included resources.
+
+        No request is made; related resources that weren't included are
+        left out. Use ``PCOClient.fetch_related`` to fetch those as well.
+
+        Args:
+            relationship_name: Relationship name, e.g. ``"emails"``
+
+        Returns:
+            List of resources for a to-many relationship, otherwise the
+            related resource or None
+        """
+        return resolve_related(
+            self.get_relationship_data(relationship_name),
+            self.__pydantic_private__["_resolver"].value,
+        )
+
+    @property
+    def resolver(self) -> Resolver | None:
+        """Lookup used by ``related``."""
+        return self.__pydantic_private__["_resolver"].value
+
+    def bind_resolver(self, resolver: Resolver | None) -> None:
+        """Set how ``related`` looks up resources."""
+        # Replaced rather than updated, since copies share the holder
+        self.__pydantic_private__["_resolver"] = _Transient(resolver)
+
+
+def resolve_related(
+    linkage: dict[str, Any] | list[dict[str, Any]] | None, resolver: Resolver | None
+) -> Any:
+    """Resolve relationship data to resources with ``resolver``.
+
+    Args:
+        linkage: Relationship data of ``{"type", "id"}`` identifiers
+        resolver: Resource lookup; without one nothing resolves
+
+    Returns:
+        List of the resolved resources for to-many data, otherwise the
+        resolved resource or None
+    """
+    if isinstance(linkage, list):
+        if resolver is None:
+            return []
+        resolved = (resolver(item["type"], item["id"]) for item in linkage)
+        return [resource for resource in resolved if resource is not None]
+    if linkage is None or resolver is None:
+        return None
+    return resolver(linkage["type"], linkage["id"])
+
+
+def bind_resolvers(resources: list[Any] | None, resolver: Resolver | None) -> None:
+    """Point the ``related`` lookups of several resources at ``resolver``."""
+    for resource in resources or ():
+        resource.bind_resolver(resolver)
+
+
+def index_resources(resources: list[Any]) -> dict[tuple[str, str], Any]:
+    """Index resources by ``(type, id)``, keeping the first of any duplicates."""
+    index: dict[tuple[str, str], Any] = {}
+    for resource in resources:
+        index.setdefault((resource.type, resource.id), resource)
+    return index
+
 
 class PCOCollection(PCOBaseModel, Generic[T]):
     """Represents a collection of resources in JSON API format."""
@@ -86,6 +182,24 @@ class PCOCollection(PCOBaseModel, Generic[T]):
     links: "PCOLinks | None" = None
     meta: PCOMeta | None = None
 
+    # Included resources by (type, id) along with the list and length they
+    # were built from, so the index is rebuilt when ``included`` changes
+    _included_index: _Transient = PrivateAttr(
+        default_factory=lambda: _Transient((None, 0, {}))
+    )
+
+    def model_post_init(self, context: Any) -> None:
+        """Resolve the resources' relationships through this collection."""
+        resolver = self.get_included_resource
+        bind_resolvers(self.data, resolver)
+        bind_resolvers(self.included, resolver)
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        """Deep copy the collection, resolving the copies through the copy."""
+        copy = super().__deepcopy__(memo)
+        copy.model_post_init(None)
+        return copy
+
     def __len__(self) -> int:
         """Return the number of resources in the collection."""
         return len(self.data)
@@ -105,10 +219,15 @@ class PCOCollection(PCOBaseModel, Generic[T]):
         if not self.included:
             return None
 
-        for resource in self.included:
-            if resource.type == resource_type and resource.id == resource_id:
-                return resource
-        return None
+        # Read through __pydantic_private__, as private attribute access goes
+        # through BaseModel.__getattr__ and dominates the cost of a lookup
+        private = self.__pydantic_private__
+        included = self.included
+        indexed, length, index = private["_included_index"].value
+        if indexed is not included or length != len(included):
+            index = index_resources(included)
+            private["_included_index"].value = (included, len(included), index)
+        return index.get((resource_type, resource_id))
 
     def get_included_resources(self, resource_type: str) -> list[PCOResource[T]]:
         """Get all included resources of a specific type."""
@@ -120,6 +239,25 @@ class PCOCollection(PCOBaseModel, Generic[T]):
         ]
 
 
+class PCOResourceDocument(PCOBaseModel, Generic[T]):
+    """Represents a single-resource document in JSON API format."""
+
+    data: PCOResource[T]
+    included: list[PCOResource[T]] | None = None
+    links: "PCOLinks | None" = None
+    meta: dict[str, Any] | None = None
+
+    def model_post_init(self, context: Any) -> None:
+        """Resolve the resource's relationships through the included ones."""
+        if self.included:
+            index = index_resources(self.included)
+            self.data.bind_resolver(
+                lambda resource_type, resource_id: index.get(
+                    (resource_type, resource_id)
+                )
+            )
+
+
 class PCOErrorDetail(PCOBaseModel):
     """Represents an error detail in JSON API format."""
 
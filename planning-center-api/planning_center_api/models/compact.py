@@ -0,0 +1,190 @@
+"""Memory-compact resources for holding large result sets."""
+
+import sys
+from typing import Any
+
+from .base import Resolver, resolve_related
+from .raw import PCORawCollection
+
+# Shared key layouts, so that resources with the same attribute or
+# relationship names reference a single tuple and index between them
+_SHAPES: dict[tuple[str, ...], "_Shape"] = {}
+
+
+class _Shape:
+    """An interned tuple of keys and the position of each key in it."""
+
+    __slots__ = ("keys", "index")
+
+    def __init__(self, keys: tuple[str, ...]):
+        self.keys = keys
+        self.index = {key: position for position, key in enumerate(keys)}
+
+
+def _shape_for(keys: tuple[str, ...]) -> _Shape:
+    """Get the shared shape for a tuple of keys."""
+    shape = _SHAPES.get(keys)
+    if shape is None:
+        shape = _SHAPES[keys] = _Shape(tuple(sys.intern(key) for key in keys))
+    return shape
+
+
+def _compact_linkage(data: Any) -> Any:
+    """Reduce relationship data to ``(type, id)`` tuples."""
+    if isinstance(data, dict):
+        return (sys.intern(data["type"]), data["id"])
+    if isinstance(data, list):
+        return tuple((sys.intern(item["type"]), item["id"]) for item in data)
+    return None
+
+
+def _expand_linkage(linkage: Any) -> dict[str, str] | list[dict[str, str]] | None:
+    """Rebuild JSON API relationship data from ``(type, id)`` tuples."""
+    if linkage is None:
+        return None
+    if not linkage or isinstance(linkage[0], tuple):
+        return [{"type": type_, "id": id_} for type_, id_ in linkage]
+    return {"type": linkage[0], "id": linkage[1]}
+
+
+def _related_link(relationship: dict[str, Any] | None) -> Any:
+    """Get the ``related`` link of a relationship sent without data."""
+    if not relationship or relationship.get("data") is not None:
+        return None
+    return (relationship.get("links") or {}).get("related")
+
+
+class PCOCompactResource:
+    """Slotted, read-only resource that stores its data in tuples.
+
+    Attribute and relationship names are interned and shared between every
+    resource with the same layout, so each resource only holds its ID, type
+    and tuples of values. Relationship data is reduced to ``(type, id)``
+    pairs, and the resource-level ``links`` and ``meta`` objects are dropped.
+    Relationship links are only kept as the ``related`` link of
+    relationships sent without data, which is all ``fetch_related`` needs.
+    """
+
+    __slots__ = (
+        "id",
+        "type",
+        "_attributes",
+        "_values",
+        "_relationships",
+        "_linkage",
+        "_links",
+        "_resolver",
+    )
+
+    def __init__(self, data: dict[str, Any]):
+        """Initialize the resource from a decoded JSON API resource object.
+
+        Args:
+            data: Resource object with ``id``, ``type``, ``attributes`` and
+                optionally ``relationships``
+        """
+        self.id = data["id"]
+        self.type = sys.intern(data["type"])
+
+        attributes = data.get("attributes") or {}
+        self._attributes = _shape_for(tuple(attributes))
+        self._values = tuple(attributes.values())
+
+        relationships = data.get("relationships") or {}
+        self._relationships = _shape_for(tuple(relationships))
+        self._linkage = tuple(
+            _compact_linkage((relationship or {}).get("data"))
+            for relationship in relationships.values()
+        )
+        links = tuple(
+            _related_link(relationship) for relationship in relationships.values()
+        )
+        self._links = links if any(links) else None
+        self._resolver: Resolver | None = None
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """Build a dictionary of the resource attributes."""
+        return dict(zip(self._attributes.keys, self._values, strict=True))
+
+    @property
+    def relationships(self) -> dict[str, Any] | None:
+        """Build a dictionary of the relationship objects."""
+        links = self._links or (None,) * len(self._linkage)
+        relationships = {}
+        for name, linkage, link in zip(
+            self._relationships.keys, self._linkage, links, strict=True
+        ):
+            relationships[name] = {"data": _expand_linkage(linkage)}
+            if link is not None:
+                relationships[name]["links"] = {"related": link}
+        return relationships or None
+
+    def get_attribute(self, key: str, default: Any = None) -> Any:
+        """Get an attribute value with optional default."""
+        position = self._attributes.index.get(key)
+        return default if position is None else self._values[position]
+
+    def get_relationship_data(
+        self, relationship_name: str
+    ) -> dict[str, Any] | list[dict[str, Any]] | None:
+        """Get relationship data for a specific relationship."""
+        position = self._relationships.index.get(relationship_name)
+        return None if position is None else _expand_linkage(self._linkage[position])
+
+    def related(self, relationship_name: str) -> Any:
+        """Resolve a relationship from the included resources, like
+        ``PCOResource.related``."""
+        return resolve_related(
+            self.get_relationship_data(relationship_name), self._resolver
+        )
+
+    @property
+    def resolver(self) -> Resolver | None:
+        """Lookup used by ``related``."""
+        return self._resolver
+
+    def bind_resolver(self, resolver: Resolver | None) -> None:
+        """Set how ``related`` looks up resources."""
+        self._resolver = resolver
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the resource as a plain dictionary, like ``PCOResource``."""
+        return {
+            "id": self.id,
+            "type": self.type,
+            "attributes": self.attributes,
+            "relationships": self.relationships,
+            "links": None,
+            "meta": None,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        """Compare resources by their data."""
+        if not isinstance(other, PCOCompactResource):
+            return NotImplemented
+        return (
+            self.id == other.id
+            and self.type == other.type
+            and self._attributes is other._attributes
+            and self._values == other._values
+            and self._relationships is other._relationships
+            and self._linkage == other._linkage
+            and self._links == other._links
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the resource without its resolver, sharing shapes on load."""
+        return type(self), (self.model_dump(),)
+
+    def __repr__(self) -> str:
+        """Return a short representation of the resource."""
+        return f"PCOCompactResource(type={self.type!r}, id={self.id!r})"
+
+
+class PCOCompactCollection(PCORawCollection):
+    """Collection of ``PCOCompactResource`` records."""
+
+    __slots__ = ()
+
+    resource_class = PCOCompactResource
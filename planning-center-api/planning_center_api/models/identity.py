@@ -0,0 +1,61 @@
+"""Identity map of resources shared across pages."""
+
+from collections.abc import Iterator
+from typing import Any
+
+from .base import bind_resolvers
+
+
+class PCOIdentityMap:
+    """Keeps a single instance of each resource by ``(type, id)``.
+
+    Passing the same map to every page of a ``paginate_all`` run replaces
+    each page's included resources with the instance already seen on an
+    earlier page, so a household or campus included on every page is only
+    held once.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty identity map."""
+        self._resources: dict[tuple[str, str], Any] = {}
+
+    def __len__(self) -> int:
+        """Return the number of resources in the map."""
+        return len(self._resources)
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        """Check whether a ``(type, id)`` pair is in the map."""
+        return key in self._resources
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the resources in the map."""
+        return iter(self._resources.values())
+
+    def add(self, resource: Any) -> Any:
+        """Add a resource, returning the instance already mapped if any."""
+        return self._resources.setdefault((resource.type, resource.id), resource)
+
+    def get(self, resource_type: str, resource_id: str) -> Any | None:
+        """Get a resource by type and ID."""
+        return self._resources.get((resource_type, resource_id))
+
+    def add_included(self, collection: Any) -> None:
+        """Deduplicate a collection's included resources against the map.
+
+        The collection's resources then resolve ``related`` through the map,
+        which also finds resources included on earlier pages.
+
+        Args:
+            collection: ``PCOCollection`` or ``PCORawCollection`` whose
+                ``included`` list is replaced with the mapped instances
+        """
+        if collection.included:
+            collection.included = [
+                self.add(resource) for resource in collection.included
+            ]
+        bind_resolvers(collection.data, self.get)
+        bind_resolvers(collection.included, self.get)
+
+    def clear(self) -> None:
+        """Remove every resource."""
+        self._resources.clear()
@@ -0,0 +1,208 @@
+"""Lightweight, unvalidated views over Planning Center API documents."""
+
+from collections.abc import Iterator
+from types import MappingProxyType
+from typing import Any
+
+from .base import PCOMeta, Resolver, bind_resolvers, index_resources, resolve_related
+from .links import PCOLinks
+
+
+class PCORawResource:
+    """Read-only view of a JSON API resource backed by the decoded dict.
+
+    Offers the same accessors as ``PCOResource`` without validating or
+    copying anything, which makes it much cheaper for bulk reads.
+    """
+
+    __slots__ = ("_data", "_resolver")
+
+    def __init__(self, data: dict[str, Any]):
+        self._data = data
+        self._resolver: Resolver | None = None
+
+    @property
+    def id(self) -> str:
+        """Resource ID."""
+        return self._data["id"]
+
+    @property
+    def type(self) -> str:
+        """Resource type."""
+        return self._data["type"]
+
+    @property
+    def attributes(self) -> MappingProxyType[str, Any]:
+        """Read-only mapping of the resource attributes."""
+        return MappingProxyType(self._data.get("attributes") or {})
+
+    @property
+    def relationships(self) -> MappingProxyType[str, Any] | None:
+        """Read-only mapping of the raw relationship objects."""
+        relationships = self._data.get("relationships")
+        return MappingProxyType(relationships) if relationships is not None else None
+
+    @property
+    def links(self) -> dict[str, Any] | None:
+        """Raw links object."""
+        return self._data.get("links")
+
+    @property
+    def meta(self) -> dict[str, Any] | None:
+        """Raw meta object."""
+        return self._data.get("meta")
+
+    def get_attribute(self, key: str, default: Any = None) -> Any:
+        """Get an attribute value with optional default."""
+        attributes = self._data.get("attributes")
+        return attributes.get(key, default) if attributes else default
+
+    def get_relationship_data(
+        self, relationship_name: str
+    ) -> dict[str, Any] | list[dict[str, Any]] | None:
+        """Get relationship data for a specific relationship."""
+        relationships = self._data.get("relationships")
+        if not relationships:
+            return None
+        relationship = relationships.get(relationship_name)
+        return relationship.get("data") if relationship else None
+
+    def related(self, relationship_name: str) -> Any:
+        """Resolve a relationship from the included resources, like
+        ``PCOResource.related``."""
+        return resolve_related(
+            self.get_relationship_data(relationship_name), self._resolver
+        )
+
+    @property
+    def resolver(self) -> Resolver | None:
+        """Lookup used by ``related``."""
+        return self._resolver
+
+    def bind_resolver(self, resolver: Resolver | None) -> None:
+        """Set how ``related`` looks up resources."""
+        self._resolver = resolver
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the resource without its resolver and the page behind it."""
+        return type(self), (self._data,)
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the resource as a plain dictionary, like ``PCOResource``."""
+        return {
+            "id": self.id,
+            "type": self.type,
+            "attributes": dict(self._data.get("attributes") or {}),
+            "relationships": self._data.get("relationships"),
+            "links": self._data.get("links"),
+            "meta": self._data.get("meta"),
+        }
+
+    def __eq__(self, other: object) -> bool:
+        """Compare resources by their underlying data."""
+        if not isinstance(other, PCORawResource):
+            return NotImplemented
+        return self._data == other._data
+
+    def __repr__(self) -> str:
+        """Return a short representation of the resource."""
+        return f"PCORawResource(type={self.type!r}, id={self.id!r})"
+
+
+class PCORawCollection:
+    """Collection of ``PCORawResource`` views.
+
+    Only the page-level ``links`` and ``meta`` objects are validated, so the
+    collection can be paginated exactly like a ``PCOCollection``.
+    """
+
+    __slots__ = ("data", "included", "links", "meta", "_included_index")
+
+    # Wraps each resource object of a decoded document
+    resource_class: type = PCORawResource
+
+    def __init__(
+        self,
+        data: list[PCORawResource],
+        included: list[PCORawResource] | None = None,
+        links: PCOLinks | None = None,
+        meta: PCOMeta | None = None,
+    ):
+        self.data = data
+        self.included = included
+        self.links = links
+        self.meta = meta
+        # Included resources by (type, id) along with the list and length
+        # they were built from, so the index is rebuilt when they change
+        self._included_index: tuple[
+            list | None, int, dict[tuple[str, str], PCORawResource]
+        ] = (None, 0, {})
+
+        resolver = self.get_included_resource
+        bind_resolvers(data, resolver)
+        bind_resolvers(included, resolver)
+
+    @classmethod
+    def from_document(cls, document: dict[str, Any]) -> "PCORawCollection":
+        """Build a collection from a decoded JSON API document."""
+        included = document.get("included")
+        links = document.get("links")
+        meta = document.get("meta")
+        return cls(
+            data=[cls.resource_class(item) for item in document.get("data") or []],
+            included=(
+                [cls.resource_class(item) for item in included]
+                if included is not None
+                else None
+            ),
+            links=PCOLinks(**links) if links else None,
+            meta=PCOMeta(**meta) if meta else None,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of resources in the collection."""
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[PCORawResource]:
+        """Allow iteration over the resources."""
+        return iter(self.data)
+
+    def __getitem__(self, index: int) -> PCORawResource:
+        """Allow indexing into the collection."""
+        return self.data[index]
+
+    def get_included_resource(
+        self, resource_type: str, resource_id: str
+    ) -> PCORawResource | None:
+        """Get an included resource by type and ID."""
+        if not self.included:
+            return None
+
+        included = self.included
+        indexed, length, index = self._included_index
+        if indexed is not included or length != len(included):
+            index = index_resources(included)
+            self._included_index = (included, len(included), index)
+        return index.get((resource_type, resource_id))
+
+    def get_included_resources(self, resource_type: str) -> list[PCORawResource]:
+        """Get all included resources of a specific type."""
+        if not self.included:
+            return []
+
+        return [
+            resource for resource in self.included if resource.type == resource_type
+        ]
+
+    def model_dump(self) -> dict[str, Any]:
+        """Return the collection as a plain dictionary, like ``PCOCollection``."""
+        return {
+            "data": [resource.model_dump() for resource in self.data],
+            "included": (
+                [resource.model_dump() for resource in self.included]
+                if self.included is not None
+                else None
+            ),
+            "links": self.links.model_dump() if self.links else None,
+            "meta": self.meta.model_dump() if self.meta else None,
+        }
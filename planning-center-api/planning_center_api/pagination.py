@@ -0,0 +1,34 @@
+"""Helpers for keyset and time-range pagination of Planning Center resources."""
+
+from datetime import UTC, datetime
+from typing import Any
+
+
+def keyset_value(item: Any, key: str) -> Any:
+    """Get the value of a keyset pagination key for a resource."""
+    return item.id if key == "id" else item.get_attribute(key)
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp from the API."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def truncate_timestamp(value: datetime) -> datetime:
+    """Drop the fractional seconds of a timestamp."""
+    return value.replace(microsecond=0)
+
+
+def format_timestamp(value: datetime) -> str:
+    """Format a timestamp the way the API does, e.g. ``2024-01-01T00:00:00Z``."""
+    return value.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def range_params(field: str, start: Any, end: Any) -> dict[str, str]:
+    """Build ``where`` parameters for ``start <= field < end``."""
+    if isinstance(start, datetime):
+        start = format_timestamp(start)
+    if isinstance(end, datetime):
+        end = format_timestamp(end)
+    return {f"where[{field}][gte]": start, f"where[{field}][lt]": end}
@@ -1,8 +1,29 @@
 """Rate limiting for Planning Center API."""
 
 import asyncio
+import hashlib
+import sqlite3
+import tempfile
+import threading
 import time
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .config import PCOConfig
+
+T = TypeVar("T")
+
+# Headers Planning Center returns on every response to describe the
+# current rate-limit window
+RATE_LIMIT_COUNT_HEADER = "X-PCO-API-Request-Rate-Count"
+RATE_LIMIT_LIMIT_HEADER = "X-PCO-API-Request-Rate-Limit"
+RATE_LIMIT_PERIOD_HEADER = "X-PCO-API-Request-Rate-Period"
+
+DEFAULT_SHARED_RATE_LIMIT_PATH = (
+    Path(tempfile.gettempdir()) / "planning_center_rate_limit.sqlite3"
+)
 
 
 @dataclass
@@ -15,12 +36,21 @@ class RateLimitInfo:
 
 
 class PCORateLimiter:
-    """Rate limiter for Planning Center API requests."""
+    """Token-bucket rate limiter for Planning Center API requests.
+
+    The bucket holds up to ``max_requests`` tokens and refills continuously at
+    ``max_requests / window_seconds`` tokens per second. A caller that finds
+    the bucket empty reserves the next token and sleeps outside the lock, so
+    waiters are released in the order they arrived and every ``acquire`` does
+    a constant amount of bookkeeping.
+    """
+
+    _clock: Callable[[], float] = staticmethod(time.monotonic)
 
     def __init__(
         self,
         max_requests: int = 100,
-        window_seconds: int = 60,
+        window_seconds: float = 60,
         backoff_factor: float = 2.0,
         max_retries: int = 3,
     ):
@@ -29,71 +59,333 @@ class PCORateLimiter:
         self.backoff_factor = backoff_factor
         self.max_retries = max_retries
 
-        self.requests: dict[float, int] = {}  # timestamp -> count
+        self.tokens = float(max_requests)
+        self.last_refill = self._clock()
         self.lock = asyncio.Lock()
 
+    @property
+    def refill_rate(self) -> float:
+        """Tokens added to the bucket per second."""
+        return self.max_requests / self.window_seconds
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill."""
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(
+                float(self.max_requests), self.tokens + elapsed * self.refill_rate
+            )
+            self.last_refill = now
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it."""
+        self._refill(self._clock())
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.refill_rate
+
+    def _release(self) -> None:
+        """Return a reserved token that was never used."""
+        self.tokens += 1
+
+    def _adjust(
+        self,
+        max_requests: int | None = None,
+        window_seconds: float | None = None,
+        ceiling: float | None = None,
+    ) -> None:
+        """Change the bucket limits and/or cap the tokens it holds."""
+        self._refill(self._clock())
+        if max_requests and window_seconds:
+            self.max_requests = max_requests
+            self.window_seconds = window_seconds
+            self.tokens = min(self.tokens, float(max_requests))
+        if ceiling is not None:
+            self.tokens = min(self.tokens, ceiling)
+
+    def _available(self) -> float:
+        """Get the number of tokens currently in the bucket."""
+        self._refill(self._clock())
+        return self.tokens
+
+    async def _run(self, operation: Callable[[], T]) -> T:
+        """Run a bucket operation from the event loop."""
+        return operation()
+
+    async def _wait(self, wait_time: float) -> None:
+        """Sleep until a reserved token becomes available."""
+        if wait_time <= 0:
+            return
+        try:
+            await asyncio.sleep(wait_time)
+        except asyncio.CancelledError:
+            # Hand the reserved token back so it isn't lost, even if the
+            # caller is cancelled again meanwhile
+            await asyncio.shield(self._run(self._release))
+            raise
+
     async def acquire(self) -> None:
         """Acquire permission to make a request."""
         async with self.lock:
-            now = time.time()
-
-            # Clean up old entries
-            cutoff = now - self.window_seconds
-            self.requests = {
-                ts: count for ts, count in self.requests.items() if ts > cutoff
-            }
-
-            # Count current requests in window
-            current_requests = sum(self.requests.values())
-
-            if current_requests >= self.max_requests:
-                # Calculate wait time
-                oldest_request = min(self.requests.keys())
-                wait_time = self.window_seconds - (now - oldest_request)
-
-                if wait_time > 0:
-                    await asyncio.sleep(wait_time)
-                    # Clean up again after waiting
-                    now = time.time()
-                    cutoff = now - self.window_seconds
-                    self.requests = {
-                        ts: count for ts, count in self.requests.items() if ts > cutoff
-                    }
-
-            # Record this request
-            self.requests[now] = self.requests.get(now, 0) + 1
-
-    async def handle_rate_limit_error(self, retry_after: int | None = None) -> None:
-        """Handle a rate limit error by waiting."""
-        if retry_after:
+            wait_time = self._reserve()
+
+        await self._wait(wait_time)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Align the bucket with the rate-limit headers of a response.
+
+        The server's limit and period replace the configured ones, and the
+        bucket is drained down to the budget the server reports as remaining,
+        so requests made by other clients with the same credentials are
+        accounted for. The bucket is never raised above its own count, since
+        concurrent responses may arrive out of order.
+
+        On a shared bucket this blocks while another process holds the
+        database; use ``observe_headers`` from the event loop.
+        """
+        adjustment = _header_adjustment(headers)
+        if adjustment is not None:
+            self._adjust(**adjustment)
+
+    async def observe_headers(self, headers: Mapping[str, str]) -> None:
+        """Apply ``update_from_headers`` without blocking the event loop."""
+        adjustment = _header_adjustment(headers)
+        if adjustment is not None:
+            await self._run(lambda: self._adjust(**adjustment))
+
+    async def handle_rate_limit_error(
+        self, retry_after: float | None = None, attempt: int = 0
+    ) -> None:
+        """Handle a rate limit error by draining the bucket and waiting.
+
+        Args:
+            retry_after: Seconds the server asked us to wait, if any
+            attempt: Zero-based retry attempt, used for backoff when the
+                server did not send ``Retry-After``
+        """
+        await self._run(lambda: self._adjust(ceiling=0.0))
+
+        if retry_after is not None:
             await asyncio.sleep(retry_after)
         else:
-            # Exponential backoff
-            for attempt in range(self.max_retries):
-                wait_time = self.backoff_factor**attempt
-                await asyncio.sleep(wait_time)
+            await asyncio.sleep(self.backoff_factor**attempt)
+
+    def close(self) -> None:
+        """Release resources held by the limiter."""
 
     def get_rate_limit_info(self) -> RateLimitInfo:
         """Get current rate limit information."""
-        now = time.time()
-        cutoff = now - self.window_seconds
+        tokens = self._available()
 
-        # Clean up old entries
-        self.requests = {
-            ts: count for ts, count in self.requests.items() if ts > cutoff
-        }
-
-        current_requests = sum(self.requests.values())
-        requests_remaining = max(0, self.max_requests - current_requests)
-
-        # Calculate reset time
-        if self.requests:
-            oldest_request = min(self.requests.keys())
-            reset_time = oldest_request + self.window_seconds
-        else:
-            reset_time = now
+        requests_remaining = max(0, int(tokens))
+        seconds_until_full = (self.max_requests - tokens) / self.refill_rate
 
         return RateLimitInfo(
             requests_remaining=requests_remaining,
-            reset_time=reset_time,
+            reset_time=time.time() + seconds_until_full,
+        )
+
+
+class PCOSharedRateLimiter(PCORateLimiter):
+    """Token-bucket rate limiter shared by every process on a host.
+
+    The bucket state lives in a SQLite database, keyed by ``key`` so several
+    sets of credentials can share one file. Every operation runs inside a
+    ``BEGIN IMMEDIATE`` transaction, which SQLite serialises across processes
+    with a file lock, and uses wall-clock time so all processes agree on when
+    the bucket was last refilled.
+
+    The configured ``max_requests`` and ``window_seconds`` replace the limits
+    stored for ``key`` when the limiter is created; after that, limits learned
+    from response headers are shared like the tokens.
+    """
+
+    _clock: Callable[[], float] = staticmethod(time.time)
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_SHARED_RATE_LIMIT_PATH,
+        key: str = "default",
+        max_requests: int = 100,
+        window_seconds: float = 60,
+        backoff_factor: float = 2.0,
+        max_retries: int = 3,
+    ):
+        super().__init__(
+            max_requests=max_requests,
+            window_seconds=window_seconds,
+            backoff_factor=backoff_factor,
+            max_retries=max_retries,
+        )
+        self.path = Path(path)
+        self.key = key
+
+        # Operations run in worker threads, so the one connection is guarded
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        adjust = super()._adjust
+        self._transaction(lambda: adjust(max_requests, window_seconds))
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the bucket if it doesn't exist yet."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                    key TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    last_refill REAL NOT NULL,
+                    max_requests INTEGER NOT NULL,
+                    window_seconds REAL NOT NULL
+                )
+                """
+            )
+            self._connection.execute(
+                "INSERT OR IGNORE INTO rate_limit_buckets VALUES (?, ?, ?, ?, ?)",
+                (
+                    self.key,
+                    self.tokens,
+                    self.last_refill,
+                    self.max_requests,
+                    self.window_seconds,
+                ),
+            )
+        return self._connection
+
+    def _transaction(self, operation: Callable[[], T]) -> T:
+        """Run ``operation`` against the shared bucket state atomically."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT tokens, last_refill, max_requests, window_seconds "
+                    "FROM rate_limit_buckets WHERE key = ?",
+                    (self.key,),
+                ).fetchone()
+                if row:
+                    (
+                        self.tokens,
+                        self.last_refill,
+                        self.max_requests,
+                        self.window_seconds,
+                    ) = row
+
+                result = operation()
+
+                connection.execute(
+                    "INSERT OR REPLACE INTO rate_limit_buckets VALUES (?, ?, ?, ?, ?)",
+                    (
+                        self.key,
+                        self.tokens,
+                        self.last_refill,
+                        self.max_requests,
+                        self.window_seconds,
+                    ),
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            return result
+
+    def _reserve(self) -> float:
+        """Take a token from the shared bucket."""
+        return self._transaction(super()._reserve)
+
+    def _release(self) -> None:
+        """Return a reserved token to the shared bucket."""
+        self._transaction(super()._release)
+
+    def _adjust(
+        self,
+        max_requests: int | None = None,
+        window_seconds: float | None = None,
+        ceiling: float | None = None,
+    ) -> None:
+        """Change the shared bucket limits and/or cap its tokens."""
+        adjust = super()._adjust
+        self._transaction(lambda: adjust(max_requests, window_seconds, ceiling))
+
+    def _available(self) -> float:
+        """Get the number of tokens currently in the shared bucket."""
+        return self._transaction(super()._available)
+
+    async def _run(self, operation: Callable[[], T]) -> T:
+        """Run a bucket operation in a thread, since its transaction may
+        wait on another process's file lock."""
+        return await asyncio.to_thread(operation)
+
+    async def acquire(self) -> None:
+        """Acquire permission to make a request."""
+        async with self.lock:
+            wait_time = await self._run(self._reserve)
+
+        await self._wait(wait_time)
+
+    def close(self) -> None:
+        """Close the connection to the shared database; it reopens on use."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def create_rate_limiter(config: PCOConfig) -> PCORateLimiter:
+    """Create the rate limiter selected by ``config.rate_limit_backend``."""
+    if config.rate_limit_backend == "memory":
+        return PCORateLimiter(
+            max_requests=config.rate_limit_requests,
+            window_seconds=config.rate_limit_window,
+            backoff_factor=config.backoff_factor,
+            max_retries=config.max_retries,
         )
+    if config.rate_limit_backend == "sqlite":
+        return PCOSharedRateLimiter(
+            path=config.rate_limit_path or DEFAULT_SHARED_RATE_LIMIT_PATH,
+            key=_credentials_key(config),
+            max_requests=config.rate_limit_requests,
+            window_seconds=config.rate_limit_window,
+            backoff_factor=config.backoff_factor,
+            max_retries=config.max_retries,
+        )
+    raise ValueError(f"Unknown rate limit backend '{config.rate_limit_backend}'")
+
+
+def _credentials_key(config: PCOConfig) -> str:
+    """Get a shared bucket key that differs between sets of credentials."""
+    try:
+        authorization = config.get_auth_headers()["Authorization"]
+    except ValueError:
+        return "default"
+    return hashlib.sha256(authorization.encode()).hexdigest()[:16]
+
+
+def _header_adjustment(headers: Mapping[str, str]) -> dict[str, Any] | None:
+    """Get the ``_adjust`` arguments described by rate-limit headers."""
+    count = parse_numeric_header(headers, RATE_LIMIT_COUNT_HEADER)
+    limit = parse_numeric_header(headers, RATE_LIMIT_LIMIT_HEADER)
+    period = parse_numeric_header(headers, RATE_LIMIT_PERIOD_HEADER)
+
+    if not limit:
+        return None
+    return {
+        "max_requests": int(limit),
+        "window_seconds": period,
+        "ceiling": limit - count if count is not None else None,
+    }
+
+
+def parse_numeric_header(headers: Mapping[str, str], name: str) -> float | None:
+    """Parse a numeric header value, ignoring missing or malformed values."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
@@ -0,0 +1,184 @@
+"""Retry policy for Planning Center API requests."""
+
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from .config import PCOConfig
+
+# Methods that can be repeated without changing the outcome (RFC 9110)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True)
+class PCORetryRule:
+    """How responses with one status code are retried."""
+
+    max_retries: int = 3
+    # Retry only requests that are safe to repeat; off for statuses returned
+    # before the request was acted on, such as 429
+    idempotent_only: bool = True
+
+
+def _default_rules(max_retries: int) -> dict[int, PCORetryRule]:
+    return {
+        429: PCORetryRule(max_retries, idempotent_only=False),
+        502: PCORetryRule(max_retries),
+        503: PCORetryRule(max_retries),
+        504: PCORetryRule(max_retries),
+    }
+
+
+@dataclass
+class PCORetryPolicy:
+    """Decides which failed requests are retried and how long to wait first.
+
+    Waits grow exponentially from ``base_delay`` up to ``max_delay``. With
+    ``jitter`` each wait is drawn uniformly from zero up to that bound ("full
+    jitter"), so clients that failed together don't retry together. A
+    ``Retry-After`` header is honoured, up to ``max_delay``.
+
+    Statuses in ``rules`` are retried up to their own limit; by default 429,
+    502, 503 and 504 each get ``max_retries``. Network errors are retried
+    ``max_retries`` times, for any method if the connection was never made
+    and otherwise only for idempotent requests. POST and PATCH requests
+    count as idempotent only when marked so.
+
+    Every retry also has to be covered by the ``PCORetryBudget`` shared by
+    the client, so retries stay a bounded share of traffic during an outage.
+    """
+
+    max_retries: int = 3
+    base_delay: float = 1.0
+    backoff_factor: float = 2.0
+    max_delay: float = 60.0
+    jitter: bool = True
+    rules: dict[int, PCORetryRule] | None = None  # None for the default statuses
+
+    # Retry budget: retries allowed per request sent, plus a floor of
+    # retries per window so that quiet clients can still retry
+    budget_ratio: float = 0.1
+    budget_min_retries: int = 10
+    budget_window: float = 60.0
+
+    def __post_init__(self):
+        if self.rules is None:
+            self.rules = _default_rules(self.max_retries)
+
+    @classmethod
+    def from_config(cls, config: "PCOConfig") -> "PCORetryPolicy":
+        """Get ``config.retry_policy``, or a policy built from its retry fields."""
+        if config.retry_policy is not None:
+            return config.retry_policy
+        return cls(
+            max_retries=config.max_retries,
+            base_delay=config.retry_delay,
+            backoff_factor=config.backoff_factor,
+        )
+
+    def should_retry_status(
+        self, status_code: int, attempt: int, idempotent: bool
+    ) -> bool:
+        """Whether a response status should be retried.
+
+        Args:
+            status_code: Response status code
+            attempt: Retries already made for this status
+            idempotent: Whether the request is safe to repeat
+        """
+        rule = self.rules.get(status_code)
+        if rule is None or attempt >= rule.max_retries:
+            return False
+        return idempotent or not rule.idempotent_only
+
+    def should_retry_error(
+        self, error: httpx.RequestError, attempt: int, idempotent: bool
+    ) -> bool:
+        """Whether a network error should be retried.
+
+        Args:
+            error: Error raised by the transport
+            attempt: Retries already made after network errors
+            idempotent: Whether the request is safe to repeat
+        """
+        if attempt >= self.max_retries:
+            return False
+        # A request that never reached the server can always be sent again
+        never_sent = isinstance(error, httpx.ConnectError | httpx.ConnectTimeout)
+        return idempotent or never_sent
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Seconds to wait before a retry.
+
+        Args:
+            attempt: Zero-based retry attempt
+            retry_after: Seconds the server asked to wait, if any
+        """
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), self.max_delay)
+        ceiling = min(self.max_delay, self.base_delay * self.backoff_factor**attempt)
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+
+class PCORetryBudget:
+    """Client-wide cap on retries as a share of recent requests.
+
+    Over a sliding ``window``, at most ``min_retries`` plus ``ratio`` times
+    the number of requests sent may be retries. When a product fails
+    outright, callers then get errors quickly instead of every request
+    retrying and multiplying the load.
+    """
+
+    _clock: Callable[[], float] = staticmethod(time.monotonic)
+
+    def __init__(self, ratio: float = 0.1, min_retries: int = 10, window: float = 60):
+        """Initialize the retry budget.
+
+        Args:
+            ratio: Retries allowed per request sent
+            min_retries: Retries allowed per window regardless of traffic
+            window: Seconds of history considered
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    @classmethod
+    def from_policy(cls, policy: PCORetryPolicy) -> "PCORetryBudget":
+        """Create the budget described by a retry policy."""
+        return cls(
+            ratio=policy.budget_ratio,
+            min_retries=policy.budget_min_retries,
+            window=policy.budget_window,
+        )
+
+    def record_request(self) -> None:
+        """Count a first attempt at a request."""
+        now = self._clock()
+        self._prune(now)
+        self._requests.append(now)
+
+    def try_retry(self) -> bool:
+        """Spend a retry if the budget allows one."""
+        now = self._clock()
+        self._prune(now)
+        if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+            return False
+        self._retries.append(now)
+        return True
+
+    def _prune(self, now: float) -> None:
+        """Forget requests and retries older than the window."""
+        cutoff = now - self.window
+        for times in (self._requests, self._retries):
+            while times and times[0] <= cutoff:
+                times.popleft()
@@ -0,0 +1,60 @@
+"""JSON encoding and decoding for Planning Center API."""
+
+import json
+from typing import Any, TypeVar
+
+import pydantic_core
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+M = TypeVar("M", bound=BaseModel)
+
+# "pydantic" parses JSON straight into models with pydantic-core, "orjson"
+# uses the optional orjson package and "json" the standard library
+JSON_BACKENDS = ("pydantic", "orjson", "json")
+
+
+def check_json_backend(backend: str) -> None:
+    """Raise if a JSON backend is unknown or not installed."""
+    if backend not in JSON_BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend '{backend}', expected one of {JSON_BACKENDS}"
+        )
+    if backend == "orjson" and orjson is None:
+        raise ImportError(
+            "The orjson JSON backend requires orjson: "
+            "pip install 'planning-center-api[fast-json]'"
+        )
+
+
+def dumps(data: Any, backend: str = "pydantic") -> bytes:
+    """Encode data as JSON bytes."""
+    if backend == "orjson":
+        return orjson.dumps(data)
+    if backend == "pydantic":
+        return pydantic_core.to_json(data)
+    return json.dumps(data).encode()
+
+
+def loads(content: bytes | str, backend: str = "pydantic") -> Any:
+    """Decode JSON into Python objects."""
+    if backend == "orjson":
+        return orjson.loads(content)
+    if backend == "pydantic":
+        return pydantic_core.from_json(content)
+    return json.loads(content)
+
+
+def validate_json(model: type[M], content: bytes | str, backend: str = "pydantic") -> M:
+    """Decode a JSON document and validate it as ``model``.
+
+    With the pydantic backend the bytes are parsed and validated in a single
+    pass, without building an intermediate dict.
+    """
+    if backend == "pydantic":
+        return model.model_validate_json(content)
+    return model.model_validate(loads(content, backend))
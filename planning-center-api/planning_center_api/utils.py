@@ -1,13 +1,16 @@
 """Utility functions for Planning Center API."""
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import AsyncGenerator, Callable
+from concurrent.futures import Executor
 from datetime import datetime
 from decimal import Decimal
+from pathlib import Path
 from typing import Any
 
 from .client import PCOClient
 from .config import PCOProduct
+from .export import ExportSink, PCOExportCheckpoint, create_writer
 from .models.base import PCOResource
 
 
@@ -96,6 +99,128 @@ class PCOBatchProcessor:
 
         return results
 
+    async def pipeline(
+        self,
+        product: PCOProduct,
+        resource: str,
+        processor: Callable[[Any], Any],
+        workers: int = 4,
+        executor: Executor | None = None,
+        queue_size: int | None = None,
+        filter_params: dict[str, Any] | None = None,
+        include: list[str] | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Any, None]:
+        """Stream resources through ``processor`` with concurrent workers.
+
+        Fetched resources pass through a bounded queue to ``workers`` tasks,
+        so fetching pauses whenever processing falls behind, and finished
+        results are held back the same way until they are consumed.
+        Coroutine processors run concurrently on the event loop. Plain
+        callables run in ``executor`` when one is given, e.g. a
+        ``ThreadPoolExecutor``, or a ``ProcessPoolExecutor`` for CPU-bound
+        work, and otherwise run inline. A process pool needs a picklable
+        processor, and gets each resource without its page: ``related``
+        returns nothing there, so resolve what the processor needs first.
+
+        Results are yielded as they finish, so not in fetch order. The first
+        error, from fetching or processing, stops the pipeline and is raised.
+
+        Args:
+            product: Planning Center product
+            resource: Resource type
+            processor: Function or coroutine function applied to each resource
+            workers: Number of resources processed at once
+            executor: Executor for plain callables
+            queue_size: Resources waiting to be processed, and results
+                waiting to be consumed, at most (defaults to ``batch_size``)
+            filter_params: Filter parameters
+            include: Related resources to include
+            **kwargs: Additional ``paginate_all`` arguments
+
+        Yields:
+            Processor results
+        """
+        workers = max(1, workers)
+        queue_size = queue_size or self.batch_size
+        is_coroutine = asyncio.iscoroutinefunction(processor)
+        loop = asyncio.get_running_loop()
+        finished = object()
+
+        # Results travel through an unbounded queue so errors never block,
+        # with the semaphore bounding how many results can be waiting
+        items: asyncio.Queue[Any] = asyncio.Queue(maxsize=queue_size)
+        results: asyncio.Queue[Any] = asyncio.Queue()
+        slots = asyncio.Semaphore(queue_size)
+
+        async def fetch() -> None:
+            try:
+                async for item in self.client.paginate_all(
+                    product=product,
+                    resource=resource,
+                    per_page=self.batch_size,
+                    include=include,
+                    filter_params=filter_params,
+                    **kwargs,
+                ):
+                    await items.put(item)
+                for _ in range(workers):
+                    await items.put(finished)
+            except Exception as e:
+                results.put_nowait((None, e))
+
+        async def work() -> None:
+            try:
+                while (item := await items.get()) is not finished:
+                    if is_coroutine:
+                        result = await processor(item)
+                    elif executor is not None:
+                        result = await loop.run_in_executor(executor, processor, item)
+                    else:
+                        result = processor(item)
+                    await slots.acquire()
+                    results.put_nowait((result, None))
+            except Exception as e:
+                results.put_nowait((None, e))
+            finally:
+                results.put_nowait(finished)
+
+        tasks = [asyncio.create_task(fetch())]
+        tasks += [asyncio.create_task(work()) for _ in range(workers)]
+        remaining = workers
+        try:
+            while remaining:
+                entry = await results.get()
+                if entry is finished:
+                    remaining -= 1
+                    continue
+                result, error = entry
+                if error is not None:
+                    raise error
+                slots.release()
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def pipeline_people(
+        self,
+        processor: Callable[[Any], Any],
+        filter_params: dict[str, Any] | None = None,
+        include: list[str] | None = None,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Any, None]:
+        """Stream people through ``processor``; see ``pipeline``."""
+        return self.pipeline(
+            PCOProduct.PEOPLE,
+            "people",
+            processor,
+            filter_params=filter_params,
+            include=include,
+            **kwargs,
+        )
+
 
 class PCODataExporter:
     """Utility for exporting data from Planning Center."""
@@ -158,6 +283,211 @@ class PCODataExporter:
 
         return services
 
+    async def export(
+        self,
+        product: PCOProduct,
+        resource: str,
+        target: str | Path | ExportSink,
+        format: str = "ndjson",
+        compress: bool | None = None,
+        fields: list[str] | None = None,
+        filter_params: dict[str, Any] | None = None,
+        include: list[str] | None = None,
+        per_page: int | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Stream a resource type to a file or async sink as pages arrive.
+
+        Resources are read as unvalidated views and written row by row
+        through a buffer, so memory stays flat regardless of how many there
+        are.
+
+        Args:
+            product: Planning Center product
+            resource: Resource type
+            target: Output file path, or coroutine function receiving chunks
+            format: "ndjson", "csv", or "parquet" and "arrow" (which need
+                pyarrow and a file path)
+            compress: Gzip the output (defaults to whether the path ends in
+                ``.gz``; columnar formats compress internally instead)
+            fields: CSV attribute columns (defaults to the first resource's)
+            filter_params: Filter parameters
+            include: Related resources to include
+            per_page: Number of items per page
+            **kwargs: Additional ``paginate_all`` arguments
+
+        Returns:
+            Number of resources written
+        """
+        options: dict[str, Any] = {
+            "compress": compress,
+            "json_backend": self.client.config.json_backend,
+        }
+        if fields is not None:
+            options["fields"] = fields
+
+        async with create_writer(format, target, **options) as writer:
+            async for item in self.client.paginate_all(
+                product=product,
+                resource=resource,
+                per_page=per_page,
+                include=include,
+                filter_params=filter_params,
+                result_mode="raw",
+                **kwargs,
+            ):
+                await writer.write(item)
+        return writer.rows
+
+    async def export_resumable(
+        self,
+        product: PCOProduct,
+        resource: str,
+        path: str | Path,
+        format: str = "ndjson",
+        checkpoint: str | Path | None = None,
+        fields: list[str] | None = None,
+        filter_params: dict[str, Any] | None = None,
+        include: list[str] | None = None,
+        per_page: int | None = None,
+        progress: Callable[[int, int | None], Any] | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Export a resource type to a file that survives interruption.
+
+        Resources are paged by ID, and after every page the last ID, the
+        file size and the row count are saved to a checkpoint file. Run
+        again after a failure, the export cuts the file back to the last
+        checkpoint and carries on from the ID after it; on success the
+        checkpoint is removed. Output is uncompressed NDJSON or CSV so that
+        it can be continued in place.
+
+        Args:
+            product: Planning Center product
+            resource: Resource type
+            path: Output file path
+            format: "ndjson" or "csv"
+            checkpoint: Checkpoint file (defaults to the output path with
+                ``.checkpoint`` appended)
+            fields: CSV attribute columns (defaults to the first resource's)
+            filter_params: Filter parameters
+            include: Related resources to include
+            per_page: Number of items per page
+            progress: Called with the rows written so far and
+                ``meta.total_count`` at the start and after every page
+            **kwargs: Additional query parameters
+
+        Returns:
+            Number of resources in the file
+        """
+        if format not in ("ndjson", "csv"):
+            raise ValueError("Resumable exports are written as NDJSON or CSV")
+
+        path = Path(path).expanduser()
+        checkpoint = (
+            Path(checkpoint).expanduser()
+            if checkpoint
+            else path.with_name(f"{path.name}.checkpoint")
+        )
+        config = self.client.config
+        per_page = min(per_page or config.default_per_page, config.max_per_page)
+
+        state = await asyncio.to_thread(PCOExportCheckpoint.load, checkpoint)
+        if state is not None and (
+            (state.product, state.resource, state.format)
+            != (product.value, resource, format)
+            or not path.exists()
+            or path.stat().st_size < state.position
+        ):
+            # Left by a different export, or the output has gone: start over
+            state = None
+        if state is None:
+            state = PCOExportCheckpoint(product.value, resource, format)
+
+        total = await self.client.count(
+            product, resource, filter_params=filter_params, **kwargs
+        )
+        query = dict(kwargs)
+        if state.cursor is not None:
+            query["where[id][gt]"] = state.cursor
+
+        options: dict[str, Any] = {
+            "compress": False,
+            "json_backend": config.json_backend,
+            "offset": state.position,
+        }
+        if format == "csv" and (state.fields or fields):
+            options["fields"] = state.fields or fields
+
+        async with create_writer(format, path, **options) as writer:
+            writer.rows = state.rows
+            if progress is not None:
+                progress(writer.rows, total)
+
+            async for item in self.client.paginate_all(
+                product=product,
+                resource=resource,
+                per_page=per_page,
+                include=include,
+                filter_params=filter_params,
+                result_mode="raw",
+                keyset="id",
+                **query,
+            ):
+                await writer.write(item)
+                state.cursor = item.id
+                if writer.rows - state.rows >= per_page:
+                    await writer.flush()
+                    state.position = writer.position
+                    state.rows = writer.rows
+                    state.fields = getattr(writer, "fields", None)
+                    await asyncio.to_thread(state.save, checkpoint)
+                    if progress is not None:
+                        progress(writer.rows, total)
+
+        await asyncio.to_thread(checkpoint.unlink, missing_ok=True)
+        if progress is not None:
+            progress(writer.rows, total)
+        return writer.rows
+
+    async def export_people(
+        self,
+        target: str | Path | ExportSink,
+        format: str = "ndjson",
+        filter_params: dict[str, Any] | None = None,
+        include: list[str] | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Stream people to a file or async sink; see ``export``."""
+        return await self.export(
+            PCOProduct.PEOPLE,
+            "people",
+            target,
+            format=format,
+            filter_params=filter_params,
+            include=include,
+            **kwargs,
+        )
+
+    async def export_services(
+        self,
+        target: str | Path | ExportSink,
+        format: str = "ndjson",
+        filter_params: dict[str, Any] | None = None,
+        include: list[str] | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """Stream services to a file or async sink; see ``export``."""
+        return await self.export(
+            PCOProduct.SERVICES,
+            "services",
+            target,
+            format=format,
+            filter_params=filter_params,
+            include=include,
+            **kwargs,
+        )
+
 
 class PCODataValidator:
     """Utility for validating data before sending to Planning Center."""
@@ -266,30 +596,38 @@ class PCODataAnalyzer:
     async def get_people_stats(self) -> dict[str, Any]:
         """Get people statistics.
 
+        The total and active counts are read from ``meta.total_count`` with
+        two concurrent single-item requests; people are only paged through
+        if the API doesn't report counts.
+
         Returns:
             Dictionary with people statistics
         """
-        active_count = 0
-        inactive_count = 0
-        total_count = 0
-
-        async for person in self.client.paginate_all(
-            product=PCOProduct.PEOPLE,
-            resource="people",
-        ):
-            total_count += 1
-            if person.get_attribute("status") == "active":
-                active_count += 1
-            else:
-                inactive_count += 1
+        total_count, active_count = await asyncio.gather(
+            self.client.count(PCOProduct.PEOPLE, "people"),
+            self.client.count(
+                PCOProduct.PEOPLE, "people", filter_params={"status": "active"}
+            ),
+        )
+        if total_count is None or active_count is None:
+            total_count = active_count = 0
+            async for person in self.client.paginate_all(
+                product=PCOProduct.PEOPLE,
+                resource="people",
+                result_mode="raw",
+            ):
+                total_count += 1
+                if person.get_attribute("status") == "active":
+                    active_count += 1
+        inactive_count = total_count - active_count
 
         return {
             "total_people": total_count,
             "active_people": active_count,
             "inactive_people": inactive_count,
-            "active_percentage": (active_count / total_count * 100)
-            if total_count > 0
-            else 0,
+            "active_percentage": (
+                (active_count / total_count * 100) if total_count > 0 else 0
+            ),
         }
 
     async def get_services_stats(self) -> dict[str, Any]:
@@ -298,29 +636,85 @@ class PCODataAnalyzer:
         Returns:
             Dictionary with services statistics
         """
-        total_services = 0
-        total_plans = 0
-
-        async for _service in self.client.paginate_all(
-            product=PCOProduct.SERVICES,
-            resource="services",
-        ):
-            total_services += 1
-
-        async for _plan in self.client.paginate_all(
-            product=PCOProduct.SERVICES,
-            resource="plans",
-        ):
-            total_plans += 1
+        total_services, total_plans = await asyncio.gather(
+            self.count(PCOProduct.SERVICES, "services"),
+            self.count(PCOProduct.SERVICES, "plans"),
+        )
 
         return {
             "total_services": total_services,
             "total_plans": total_plans,
-            "plans_per_service": total_plans / total_services
-            if total_services > 0
-            else 0,
+            "plans_per_service": (
+                total_plans / total_services if total_services > 0 else 0
+            ),
         }
 
+    async def count(
+        self,
+        product: PCOProduct,
+        resource: str,
+        filter_params: dict[str, Any] | None = None,
+    ) -> int:
+        """Count resources from ``meta.total_count``, paging through them
+        only if the API doesn't report it.
+
+        Args:
+            product: Planning Center product
+            resource: Resource type
+            filter_params: Filter parameters
+
+        Returns:
+            Number of matching resources
+        """
+        total = await self.client.count(product, resource, filter_params=filter_params)
+        if total is not None:
+            return total
+
+        total = 0
+        async for _item in self.client.paginate_all(
+            product=product,
+            resource=resource,
+            filter_params=filter_params,
+            result_mode="raw",
+        ):
+            total += 1
+        return total
+
+    async def count_by(
+        self,
+        product: PCOProduct,
+        resource: str,
+        field: str,
+        values: list[Any],
+        filter_params: dict[str, Any] | None = None,
+    ) -> dict[Any, int]:
+        """Count resources for each value of a field, concurrently.
+
+        Each value costs one ``where[field]`` request, e.g. the people of
+        each membership type.
+
+        Args:
+            product: Planning Center product
+            resource: Resource type
+            field: Attribute to filter on
+            values: Values to count
+            filter_params: Filter parameters applied to every count
+
+        Returns:
+            Count for each value
+        """
+        counts = await asyncio.gather(
+            *(
+                self.count(
+                    product,
+                    resource,
+                    filter_params={**(filter_params or {}), field: value},
+                )
+                for value in values
+            )
+        )
+        return dict(zip(values, counts, strict=True))
+
 
 def _is_valid_email(email: str) -> bool:
     """Check if email is valid."""
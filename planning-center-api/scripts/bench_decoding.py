@@ -0,0 +1,62 @@
+"""Benchmark decoding a collection page into models with each JSON backend."""
+
+import json
+import timeit
+
+from planning_center_api.models.base import PCOCollection
+from planning_center_api.serialization import JSON_BACKENDS, orjson, validate_json
+
+PAGES = 200
+
+
+def make_page(per_page: int = 100) -> bytes:
+    """Build a people page shaped like a Planning Center response."""
+    return json.dumps(
+        {
+            "data": [
+                {
+                    "id": str(i),
+                    "type": "Person",
+                    "attributes": {
+                        "first_name": f"First {i}",
+                        "last_name": f"Last {i}",
+                        "status": "active",
+                        "birthdate": "1990-01-01",
+                        "created_at": "2023-01-01T00:00:00Z",
+                        "updated_at": "2023-01-02T00:00:00Z",
+                    },
+                    "relationships": {
+                        "primary_campus": {"data": {"type": "Campus", "id": "1"}},
+                        "households": {"data": [{"type": "Household", "id": str(i)}]},
+                    },
+                    "links": {"self": {"href": f"https://example.com/people/{i}"}},
+                }
+                for i in range(per_page)
+            ],
+            "meta": {"total_count": 40_000, "count": per_page},
+        }
+    ).encode()
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    page = make_page()
+
+    def two_pass() -> PCOCollection:
+        return PCOCollection(**json.loads(page))
+
+    timings = {"dict + PCOCollection(**data)": two_pass}
+    for backend in JSON_BACKENDS:
+        if backend == "orjson" and orjson is None:
+            continue
+        timings[f"validate_json({backend!r})"] = lambda backend=backend: validate_json(
+            PCOCollection, page, backend
+        )
+
+    for name, decode in timings.items():
+        elapsed = timeit.timeit(decode, number=PAGES)
+        print(f"{name:32} {elapsed / PAGES * 1000:7.3f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
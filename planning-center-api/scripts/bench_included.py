@@ -0,0 +1,82 @@
+"""Benchmark resolving included resources on pages with heavy includes."""
+
+import timeit
+
+from planning_center_api.models.base import PCOCollection, PCOResource
+from planning_center_api.models.identity import PCOIdentityMap
+
+INCLUDES = ("Email", "PhoneNumber", "Address")
+PER_PAGE = 100
+PAGES = 50
+
+
+def make_page(page: int) -> PCOCollection:
+    """Build a people page including emails, phone numbers, addresses and
+    the household and campus every person shares with others."""
+    start = page * PER_PAGE
+    people = []
+    included = []
+    for i in range(start, start + PER_PAGE):
+        relationships = {
+            type_: {"data": [{"type": type_, "id": str(i)}]} for type_ in INCLUDES
+        }
+        relationships["households"] = {
+            "data": [{"type": "Household", "id": str(i % 10)}]
+        }
+        people.append(
+            PCOResource(id=str(i), type="Person", relationships=relationships)
+        )
+        included.extend(
+            PCOResource(id=str(i), type=type_, attributes={"value": i})
+            for type_ in INCLUDES
+        )
+    included.extend(PCOResource(id=str(i), type="Household") for i in range(10))
+    included.append(PCOResource(id="1", type="Campus"))
+    return PCOCollection(data=people, included=included)
+
+
+def resolve_linear(page: PCOCollection) -> int:
+    """Resolve every include of every row by scanning ``included``."""
+    found = 0
+    for person in page.data:
+        for type_ in INCLUDES:
+            for resource in page.included:
+                if resource.type == type_ and resource.id == person.id:
+                    found += 1
+                    break
+    return found
+
+
+def resolve_indexed(page: PCOCollection) -> int:
+    """Resolve every include of every row through the collection index."""
+    found = 0
+    for person in page.data:
+        for type_ in INCLUDES:
+            if page.get_included_resource(type_, person.id) is not None:
+                found += 1
+    return found
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    pages = [make_page(page) for page in range(PAGES)]
+
+    for name, resolve in (
+        ("linear scan", resolve_linear),
+        ("indexed", resolve_indexed),
+    ):
+        elapsed = timeit.timeit(
+            lambda resolve=resolve: [resolve(page) for page in pages], number=1
+        )
+        print(f"{name:12} {elapsed / PAGES * 1000:7.3f} ms/page")
+
+    identity_map = PCOIdentityMap()
+    before = sum(len(page.included) for page in pages)
+    for page in pages:
+        identity_map.add_included(page)
+    shared = len({id(r) for page in pages for r in page.included})
+    print(f"included instances: {before} across pages, {shared} with identity map")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Measure the memory needed to hold a large directory in each result mode."""
+
+import gc
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable
+
+from planning_center_api.models.base import PCOCollection
+from planning_center_api.models.compact import PCOCompactCollection
+from planning_center_api.models.raw import PCORawCollection
+from planning_center_api.serialization import loads, validate_json
+
+PER_PAGE = 100
+
+
+def make_page(page: int) -> bytes:
+    """Build a people page with includes, shaped like a Planning Center response."""
+    start = page * PER_PAGE
+    return json.dumps(
+        {
+            "data": [
+                {
+                    "id": str(i),
+                    "type": "Person",
+                    "attributes": {
+                        "first_name": f"First {i}",
+                        "last_name": f"Last {i}",
+                        "status": "active",
+                        "gender": "F" if i % 2 else "M",
+                        "birthdate": "1990-01-01",
+                        "membership": "Member",
+                        "created_at": "2023-01-01T00:00:00Z",
+                        "updated_at": "2023-01-02T00:00:00Z",
+                    },
+                    "relationships": {
+                        "primary_campus": {"data": {"type": "Campus", "id": "1"}},
+                        "emails": {"data": [{"type": "Email", "id": str(i)}]},
+                    },
+                    "links": {"self": {"href": f"https://example.com/people/{i}"}},
+                }
+                for i in range(start, start + PER_PAGE)
+            ],
+            "included": [
+                {
+                    "id": str(i),
+                    "type": "Email",
+                    "attributes": {
+                        "address": f"person{i}@example.com",
+                        "location": "Home",
+                        "primary": True,
+                    },
+                }
+                for i in range(start, start + PER_PAGE)
+            ],
+            "meta": {"total_count": PER_PAGE, "count": PER_PAGE},
+        }
+    ).encode()
+
+
+def measure(decode: Callable[[bytes], object], pages: int) -> int:
+    """Decode ``pages`` pages, keep them all and return the bytes retained."""
+    gc.collect()
+    tracemalloc.start()
+    kept = [decode(make_page(page)) for page in range(pages)]
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return retained
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    people = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    pages = people // PER_PAGE
+
+    modes = {
+        "model": lambda page: validate_json(PCOCollection, page),
+        "raw": lambda page: PCORawCollection.from_document(loads(page)),
+        "compact": lambda page: PCOCompactCollection.from_document(loads(page)),
+    }
+
+    print(f"{people} people with one included email each")
+    for name, decode in modes.items():
+        retained = measure(decode, pages)
+        print(
+            f"{name:8} {retained / 2**20:8.1f} MiB "
+            f"{retained / (pages * PER_PAGE * 2):6.0f} B/resource"
+        )
+
+
+if __name__ == "__main__":
+    main()
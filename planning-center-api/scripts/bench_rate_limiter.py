@@ -0,0 +1,58 @@
+"""Microbenchmark for PCORateLimiter.acquire with many concurrent waiters."""
+
+import asyncio
+import time
+
+from planning_center_api.rate_limiter import PCORateLimiter
+
+WAITERS = 1_000
+
+
+async def bench_uncontended() -> float:
+    """Time 1k concurrent acquires that never have to wait."""
+    limiter = PCORateLimiter(max_requests=WAITERS, window_seconds=60)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(limiter.acquire() for _ in range(WAITERS)))
+    return time.perf_counter() - start
+
+
+async def bench_saturated() -> tuple[float, float]:
+    """Time 1k concurrent acquires against a bucket refilling at 2k/s.
+
+    Returns the total elapsed time and the mean lateness of each waiter
+    relative to the moment its token became available.
+    """
+    rate = 2_000
+    limiter = PCORateLimiter(max_requests=1, window_seconds=1 / rate)
+    await limiter.acquire()
+
+    lateness: list[float] = []
+    start = time.perf_counter()
+
+    async def waiter(index: int) -> None:
+        await limiter.acquire()
+        due = start + (index + 1) / rate
+        lateness.append(max(0.0, time.perf_counter() - due))
+
+    await asyncio.gather(*(waiter(i) for i in range(WAITERS)))
+    return time.perf_counter() - start, sum(lateness) / len(lateness)
+
+
+async def main() -> None:
+    """Run the benchmarks and print a summary."""
+    elapsed = await bench_uncontended()
+    print(
+        f"uncontended: {WAITERS} waiters in {elapsed * 1000:.2f} ms "
+        f"({elapsed / WAITERS * 1e6:.2f} us/acquire)"
+    )
+
+    elapsed, mean_lateness = await bench_saturated()
+    print(
+        f"saturated:   {WAITERS} waiters in {elapsed * 1000:.2f} ms "
+        f"(ideal 500.00 ms, mean lateness {mean_lateness * 1000:.3f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,27 @@
+"""Benchmark decoding a collection page as validated models and raw views."""
+
+import timeit
+
+from bench_decoding import PAGES, make_page
+
+from planning_center_api.models.base import PCOCollection
+from planning_center_api.models.raw import PCORawCollection
+from planning_center_api.serialization import loads, validate_json
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    page = make_page()
+
+    timings = {
+        "model": lambda: validate_json(PCOCollection, page),
+        "raw": lambda: PCORawCollection.from_document(loads(page)),
+    }
+
+    for name, decode in timings.items():
+        elapsed = timeit.timeit(decode, number=PAGES)
+        print(f"{name:8} {elapsed / PAGES * 1000:7.3f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Unit tests for response caching."""
+
+from unittest.mock import patch
+
+import httpx
+
+from planning_center_api.cache import PCOHttpCache, PCOResponseCache
+
+URL = "https://api.planningcenteronline.com/services/v2/service_types"
+
+
+class TestPCOResponseCache:
+    """Test PCOResponseCache class."""
+
+    def test_hit_and_miss(self):
+        """Test storing and reading back a body."""
+        cache = PCOResponseCache()
+
+        assert cache.get(URL) is None
+        cache.set(URL, b"{}", ttl=60)
+
+        assert cache.get(URL) == b"{}"
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_expiry(self):
+        """Test that entries expire after their TTL."""
+        cache = PCOResponseCache()
+
+        with patch("planning_center_api.cache.time.monotonic", return_value=100.0):
+            cache.set(URL, b"{}", ttl=10)
+        with patch("planning_center_api.cache.time.monotonic", return_value=111.0):
+            assert cache.get(URL) is None
+
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_lru_eviction_by_size(self):
+        """Test that the least recently used entries go first."""
+        cache = PCOResponseCache(max_bytes=10)
+        cache.set("a", b"1234", ttl=60)
+        cache.set("b", b"1234", ttl=60)
+        cache.get("a")
+
+        cache.set("c", b"1234", ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1234"
+        assert cache.get("c") == b"1234"
+        assert cache.stats.evictions == 1
+        assert cache.size == 8
+
+    def test_zero_ttl_and_oversized_bodies_are_not_stored(self):
+        """Test that uncacheable bodies are skipped."""
+        cache = PCOResponseCache(max_bytes=4)
+
+        cache.set("a", b"12", ttl=0)
+        cache.set("b", b"12345", ttl=60)
+
+        assert len(cache) == 0
+
+    def test_ttl_for(self):
+        """Test per-endpoint TTL lookup."""
+        cache = PCOResponseCache(default_ttl=5, ttls={"service_types": 600})
+
+        assert cache.ttl_for("service_types") == 600
+        assert cache.ttl_for("service_types/1/plans") == 600
+        assert cache.ttl_for("people") == 5
+
+    def test_invalidate_prefix(self):
+        """Test invalidating a collection and everything beneath it."""
+        cache = PCOResponseCache()
+        cache.set(URL, b"1", ttl=60)
+        cache.set(f"{URL}?per_page=25", b"2", ttl=60)
+        cache.set(f"{URL}/1", b"3", ttl=60)
+        cache.set(f"{URL}_other", b"4", ttl=60)
+
+        removed = cache.invalidate(URL)
+
+        assert removed == 3
+        assert cache.get(f"{URL}_other") == b"4"
+        assert cache.stats.invalidations == 3
+
+    def test_stale_generation_is_not_stored(self):
+        """Test that a fetch started before an invalidation isn't cached."""
+        cache = PCOResponseCache()
+        generation = cache.generation
+
+        cache.invalidate(URL)
+        cache.set(URL, b"stale", ttl=60, generation=generation)
+
+        assert cache.get(URL) is None
+
+
+class TestPCOHttpCache:
+    """Test PCOHttpCache class."""
+
+    @staticmethod
+    def response(content: bytes = b'{"data": []}', **headers: str) -> httpx.Response:
+        """Build a response with the given headers."""
+        return httpx.Response(200, content=content, headers=headers)
+
+    def test_store_and_get(self, tmp_path):
+        """Test that bodies and validators survive a reopen."""
+        cache = PCOHttpCache(tmp_path / "http.sqlite3")
+        key = cache.make_key(URL, "Bearer token")
+        cache.store(key, URL, self.response(etag='"v1"'))
+        cache.close()
+
+        cached = PCOHttpCache(tmp_path / "http.sqlite3").get(key)
+
+        assert cached.content == b'{"data": []}'
+        assert cached.validators() == {"If-None-Match": '"v1"'}
+        assert not cached.is_fresh()
+
+    def test_body_is_compressed(self, tmp_path):
+        """Test that bodies are stored compressed."""
+        cache = PCOHttpCache(tmp_path / "http.sqlite3")
+        body = b'{"data": [' + b'{"id": "1"},' * 1000 + b"]}"
+        cache.store("key", URL, self.response(body, etag='"v1"'))
+
+        (stored,) = cache._connection.execute("SELECT body FROM http_cache").fetchone()
+
+        assert len(stored) < len(body) / 10
+        assert cache.get("key").content == body
+
+    def test_close_reopens_on_use(self, tmp_path):
+        """Test that a closed cache reconnects on its next operation."""
+        cache = PCOHttpCache(tmp_path / "http.sqlite3", ttl=60)
+        cache.store("key", URL, self.response())
+        cache.close()
+
+        assert cache._connection is None
+        assert cache.get("key") is not None
+
+    def test_unvalidated_response_needs_ttl(self, tmp_path):
+        """Test that responses without validators are only kept with a TTL."""
+        without_ttl = PCOHttpCache(tmp_path / "a.sqlite3")
+        with_ttl = PCOHttpCache(tmp_path / "b.sqlite3", ttl=60)
+
+        assert not without_ttl.store("key", URL, self.response())
+        assert with_ttl.store("key", URL, self.response())
+        assert with_ttl.get("key").is_fresh()
+
+    def test_keys_are_namespaced_by_credentials(self):
+        """Test that different credentials produce different keys."""
+        assert PCOHttpCache.make_key(URL, "Bearer a") != PCOHttpCache.make_key(
+            URL, "Bearer b"
+        )
+
+    def test_invalidate_prefix(self, tmp_path):
+        """Test invalidating a collection and everything beneath it."""
+        cache = PCOHttpCache(tmp_path / "http.sqlite3", ttl=60)
+        for url in (URL, f"{URL}?per_page=25", f"{URL}/1", f"{URL}_other"):
+            cache.store(url, url, self.response())
+
+        assert cache.invalidate(URL) == 3
+        assert cache.get(f"{URL}_other") is not None
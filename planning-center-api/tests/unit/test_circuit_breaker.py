@@ -0,0 +1,88 @@
+"""Unit tests for circuit breakers."""
+
+import pytest
+
+from planning_center_api.circuit_breaker import PCOCircuitBreaker, PCOCircuitState
+from planning_center_api.exceptions import PCOCircuitOpenError
+
+
+class TestPCOCircuitBreaker:
+    """Test PCOCircuitBreaker class."""
+
+    @pytest.fixture
+    def events(self):
+        """Collect state changes."""
+        return []
+
+    @pytest.fixture
+    def breaker(self, events):
+        """Create a breaker with a controllable clock."""
+        breaker = PCOCircuitBreaker(
+            "giving/v2",
+            failure_threshold=3,
+            recovery_timeout=30.0,
+            listener=events.append,
+        )
+        breaker.now = 0.0
+        breaker._clock = lambda: breaker.now
+        return breaker
+
+    def test_opens_after_consecutive_failures(self, breaker, events):
+        """Test that only consecutive failures open the circuit."""
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state is PCOCircuitState.CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state is PCOCircuitState.OPEN
+        breaker.now = 10.0
+        with pytest.raises(PCOCircuitOpenError) as exc_info:
+            breaker.before_request()
+        assert exc_info.value.key == "giving/v2"
+        assert exc_info.value.retry_after == 20.0
+        assert [(e.previous, e.state, e.failures) for e in events] == [
+            (PCOCircuitState.CLOSED, PCOCircuitState.OPEN, 3)
+        ]
+
+    def test_half_open_trial_closes_or_reopens(self, breaker, events):
+        """Test that one trial request decides the half-open circuit."""
+        for _ in range(3):
+            breaker.record_failure()
+        breaker.now = 30.0
+
+        breaker.before_request()
+        assert breaker.state is PCOCircuitState.HALF_OPEN
+        with pytest.raises(PCOCircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_failure()
+        assert breaker.state is PCOCircuitState.OPEN
+
+        breaker.now = 60.0
+        breaker.before_request()
+        breaker.record_success()
+
+        assert breaker.state is PCOCircuitState.CLOSED
+        assert [event.state for event in events] == [
+            PCOCircuitState.OPEN,
+            PCOCircuitState.HALF_OPEN,
+            PCOCircuitState.OPEN,
+            PCOCircuitState.HALF_OPEN,
+            PCOCircuitState.CLOSED,
+        ]
+
+    def test_abandoned_trial_frees_its_slot(self, breaker):
+        """Test that a cancelled trial request lets another one through."""
+        for _ in range(3):
+            breaker.record_failure()
+        breaker.now = 30.0
+
+        breaker.before_request()
+        breaker.record_abandoned()
+        breaker.before_request()
+
+        assert breaker.state is PCOCircuitState.HALF_OPEN
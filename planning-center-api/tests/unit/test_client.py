@@ -7,6 +7,15 @@ import pytest
 from planning_center_api import PCOClient, PCOProduct
 from planning_center_api.config import PCOConfig
 from planning_center_api.models.base import PCOCollection, PCOResource
+from planning_center_api.models.compact import PCOCompactCollection
+from planning_center_api.models.identity import PCOIdentityMap
+from planning_center_api.models.raw import PCORawCollection
+
+COLLECTION_DECODERS = {
+    "model": PCOCollection.model_validate,
+    "raw": PCORawCollection.from_document,
+    "compact": PCOCompactCollection.from_document,
+}
 
 
 class TestPCOClient:
@@ -223,6 +232,453 @@ class TestPCOClient:
             assert results[1].id == "2"
             assert results[2].id == "3"
 
+    @pytest.mark.asyncio
+    async def test_paginate_all_prefetch(self, client):
+        """Test prefetching pages concurrently while preserving order."""
+        import asyncio
+
+        in_flight = 0
+        max_in_flight = 0
+        offsets = []
+
+        async def mock_get(**kwargs):
+            nonlocal in_flight, max_in_flight
+            offset = kwargs["offset"]
+            offsets.append(offset)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later pages finish first to prove ordering is preserved
+            await asyncio.sleep(0.01 * (10 - offset // 2))
+            in_flight -= 1
+            return PCOCollection(
+                data=[
+                    PCOResource(id=str(offset + i), type="people")
+                    for i in range(2)
+                    if offset + i < 9
+                ],
+                meta={"total_count": 9},
+            )
+
+        with patch.object(client, "_ensure_client") as mock_ensure_client:
+            mock_http_client = AsyncMock()
+            mock_http_client.get = AsyncMock(side_effect=mock_get)
+            mock_ensure_client.return_value = mock_http_client
+
+            results = [
+                resource.id
+                async for resource in client.paginate_all(
+                    product=PCOProduct.PEOPLE,
+                    resource="people",
+                    per_page=2,
+                    max_concurrent_pages=3,
+                )
+            ]
+
+        assert results == [str(i) for i in range(9)]
+        assert sorted(offsets) == [0, 2, 4, 6, 8]
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_paginate_all_raw(self, client):
+        """Test paginating raw collections."""
+
+        async def mock_get(**kwargs):
+            assert kwargs["result_mode"] == "raw"
+            offset = kwargs["offset"]
+            return PCORawCollection.from_document(
+                {
+                    "data": [
+                        {"id": str(offset + i), "type": "Person"}
+                        for i in range(2)
+                        if offset + i < 3
+                    ],
+                    "meta": {"total_count": 3},
+                }
+            )
+
+        with patch.object(client, "_ensure_client") as mock_ensure_client:
+            mock_http_client = AsyncMock()
+            mock_http_client.get = AsyncMock(side_effect=mock_get)
+            mock_ensure_client.return_value = mock_http_client
+
+            results = [
+                resource.id
+                async for resource in client.paginate_all(
+                    product=PCOProduct.PEOPLE,
+                    resource="people",
+                    per_page=2,
+                    max_concurrent_pages=2,
+                    result_mode="raw",
+                )
+            ]
+
+        assert results == ["0", "1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_paginate_all_identity_map(self, client):
+        """Test sharing included resources across pages."""
+
+        async def mock_get(**kwargs):
+            offset = kwargs["offset"]
+            return PCOCollection(
+                data=[PCOResource(id=str(offset), type="Person")] if offset < 2 else [],
+                included=[PCOResource(id="1", type="Campus")],
+                links={"next": {"href": "next"}} if offset < 2 else None,
+            )
+
+        identity_map = PCOIdentityMap()
+        with patch.object(client, "_ensure_client") as mock_ensure_client:
+            mock_http_client = AsyncMock()
+            mock_http_client.get = AsyncMock(side_effect=mock_get)
+            mock_ensure_client.return_value = mock_http_client
+
+            results = [
+                resource.id
+                async for resource in client.paginate_all(
+                    product=PCOProduct.PEOPLE,
+                    resource="people",
+                    per_page=1,
+                    identity_map=identity_map,
+                )
+            ]
+
+        assert results == ["0", "1"]
+        assert len(identity_map) == 1
+
+    @pytest.mark.asyncio
+    async def test_paginate_all_keyset_id(self, client):
+        """Test seeking pages by the last ID instead of an offset."""
+        requests = []
+
+        async def mock_get(**kwargs):
+            requests.append(kwargs)
+            after = int(kwargs.get("where[id][gt]", 0))
+            return PCOCollection(
+                data=[
+                    PCOResource(id=str(i), type="Person")
+                    for i in range(after + 1, min(after + 3, 6))
+                ]
+            )
+
+        with patch.object(client, "_ensure_client") as mock_ensure_client:
+            mock_http_client = AsyncMock()
+            mock_http_client.get = AsyncMock(side_effect=mock_get)
+            mock_ensure_client.return_value = mock_http_client
+
+            results = [
+                resource.id
+                async for resource in client.paginate_all(
+                    product=PCOProduct.PEOPLE,
+                    resource="people",
+                    per_page=2,
+                    keyset="id",
+                )
+            ]
+
+        assert results == ["1", "2", "3", "4", "5"]
+        assert [request.get("where[id][gt]") for request in requests] == [
+            None,
+            "2",
+            "4",
+        ]
+        assert all(request["sort"] == "id" for request in requests)
+        assert all(request["offset"] is None for request in requests)
+
+    @pytest.mark.asyncio
+    async def test_paginate_all_keyset_repeated_values(self, client):
+        """Test keyset pages skip repeats and fall back to links.next on ties."""
+        rows = [("1", "a"), ("2", "b"), ("3", "b"), ("4", "b"), ("5", "c")]
+
+        async def mock_get(**kwargs):
+            since = kwargs.get("where[updated_at][gte]", "")
+            offset = kwargs["offset"] or 0
+            matching = [row for row in rows if row[1] >= since]
+            page = matching[offset : offset + 2]
+            return PCOCollection(
+                data=[
+                    PCOResource(id=id_, type="Person", attributes={"updated_at": at})
+                    for id_, at in page
+                ],
+                links=(
+                    {"next": {"href": "next"}} if offset + 2 < len(matching) else None
+                ),
+            )
+
+        with patch.object(client, "_ensure_client") as mock_ensure_client:
+            mock_http_client = AsyncMock()
+            mock_http_client.get = AsyncMock(side_effect=mock_get)
+            mock_ensure_client.return_value = mock_http_client
+
+            results = [
+                resource.id
+                async for resource in client.paginate_all(
+                    product=PCOProduct.PEOPLE,
+                    resource="people",
+                    per_page=2,
+                    keyset="updated_at",
+                )
+            ]
+
+        assert results == ["1", "2", "3", "4", "5"]
+
+    @pytest.mark.asyncio
+    async def test_parallel_scan(self, client):
+        """Test scanning balanced time ranges concurrently."""
+        # Most records fall in the first hour, a few spread over a day
+        stamps = [
+            f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}Z" for i in range(0, 1200, 3)
+        ]
+        stamps += [f"2024-01-01T{h:02d}:30:00Z" for h in range(1, 24)]
+        rows = [(str(i), stamp) for i, stamp in enumerate(stamps)]
+        scanned_ranges = set()
+
+        async def mock_get(**kwargs):
+            start = kwargs.get("where[created_at][gte]", "")
+            end = kwargs.get("where[created_at][lt]", "~")
+            matching = sorted(
+                (row for row in rows if start <= row[1] < end),
+                key=lambda row: row[1],
+                reverse=kwargs["sort"].startswith("-"),
+            )
+            offset = kwargs["offset"] or 0
+            per_page = kwargs["per_page"]
+            if kwargs.get("result_mode") == "model":
+                scanned_ranges.add((start, end))
+            return PCOCollection(
+                data=[
+                    PCOResource(id=id_, type="Donation", attributes={"created_at": at})
+                    for id_, at in matching[offset : offset + per_page]
+                ],
+                meta={"total_count": len(matching)},
+                links=(
+                    {"next": {"href": "next"}}
+                    if offset + per_page < len(matching)
+                    else None
+                ),
+            )
+
+        with patch.object(client, "_ensure_client") as mock_ensure_client:
+            mock_http_client = AsyncMock()
+            mock_http_client.get = AsyncMock(side_effect=mock_get)
+            mock_ensure_client.return_value = mock_http_client
+
+            results = [
+                resource.id
+                async for resource in client.parallel_scan(
+                    product=PCOProduct.GIVING,
+                    resource="donations",
+                    partitions=4,
+                    per_page=25,
+                )
+            ]
+
+        assert sorted(results, key=int) == [row[0] for row in rows]
+        assert len(scanned_ranges) == 4
+        counts = [
+            sum(start <= row[1] < end for row in rows) for start, end in scanned_ranges
+        ]
+        assert max(counts) <= 2 * min(counts)
+
+    @pytest.mark.asyncio
+    async def test_paginate_all_keyset_with_sort(self, client):
+        """Test keyset pagination rejects a separate sort order."""
+        with pytest.raises(ValueError, match="Keyset"):
+            async for _ in client.paginate_all(
+                product=PCOProduct.PEOPLE,
+                resource="people",
+                keyset="id",
+                sort="last_name",
+            ):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_count(self, client):
+        """Test counting with a single-item page."""
+        with patch.object(client, "_ensure_client") as mock_ensure_client:
+            mock_http_client = AsyncMock()
+            mock_http_client.get.return_value = PCORawCollection.from_document(
+                {"data": [], "meta": {"total_count": 42}}
+            )
+            mock_ensure_client.return_value = mock_http_client
+
+            count = await client.count(
+                PCOProduct.PEOPLE, "people", filter_params={"status": "active"}
+            )
+
+        assert count == 42
+        kwargs = mock_http_client.get.call_args.kwargs
+        assert kwargs["per_page"] == 1
+        assert kwargs["filter_params"] == {"status": "active"}
+
+    @pytest.mark.asyncio
+    async def test_fetch_related(self, client):
+        """Test fetching only the related resources that weren't included."""
+        collection = PCOCollection(
+            data=[
+                {
+                    "id": str(i),
+                    "type": "Person",
+                    "relationships": {
+                        "phone_numbers": {
+                            "data": [
+                                {"type": "PhoneNumber", "id": str(i)},
+                                {"type": "PhoneNumber", "id": str(i + 10)},
+                            ]
+                        }
+                    },
+                }
+                for i in range(3)
+            ],
+            included=[{"id": "0", "type": "PhoneNumber"}],
+        )
+
+        with patch.object(client, "_ensure_client") as mock_ensure_client:
+            mock_http_client = AsyncMock()
+            mock_http_client.get.return_value = PCOCollection(
+                data=[
+                    PCOResource(id=i, type="PhoneNumber")
+                    for i in ("1", "2", "10", "11", "12")
+                ]
+            )
+            mock_ensure_client.return_value = mock_http_client
+
+            results = await client.fetch_related(
+                PCOProduct.PEOPLE, collection.data, "phone_numbers"
+            )
+
+        mock_http_client.get.assert_awaited_once()
+        call = mock_http_client.get.call_args.kwargs
+        assert call["endpoint"] == "phone_numbers"
+        assert call["filter_params"] == {"id": ["1", "10", "11", "12", "2"]}
+        assert [[phone.id for phone in phones] for phones in results] == [
+            ["0", "10"],
+            ["1", "11"],
+            ["2", "12"],
+        ]
+        assert collection[1].related("phone_numbers")[0].id == "1"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("result_mode", ["model", "raw", "compact"])
+    async def test_fetch_related_batches_linked_resources(self, client, result_mode):
+        """Test that a links.related URL doesn't cost a request per resource."""
+        base = "https://api.planningcenteronline.com/people/v2"
+        document = {
+            "data": [
+                {
+                    "id": str(i),
+                    "type": "Person",
+                    "relationships": {
+                        "households": {
+                            "data": [{"type": "Household", "id": f"h{i}"}],
+                            "links": {"related": f"{base}/people/{i}/households"},
+                        }
+                    },
+                }
+                for i in range(2)
+            ]
+        }
+        people = COLLECTION_DECODERS[result_mode](document)
+
+        async def mock_get(**kwargs):
+            ids = kwargs["filter_params"]["id"]
+            return PCOCollection(
+                data=[PCOResource(id=i, type="Household") for i in ids]
+            )
+
+        with patch.object(client, "_ensure_client") as mock_ensure_client:
+            mock_http_client = AsyncMock()
+            mock_http_client.get = AsyncMock(side_effect=mock_get)
+            mock_ensure_client.return_value = mock_http_client
+
+            results = await client.fetch_related(
+                PCOProduct.PEOPLE, people.data, "households"
+            )
+
+        mock_http_client.get.assert_awaited_once()
+        call = mock_http_client.get.await_args.kwargs
+        assert call["endpoint"] == "households"
+        assert call["filter_params"] == {"id": ["h0", "h1"]}
+        assert [[household.id for household in h] for h in results] == [["h0"], ["h1"]]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("result_mode", ["model", "raw", "compact"])
+    async def test_fetch_related_follows_links_without_data(self, client, result_mode):
+        """Test opting in to links.related for relationships sent without data."""
+        base = "https://api.planningcenteronline.com/people/v2"
+        document = {
+            "data": [
+                {
+                    "id": str(i),
+                    "type": "Person",
+                    "relationships": {
+                        "households": {
+                            "links": {
+                                "related": {"href": f"{base}/people/{i}/households"}
+                            }
+                        }
+                    },
+                }
+                for i in range(2)
+            ]
+        }
+        people = COLLECTION_DECODERS[result_mode](document)
+
+        async def mock_get(**kwargs):
+            person_id = kwargs["endpoint"].split("/")[1]
+            return PCOCollection(
+                data=[PCOResource(id=f"h{person_id}", type="Household")]
+            )
+
+        with patch.object(client, "_ensure_client") as mock_ensure_client:
+            mock_http_client = AsyncMock()
+            mock_http_client.get = AsyncMock(side_effect=mock_get)
+            mock_ensure_client.return_value = mock_http_client
+
+            unfollowed = await client.fetch_related(
+                PCOProduct.PEOPLE, people.data, "households"
+            )
+            mock_http_client.get.assert_not_awaited()
+
+            results = await client.fetch_related(
+                PCOProduct.PEOPLE, people.data, "households", follow_links=True
+            )
+
+        assert unfollowed == [None, None]
+        endpoints = sorted(
+            call.kwargs["endpoint"] for call in mock_http_client.get.await_args_list
+        )
+        assert endpoints == ["people/0/households", "people/1/households"]
+        assert mock_http_client.get.await_args.kwargs["product"] == "people"
+        assert [[household.id for household in h] for h in results] == [["h0"], ["h1"]]
+
+    @pytest.mark.asyncio
+    async def test_get_many_and_load_share_requests(self, client):
+        """Test that concurrent loads and get_many calls are batched."""
+        import asyncio
+
+        async def mock_get(**kwargs):
+            ids = kwargs["filter_params"]["id"]
+            return PCOCollection(
+                data=[PCOResource(id=i, type="Person") for i in ids if i != "9"]
+            )
+
+        with patch.object(client, "_ensure_client") as mock_ensure_client:
+            mock_http_client = AsyncMock()
+            mock_http_client.get = AsyncMock(side_effect=mock_get)
+            mock_ensure_client.return_value = mock_http_client
+
+            person, people = await asyncio.gather(
+                client.load(PCOProduct.PEOPLE, "people", "1"),
+                client.get_many(PCOProduct.PEOPLE, "people", ["2", "9", "1"]),
+            )
+
+        mock_http_client.get.assert_awaited_once()
+        call = mock_http_client.get.call_args.kwargs
+        assert call["filter_params"] == {"id": ["1", "2", "9"]}
+        assert call["per_page"] == 3
+        assert person.id == "1"
+        assert [p.id if p else None for p in people] == ["2", None, "1"]
+
     @pytest.mark.asyncio
     async def test_get_people(self, client):
         """Test getting people."""
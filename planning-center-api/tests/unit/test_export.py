@@ -0,0 +1,253 @@
+"""Unit tests for streaming export writers."""
+
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from planning_center_api.export import (
+    PCOColumnarWriter,
+    PCOCSVWriter,
+    PCOExportWriter,
+    PCONDJSONWriter,
+    create_writer,
+)
+from planning_center_api.models.base import PCOResource
+from planning_center_api.models.raw import PCORawResource
+
+PEOPLE = [
+    PCOResource(
+        id=str(i),
+        type="Person",
+        attributes={"first_name": f"Person {i}", "tags": ["a", "b"], "nickname": None},
+    )
+    for i in range(50)
+]
+
+
+class TestPCONDJSONWriter:
+    """Test PCONDJSONWriter class."""
+
+    @pytest.mark.asyncio
+    async def test_writes_one_line_per_resource(self, tmp_path):
+        """Test writing NDJSON to a file."""
+        path = tmp_path / "people.ndjson"
+        async with PCONDJSONWriter(path) as writer:
+            for person in PEOPLE:
+                await writer.write(person)
+
+        lines = path.read_text().splitlines()
+        assert writer.rows == 50
+        assert len(lines) == 50
+        assert json.loads(lines[3])["attributes"]["first_name"] == "Person 3"
+
+    @pytest.mark.asyncio
+    async def test_gzip_by_suffix(self, tmp_path):
+        """Test that a .gz path is compressed."""
+        path = tmp_path / "people.ndjson.gz"
+        async with PCONDJSONWriter(path, buffer_size=100) as writer:
+            for person in PEOPLE:
+                await writer.write(person)
+
+        lines = gzip.decompress(path.read_bytes()).decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [p.id for p in PEOPLE]
+
+    @pytest.mark.asyncio
+    async def test_async_sink_receives_buffered_chunks(self):
+        """Test streaming to an async sink in buffer-sized chunks."""
+        chunks = []
+
+        async def sink(chunk):
+            chunks.append(chunk)
+
+        async with PCONDJSONWriter(sink, buffer_size=1000) as writer:
+            for person in PEOPLE:
+                await writer.write(person)
+
+        assert len(chunks) > 2
+        assert all(len(chunk) < 2000 for chunk in chunks)
+        assert len(b"".join(chunks).splitlines()) == 50
+
+    @pytest.mark.asyncio
+    async def test_continues_at_offset(self, tmp_path):
+        """Test cutting a file off at an offset and writing after it."""
+        path = tmp_path / "people.ndjson"
+        async with PCONDJSONWriter(path) as writer:
+            for person in PEOPLE[:3]:
+                await writer.write(person)
+                await writer.flush()
+                if person.id == "1":
+                    offset = writer.position
+
+        async with PCONDJSONWriter(path, offset=offset) as writer:
+            await writer.write(PEOPLE[5])
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["0", "1", "5"]
+        assert writer.position == path.stat().st_size
+
+    @pytest.mark.asyncio
+    async def test_empty_export_creates_file(self, tmp_path):
+        """Test that an export without rows still leaves an empty file."""
+        path = tmp_path / "people.ndjson"
+        async with PCONDJSONWriter(path):
+            pass
+
+        assert path.read_bytes() == b""
+
+    def test_offset_requires_uncompressed_file(self, tmp_path):
+        """Test rejecting an offset into a compressed file."""
+        with pytest.raises(ValueError, match="uncompressed"):
+            PCONDJSONWriter(tmp_path / "people.ndjson.gz", offset=10)
+
+
+class TestPCOCSVWriter:
+    """Test PCOCSVWriter class."""
+
+    @pytest.mark.asyncio
+    async def test_columns_from_first_resource(self, tmp_path):
+        """Test inferring columns and formatting nested and missing values."""
+        path = tmp_path / "people.csv"
+        async with PCOCSVWriter(path) as writer:
+            await writer.write(PEOPLE[0])
+            await writer.write(
+                PCORawResource(
+                    {"id": "x", "type": "Person", "attributes": {"extra": 1}}
+                )
+            )
+
+        rows = list(csv.reader(io.StringIO(path.read_text())))
+        assert rows == [
+            ["id", "type", "first_name", "tags", "nickname"],
+            ["0", "Person", "Person 0", '["a","b"]', ""],
+            ["x", "Person", "", "", ""],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_explicit_fields(self, tmp_path):
+        """Test writing only the requested columns."""
+        path = tmp_path / "people.csv"
+        async with create_writer("csv", path, fields=["first_name"]) as writer:
+            await writer.write(PEOPLE[1])
+
+        assert path.read_text().splitlines() == [
+            "id,type,first_name",
+            "1,Person,Person 1",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_export_writes_header(self, tmp_path):
+        """Test that known columns are written even when there are no rows."""
+        with_fields = tmp_path / "fields.csv"
+        without_fields = tmp_path / "inferred.csv"
+        async with PCOCSVWriter(with_fields, fields=["first_name"]):
+            pass
+        async with PCOCSVWriter(without_fields):
+            pass
+
+        assert with_fields.read_text().splitlines() == ["id,type,first_name"]
+        assert without_fields.read_text() == ""
+
+
+def test_writer_base_is_abstract(tmp_path):
+    """Test that the base writer needs an encoding."""
+    with pytest.raises(TypeError, match="_encode"):
+        PCOExportWriter(tmp_path / "out.txt")
+
+
+def test_create_writer_unknown_format(tmp_path):
+    """Test rejecting an unknown export format."""
+    with pytest.raises(ValueError, match="Unknown export format"):
+        create_writer("xml", tmp_path / "out.xml")
+
+
+class TestPCOColumnarWriter:
+    """Test the Parquet and Arrow writers."""
+
+    @pytest.fixture(autouse=True)
+    def pyarrow(self):
+        """Skip unless pyarrow is installed."""
+        return pytest.importorskip("pyarrow")
+
+    def read(self, path, format):
+        """Read a written file back as a table."""
+        if format == "parquet":
+            import pyarrow.parquet as pq
+
+            return pq.read_table(path)
+        import pyarrow.feather as feather
+
+        return feather.read_table(path)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("format", ["parquet", "arrow"])
+    async def test_writes_row_groups(self, tmp_path, format):
+        """Test writing a column per attribute in row groups."""
+        path = tmp_path / f"people.{format}"
+        async with create_writer(format, path, row_group_size=20) as writer:
+            for person in PEOPLE:
+                await writer.write(person)
+
+        table = self.read(path, format)
+        assert table.column_names == ["id", "type", "first_name", "tags", "nickname"]
+        assert table.num_rows == 50
+        assert table.column("tags")[0].as_py() == '["a","b"]'
+        assert list(tmp_path.iterdir()) == [path]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("format", ["parquet", "arrow"])
+    async def test_widens_schema_across_row_groups(self, pyarrow, tmp_path, format):
+        """Test that later row groups add columns and widen types."""
+        path = tmp_path / f"people.{format}"
+        rows = [
+            {"id": "1", "type": "Person", "attributes": {"age": 30, "id": "x"}},
+            {"id": "2", "type": "Person", "attributes": {"age": 31.5, "grade": 4}},
+            {"id": "3", "type": "Person", "attributes": {"grade": "K"}},
+        ]
+        async with create_writer(format, path, row_group_size=1) as writer:
+            for row in rows:
+                await writer.write(PCORawResource(row))
+
+        table = self.read(path, format)
+        assert table.schema.field("age").type == pyarrow.float64()
+        assert table.schema.field("grade").type == pyarrow.string()
+        assert table.to_pylist() == [
+            {
+                "id": "1",
+                "type": "Person",
+                "age": 30.0,
+                "attributes.id": "x",
+                "grade": None,
+            },
+            {
+                "id": "2",
+                "type": "Person",
+                "age": 31.5,
+                "attributes.id": None,
+                "grade": "4",
+            },
+            {
+                "id": "3",
+                "type": "Person",
+                "age": None,
+                "attributes.id": None,
+                "grade": "K",
+            },
+        ]
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_base_is_abstract(self, tmp_path):
+        """Test that the columnar base needs a file format."""
+        with pytest.raises(TypeError, match="_open"):
+            PCOColumnarWriter(tmp_path / "out.parquet")
+
+    def test_requires_file_path(self):
+        """Test rejecting an async sink."""
+
+        async def sink(chunk):
+            pass
+
+        with pytest.raises(TypeError, match="file path"):
+            create_writer("parquet", sink)
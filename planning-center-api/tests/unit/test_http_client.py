@@ -0,0 +1,564 @@
+"""Unit tests for PCOHttpClient."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from planning_center_api.config import PCOConfig
+from planning_center_api.exceptions import (
+    PCOCircuitOpenError,
+    PCONotFoundError,
+    PCOServerError,
+)
+from planning_center_api.http_client import PCOHttpClient
+from planning_center_api.models.base import PCOResource
+from planning_center_api.models.compact import PCOCompactCollection
+from planning_center_api.models.raw import PCORawCollection, PCORawResource
+from planning_center_api.retry import PCORetryPolicy
+
+PEOPLE_URL = "https://api.planningcenteronline.com/people/v2/people"
+GIVING_URL = "https://api.planningcenteronline.com/giving/v2/donations"
+
+
+def make_client(config: PCOConfig, handler) -> PCOHttpClient:
+    """Create an HTTP client whose requests are answered by ``handler``."""
+    client = PCOHttpClient(config)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def people_page(*ids: str) -> dict:
+    """Build a people collection document."""
+    return {
+        "data": [{"id": i, "type": "Person", "attributes": {}} for i in ids],
+        "meta": {"total_count": len(ids)},
+    }
+
+
+class TestPCOHttpClient:
+    """Test PCOHttpClient class."""
+
+    @pytest.fixture
+    def config(self):
+        """Create test configuration."""
+        return PCOConfig(access_token="test_token")
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_headers_update_limiter(self, config):
+        """Test that rate-limit response headers feed the limiter."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json=people_page("1"),
+                headers={
+                    "X-PCO-API-Request-Rate-Count": "95",
+                    "X-PCO-API-Request-Rate-Limit": "100",
+                    "X-PCO-API-Request-Rate-Period": "20",
+                },
+            )
+
+        client = make_client(config, handler)
+        await client._make_request("GET", PEOPLE_URL)
+
+        assert client.rate_limiter.max_requests == 100
+        assert client.rate_limiter.window_seconds == 20
+        assert client.rate_limiter.get_rate_limit_info().requests_remaining <= 5
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_headers_ignored_when_disabled(self, config):
+        """Test that adaptive rate limiting can be turned off."""
+        config.adaptive_rate_limit = False
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                json=people_page("1"),
+                headers={
+                    "X-PCO-API-Request-Rate-Count": "95",
+                    "X-PCO-API-Request-Rate-Limit": "100",
+                    "X-PCO-API-Request-Rate-Period": "20",
+                },
+            )
+
+        client = make_client(config, handler)
+        await client._make_request("GET", PEOPLE_URL)
+
+        assert client.rate_limiter.window_seconds == config.rate_limit_window
+
+    @pytest.mark.asyncio
+    async def test_429_backs_off_one_step_per_attempt(self, config):
+        """Test that a 429 without Retry-After waits a single backoff step."""
+        config.retry_policy = PCORetryPolicy(jitter=False)
+        responses = iter([httpx.Response(429), httpx.Response(200, json={})])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return next(responses)
+
+        client = make_client(config, handler)
+        with patch(
+            "planning_center_api.rate_limiter.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            response = await client._make_request("GET", PEOPLE_URL)
+
+        assert response.status_code == 200
+        # The backoff comes first; the retry then waits for a fresh token
+        assert mock_sleep.await_args_list[0].args == (1.0,)
+
+    @pytest.mark.asyncio
+    async def test_429_honours_retry_after(self, config):
+        """Test that a 429 waits for the Retry-After header."""
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "7"}),
+                httpx.Response(200, json={}),
+            ]
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return next(responses)
+
+        client = make_client(config, handler)
+        with patch(
+            "planning_center_api.rate_limiter.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            await client._make_request("GET", PEOPLE_URL)
+
+        assert mock_sleep.await_args_list[0].args == (7.0,)
+
+    @pytest.mark.asyncio
+    async def test_server_errors_retried_when_idempotent(self, config):
+        """Test that 503s are retried for GETs and idempotent POSTs only."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            if len(calls) % 2:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"id": "1", "type": "Person"})
+
+        client = make_client(config, handler)
+        with patch(
+            "planning_center_api.http_client.asyncio.sleep", new_callable=AsyncMock
+        ):
+            await client._make_request("GET", PEOPLE_URL)
+            with pytest.raises(PCOServerError):
+                await client.post("people/v2", "people", {"data": {}})
+            calls.clear()
+            await client.post("people/v2", "people", {"data": {}}, idempotent=True)
+
+        assert calls == ["POST", "POST"]
+
+    @pytest.mark.asyncio
+    async def test_retry_budget_stops_retries(self, config):
+        """Test that retries stop once the client's budget is spent."""
+        config.retry_policy = PCORetryPolicy(budget_ratio=0, budget_min_retries=2)
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(502)
+
+        client = make_client(config, handler)
+        with patch(
+            "planning_center_api.http_client.asyncio.sleep", new_callable=AsyncMock
+        ):
+            with pytest.raises(PCOServerError):
+                await client._make_request("GET", PEOPLE_URL)
+            with pytest.raises(PCOServerError):
+                await client._make_request("GET", PEOPLE_URL)
+
+        # Two retries in the budget, then each request gets one attempt
+        assert len(calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_fails_fast_per_product(self, config):
+        """Test that an open circuit stops requests to its product only."""
+        config.retry_policy = PCORetryPolicy(rules={})
+        config.circuit_failure_threshold = 2
+        events = []
+        config.circuit_listener = events.append
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            if request.url.path.startswith("/giving/"):
+                return httpx.Response(504)
+            return httpx.Response(200, json=people_page("1"))
+
+        client = make_client(config, handler)
+        for _ in range(2):
+            with pytest.raises(PCOServerError):
+                await client._make_request("GET", GIVING_URL)
+        with pytest.raises(PCOCircuitOpenError):
+            await client._make_request("GET", GIVING_URL)
+        await client._make_request("GET", PEOPLE_URL)
+
+        assert len(calls) == 3
+        assert [(event.key, event.state.value) for event in events] == [
+            ("giving/v2", "open")
+        ]
+        assert client.circuit_breakers["people/v2"].failures == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_rate_limit_wait_frees_trial_slot(self, config):
+        """Test that cancelling a half-open trial during acquire frees its slot."""
+        config.retry_policy = PCORetryPolicy(rules={})
+        config.circuit_failure_threshold = 1
+        config.circuit_recovery_timeout = 0.0
+        statuses = iter([504, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json=people_page("1"))
+
+        client = make_client(config, handler)
+        with pytest.raises(PCOServerError):
+            await client._make_request("GET", GIVING_URL)
+
+        acquire = client.rate_limiter.acquire
+        client.rate_limiter.acquire = AsyncMock(side_effect=asyncio.Event().wait)
+        task = asyncio.create_task(client._make_request("GET", GIVING_URL))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        client.rate_limiter.acquire = acquire
+        await client._make_request("GET", GIVING_URL)
+
+        assert client.circuit_breakers["giving/v2"].state.value == "closed"
+
+    @pytest.mark.asyncio
+    async def test_identical_gets_are_coalesced(self, config):
+        """Test that concurrent identical GETs share one request."""
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=people_page("1", "2"))
+
+        client = make_client(config, handler)
+        results = await asyncio.gather(
+            *(client.get("people/v2", "people", per_page=2) for _ in range(5))
+        )
+
+        assert len(calls) == 1
+        assert all([r.id for r in result] == ["1", "2"] for result in results)
+        assert client._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_params_are_not_coalesced(self, config):
+        """Test that GETs with different parameters are sent separately."""
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=people_page("1"))
+
+        client = make_client(config, handler)
+        await asyncio.gather(
+            client.get("people/v2", "people", offset=0),
+            client.get("people/v2", "people", offset=25),
+        )
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_coalesced_error_reaches_every_caller(self, config):
+        """Test that a failed shared request raises for every caller."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(404, json={"errors": [{"detail": "Gone"}]})
+
+        client = make_client(config, handler)
+        results = await asyncio.gather(
+            *(client.get("people/v2", "people", "1") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, PCONotFoundError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_request(self, config):
+        """Test that cancelling one caller leaves the others unaffected."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json=people_page("1"))
+
+        client = make_client(config, handler)
+        first = asyncio.create_task(client.get("people/v2", "people"))
+        second = asyncio.create_task(client.get("people/v2", "people"))
+        await asyncio.sleep(0.005)
+        first.cancel()
+
+        result = await second
+
+        assert first.cancelled()
+        assert result[0].id == "1"
+
+    @pytest.mark.asyncio
+    async def test_coalescing_can_be_disabled(self, config):
+        """Test that coalescing can be turned off."""
+        config.coalesce_requests = False
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=people_page("1"))
+
+        client = make_client(config, handler)
+        await asyncio.gather(*(client.get("people/v2", "people") for _ in range(3)))
+
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_response_cache(self, config):
+        """Test that cached GETs skip the network until a write invalidates them."""
+        config.cache_enabled = True
+        config.cache_ttls = {"people": 60}
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            if request.method == "PATCH":
+                return httpx.Response(200, json={"id": "1", "type": "Person"})
+            return httpx.Response(200, json=people_page("1"))
+
+        client = make_client(config, handler)
+        await client.get("people/v2", "people")
+        await client.get("people/v2", "people")
+        assert calls == ["GET"]
+
+        await client.patch("people/v2", "people", "1", data={})
+        await client.get("people/v2", "people")
+
+        assert calls == ["GET", "PATCH", "GET"]
+        assert client.cache.stats.hits == 1
+        assert client.cache.stats.invalidations == 1
+
+    @pytest.mark.asyncio
+    async def test_http_cache_revalidates_across_clients(self, config, tmp_path):
+        """Test that a new client revalidates a persisted response."""
+        config.http_cache_path = str(tmp_path / "http.sqlite3")
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=people_page("1"), headers={"ETag": '"v1"'})
+
+        first = await make_client(config, handler).get("people/v2", "people")
+        second = await make_client(config, handler).get("people/v2", "people")
+
+        assert seen == [None, '"v1"']
+        assert first[0].id == second[0].id == "1"
+
+    @pytest.mark.asyncio
+    async def test_http_cache_serves_fresh_entries(self, config, tmp_path):
+        """Test that entries within the TTL skip the network entirely."""
+        config.http_cache_path = str(tmp_path / "http.sqlite3")
+        config.http_cache_ttl = 60
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url)
+            return httpx.Response(200, json=people_page("1"))
+
+        await make_client(config, handler).get("people/v2", "people")
+        result = await make_client(config, handler).get("people/v2", "people")
+
+        assert len(calls) == 1
+        assert result[0].id == "1"
+
+    @pytest.mark.asyncio
+    async def test_http_cache_invalidated_by_writes_and_closed_on_exit(
+        self, config, tmp_path
+    ):
+        """Test that writes drop persisted responses and exit closes the file."""
+        config.http_cache_path = str(tmp_path / "http.sqlite3")
+        config.http_cache_ttl = 60
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            if request.method == "DELETE":
+                return httpx.Response(204)
+            return httpx.Response(200, json=people_page("1"))
+
+        client = make_client(config, handler)
+        await client.get("people/v2", "people")
+        await client.get("people/v2", "people")
+        await client.delete("people/v2", "people", "1")
+        await client.get("people/v2", "people")
+        await client.__aexit__(None, None, None)
+
+        assert calls == ["GET", "DELETE", "GET"]
+        assert client.http_cache._connection is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["pydantic", "json"])
+    async def test_json_backends(self, config, backend):
+        """Test decoding responses and encoding bodies with each backend."""
+        config.json_backend = backend
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                bodies.append(request.content)
+                return httpx.Response(201, json={"id": "9", "type": "Person"})
+            return httpx.Response(200, json=people_page("1", "2"))
+
+        client = make_client(config, handler)
+        collection = await client.get("people/v2", "people")
+        created = await client.post(
+            "people/v2", "people", data={"data": {"attributes": {"name": "Ann"}}}
+        )
+
+        assert [r.id for r in collection] == ["1", "2"]
+        assert collection.meta.total_count == 2
+        assert created.id == "9"
+        assert json.loads(bodies[0]) == {"data": {"attributes": {"name": "Ann"}}}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["pydantic", "json"])
+    async def test_single_resource_documents(self, config, backend):
+        """Test validating the data member of single-resource documents."""
+        config.json_backend = backend
+        person = {
+            "id": "1",
+            "type": "Person",
+            "relationships": {
+                "emails": {"data": [{"type": "Email", "id": "e1"}]},
+            },
+        }
+        document = {
+            "data": person,
+            "included": [{"id": "e1", "type": "Email", "attributes": {}}],
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=document)
+
+        client = make_client(config, handler)
+        with patch("planning_center_api.http_client.loads", side_effect=AssertionError):
+            fetched = await client.get("people/v2", "people", "1")
+            created = await client.post("people/v2", "people", data={})
+            updated = await client.patch("people/v2", "people", "1", data={})
+
+        for resource in (fetched, created, updated):
+            assert isinstance(resource, PCOResource)
+            assert resource.id == "1"
+            assert [email.id for email in resource.related("emails")] == ["e1"]
+
+    @pytest.mark.asyncio
+    async def test_raw_result_mode(self, config):
+        """Test returning unvalidated views instead of models."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/1"):
+                return httpx.Response(
+                    200,
+                    json={"data": {"id": "1", "type": "Person", "attributes": {}}},
+                )
+            document = people_page("1", "2")
+            document["data"][0]["attributes"] = {"first_name": "Ann"}
+            document["links"] = {"next": {"href": f"{PEOPLE_URL}?offset=2"}}
+            return httpx.Response(200, json=document)
+
+        client = make_client(config, handler)
+        collection = await client.get("people/v2", "people", result_mode="raw")
+        person = await client.get("people/v2", "people", "1", result_mode="raw")
+
+        assert isinstance(collection, PCORawCollection)
+        assert [r.id for r in collection] == ["1", "2"]
+        assert collection[0].get_attribute("first_name") == "Ann"
+        assert collection.meta.total_count == 2
+        assert collection.links.next.href == f"{PEOPLE_URL}?offset=2"
+        assert isinstance(person, PCORawResource)
+        assert person.type == "Person"
+        assert person.related("emails") is None
+
+    @pytest.mark.asyncio
+    async def test_compact_result_mode(self, config):
+        """Test returning compact records instead of models."""
+        client = make_client(
+            config, lambda request: httpx.Response(200, json=people_page("1", "2"))
+        )
+
+        collection = await client.get("people/v2", "people", result_mode="compact")
+
+        assert isinstance(collection, PCOCompactCollection)
+        assert [r.id for r in collection] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_result_mode(self, config):
+        """Test that unknown result modes are rejected."""
+        client = make_client(config, lambda request: httpx.Response(200))
+
+        with pytest.raises(ValueError, match="Unknown result mode"):
+            await client.get("people/v2", "people", result_mode="dicts")
+
+    @pytest.mark.asyncio
+    async def test_connection_pool_config(self):
+        """Test that pool limits and HTTP/2 reach the default transport."""
+        pytest.importorskip("h2")
+        config = PCOConfig(
+            access_token="test_token",
+            max_connections=7,
+            max_keepalive_connections=3,
+            keepalive_expiry=1.5,
+            http2=True,
+        )
+
+        async with PCOHttpClient(config) as client:
+            pool = client._client._transport._pool
+
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert pool._keepalive_expiry == 1.5
+        assert pool._http2 is True
+
+    @pytest.mark.asyncio
+    async def test_pool_timeout_defaults_to_timeout(self):
+        """Test that the pool wait is bounded by the request timeout."""
+        default = PCOConfig(access_token="test_token", timeout=12.0)
+        custom = PCOConfig(access_token="test_token", timeout=12.0, pool_timeout=2.0)
+
+        async with PCOHttpClient(default) as client:
+            assert client._client.timeout.pool == 12.0
+        async with PCOHttpClient(custom) as client:
+            assert client._client.timeout.pool == 2.0
+
+    @pytest.mark.asyncio
+    async def test_custom_transport_and_prewarm(self):
+        """Test routing requests through a given transport, prewarmed on entry."""
+        methods = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            if request.method == "HEAD":
+                return httpx.Response(200)
+            return httpx.Response(200, json=people_page("1"))
+
+        config = PCOConfig(
+            access_token="test_token",
+            transport=httpx.MockTransport(handler),
+            prewarm_connections=3,
+        )
+
+        async with PCOHttpClient(config) as client:
+            assert methods == ["HEAD"] * 3
+            assert client.rate_limiter.get_rate_limit_info().requests_remaining == 97
+            collection = await client.get("people/v2", "people")
+
+        assert [r.id for r in collection.data] == ["1"]
+        assert methods[-1] == "GET"
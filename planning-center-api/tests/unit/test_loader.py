@@ -0,0 +1,122 @@
+"""Unit tests for batched loading."""
+
+import asyncio
+
+import pytest
+
+from planning_center_api.exceptions import PCONotFoundError, PCOServerError
+from planning_center_api.loader import PCOBatchLoader
+from planning_center_api.models.base import PCOResource
+
+
+class TestPCOBatchLoader:
+    """Test PCOBatchLoader class."""
+
+    @pytest.fixture
+    def calls(self):
+        """Record the batches fetched by the loader."""
+        return []
+
+    @pytest.fixture
+    def loader(self, calls):
+        """Create a loader whose fetch returns every ID except "missing"."""
+
+        async def fetch(product, resource, ids):
+            calls.append((product, resource, ids))
+            return [
+                PCOResource(id=id_, type=resource) for id_ in ids if id_ != "missing"
+            ]
+
+        return PCOBatchLoader(fetch, max_batch_size=3)
+
+    @pytest.mark.asyncio
+    async def test_loads_in_one_tick_are_batched(self, loader, calls):
+        """Test that concurrent loads share a request."""
+        people = await asyncio.gather(
+            *(loader.load("people", "people", str(i)) for i in range(3))
+        )
+
+        assert [person.id for person in people] == ["0", "1", "2"]
+        assert calls == [("people", "people", ["0", "1", "2"])]
+
+    @pytest.mark.asyncio
+    async def test_batches_are_split_by_resource_and_size(self, loader, calls):
+        """Test chunking and grouping per resource type."""
+        await asyncio.gather(
+            *(loader.load("people", "people", str(i)) for i in range(5)),
+            loader.load("people", "emails", "1"),
+        )
+
+        assert sorted(calls) == [
+            ("people", "emails", ["1"]),
+            ("people", "people", ["0", "1", "2"]),
+            ("people", "people", ["3", "4"]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_are_fetched_once(self, loader, calls):
+        """Test that an ID requested twice is only sent once."""
+        first, second = await asyncio.gather(
+            loader.load("people", "people", "1"), loader.load("people", "people", "1")
+        )
+
+        assert first is second
+        assert calls == [("people", "people", ["1"])]
+
+    @pytest.mark.asyncio
+    async def test_loads_in_later_ticks_are_separate(self, loader, calls):
+        """Test that sequential loads aren't held back for each other."""
+        await loader.load("people", "people", "1")
+        await loader.load("people", "people", "2")
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_ids(self, loader):
+        """Test that missing IDs raise for load and are None for load_many."""
+        with pytest.raises(PCONotFoundError):
+            await loader.load("people", "people", "missing")
+
+        people = await loader.load_many("people", "people", ["1", "missing"])
+
+        assert people[0].id == "1"
+        assert people[1] is None
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        """Test that a failed batch fails every load in it."""
+
+        async def fetch(product, resource, ids):
+            raise PCOServerError()
+
+        loader = PCOBatchLoader(fetch)
+        results = await asyncio.gather(
+            loader.load("people", "people", "1"),
+            loader.load("people", "people", "2"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, PCOServerError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_cancels_callers(self):
+        """Test that loads don't hang when their batch is cancelled."""
+        started = asyncio.Event()
+
+        async def fetch(product, resource, ids):
+            started.set()
+            await asyncio.Event().wait()
+
+        loader = PCOBatchLoader(fetch)
+        loads = asyncio.gather(
+            loader.load("people", "people", "1"),
+            loader.load_many("people", "people", ["2", "3"]),
+            return_exceptions=True,
+        )
+        await started.wait()
+        for task in loader._tasks:
+            task.cancel()
+
+        results = await asyncio.wait_for(loads, timeout=1)
+
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
@@ -0,0 +1,159 @@
+"""Unit tests for the local mirror."""
+
+import pytest
+
+from planning_center_api import PCOClient
+from planning_center_api.mirror import PCOMirror, PCOMirrorSink
+from planning_center_api.models.base import PCOCollection
+from planning_center_api.models.raw import PCORawCollection
+
+
+@pytest.fixture
+def people_page():
+    """Create a page of people with their emails, phones and households."""
+    return PCOCollection(
+        data=[
+            {
+                "id": "1",
+                "type": "Person",
+                "attributes": {
+                    "first_name": "John",
+                    "last_name": "Smith",
+                    "updated_at": "2024-01-01T00:00:00Z",
+                },
+                "relationships": {
+                    "emails": {"data": [{"type": "Email", "id": "10"}]},
+                    "phone_numbers": {"data": [{"type": "PhoneNumber", "id": "20"}]},
+                    "households": {"data": [{"type": "Household", "id": "30"}]},
+                },
+            },
+            {
+                "id": "2",
+                "type": "Person",
+                "attributes": {
+                    "first_name": "Jane",
+                    "last_name": "Smith",
+                    "updated_at": "2024-01-02T00:00:00Z",
+                },
+                "relationships": {
+                    "emails": {"data": [{"type": "Email", "id": "11"}]},
+                    "households": {"data": [{"type": "Household", "id": "30"}]},
+                },
+            },
+        ],
+        included=[
+            {
+                "id": "10",
+                "type": "Email",
+                "attributes": {"address": "John@Example.com"},
+            },
+            {
+                "id": "11",
+                "type": "Email",
+                "attributes": {"address": "jane@example.com"},
+                "relationships": {"person": {"data": {"type": "Person", "id": "2"}}},
+            },
+            {
+                "id": "20",
+                "type": "PhoneNumber",
+                "attributes": {"number": "(555) 123-4567"},
+            },
+            {"id": "30", "type": "Household", "attributes": {"name": "Smith"}},
+        ],
+    )
+
+
+class TestPCOMirror:
+    """Test PCOMirror class."""
+
+    @pytest.fixture
+    def mirror(self, tmp_path, people_page):
+        """Create a mirror holding the people page."""
+        mirror = PCOMirror(tmp_path / "mirror.sqlite3")
+        mirror.upsert_many(people_page.data)
+        return mirror
+
+    def test_upsert_stores_related_resources(self, mirror):
+        """Test that included resources are stored with the people."""
+        assert len(mirror) == 6
+
+        person = mirror.get("Person", "1")
+        assert person.get_attribute("first_name") == "John"
+        assert person.related("households")[0].get_attribute("name") == "Smith"
+
+    def test_lookups(self, mirror):
+        """Test the indexed email, phone and household lookups."""
+        assert [p.id for p in mirror.get_people_by_email(" john@example.COM")] == ["1"]
+        assert [p.id for p in mirror.get_people_by_email("jane@example.com")] == ["2"]
+        assert [p.id for p in mirror.get_people_by_phone("555.123.4567")] == ["1"]
+        assert [p.id for p in mirror.get_household_people("30")] == ["1", "2"]
+        assert [p.id for p in mirror.search_people("smi")] == ["1", "2"]
+        assert [p.id for p in mirror.search_people("jane@example.com")] == ["2"]
+        assert [
+            p.id for p in mirror.updated_since("Person", "2024-01-02T00:00:00Z")
+        ] == ["2"]
+
+    def test_search_escapes_wildcards(self, mirror):
+        """Test that LIKE wildcards in a search are matched literally."""
+        mirror.upsert(
+            PCOCollection(
+                data=[{"id": "3", "type": "Person", "attributes": {"name": "50%_off"}}]
+            ).data[0]
+        )
+
+        assert [p.id for p in mirror.search_people("%")] == ["3"]
+        assert [p.id for p in mirror.search_people("0%_")] == ["3"]
+        assert len(mirror.search_people("_")) == 1
+
+    @pytest.mark.asyncio
+    async def test_sink_writes_in_batches(self, tmp_path, people_page):
+        """Test that the sink holds resources until a batch is full."""
+        mirror = PCOMirror(tmp_path / "mirror.sqlite3")
+        sink = PCOMirrorSink(mirror, batch_size=2, related=False)
+
+        await sink(people_page.data[0])
+        assert len(mirror) == 0
+        await sink(people_page.data[1])
+        assert len(mirror) == 2
+
+        await sink(people_page.data[0])
+        await sink.flush()
+        assert len(mirror) == 2
+        assert sink._pending == []
+
+    def test_upsert_replaces_index_rows(self, mirror):
+        """Test that updating a resource drops its old index rows."""
+        mirror.upsert(
+            PCORawCollection.from_document(
+                {
+                    "data": [
+                        {
+                            "id": "10",
+                            "type": "Email",
+                            "attributes": {"address": "john@new.example.com"},
+                        }
+                    ]
+                }
+            ).data[0]
+        )
+
+        assert len(mirror.get_people_by_email("john@example.com")) == 0
+        assert [p.id for p in mirror.get_people_by_email("john@new.example.com")] == [
+            "1"
+        ]
+
+    def test_delete(self, mirror):
+        """Test removing a resource and its edges."""
+        mirror.delete("Person", "1")
+
+        assert mirror.get("Person", "1") is None
+        assert [p.id for p in mirror.get_household_people("30")] == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_client_lookups_use_mirror(self, mirror):
+        """Test that the client answers people lookups from its mirror."""
+        client = PCOClient(access_token="test_token", mirror=mirror)
+
+        result = await client.get_people_by_email("john@example.com")
+
+        assert [person.id for person in result] == ["1"]
@@ -1,5 +1,6 @@
 """Unit tests for Pydantic models."""
 
+import pickle
 from datetime import datetime
 
 from planning_center_api.models.base import (
@@ -9,8 +10,14 @@ from planning_center_api.models.base import (
     PCOWebhookEvent,
     PCOWebhookPayload,
 )
+from planning_center_api.models.compact import (
+    PCOCompactCollection,
+    PCOCompactResource,
+)
+from planning_center_api.models.identity import PCOIdentityMap
 from planning_center_api.models.links import PCOLink, PCOLinks
 from planning_center_api.models.meta import PCOMeta
+from planning_center_api.models.raw import PCORawCollection
 from planning_center_api.models.relationships import PCORelationship, PCORelationships
 
 
@@ -114,6 +121,76 @@ class TestPCOCollection:
         missing = collection.get_included_resource("emails", "999")
         assert missing is None
 
+    def test_included_index_follows_changes(self):
+        """Test that the included index is rebuilt when included changes."""
+        collection = PCOCollection(
+            included=[PCOResource(id="1", type="emails", attributes={})]
+        )
+        assert collection.get_included_resource("emails", "1") is not None
+
+        collection.included.append(PCOResource(id="2", type="emails"))
+        assert collection.get_included_resource("emails", "2") is not None
+
+        collection.included = [PCOResource(id="3", type="emails")]
+        assert collection.get_included_resource("emails", "1") is None
+        assert collection.get_included_resource("emails", "3") is not None
+
+    def test_related(self):
+        """Test resolving relationships from the included resources."""
+        collection = PCOCollection(
+            data=[
+                {
+                    "id": "1",
+                    "type": "Person",
+                    "relationships": {
+                        "emails": {
+                            "data": [
+                                {"type": "Email", "id": "1"},
+                                {"type": "Email", "id": "2"},
+                            ]
+                        },
+                        "primary_campus": {"data": {"type": "Campus", "id": "1"}},
+                        "school": {"data": None},
+                    },
+                }
+            ],
+            included=[
+                {"id": "1", "type": "Email", "attributes": {"primary": True}},
+                {"id": "1", "type": "Campus"},
+            ],
+        )
+        person = collection[0]
+
+        assert [email.id for email in person.related("emails")] == ["1"]
+        assert person.related("primary_campus") is collection.included[1]
+        assert person.related("school") is None
+        assert person.related("missing") is None
+        assert PCOResource(id="2", type="Person").related("emails") is None
+
+    def test_copies_keep_their_own_resolver(self):
+        """Test that copies resolve through their own collection."""
+        collection = PCOCollection(
+            data=[
+                {
+                    "id": "1",
+                    "type": "Person",
+                    "relationships": {
+                        "emails": {"data": [{"type": "Email", "id": "1"}]}
+                    },
+                }
+            ],
+            included=[{"id": "1", "type": "Email"}],
+        )
+        person = collection[0]
+
+        copy = person.model_copy()
+        copy.bind_resolver(None)
+        assert copy.related("emails") == []
+        assert person.related("emails")[0] is collection.included[0]
+
+        deep = collection.model_copy(deep=True)
+        assert deep[0].related("emails")[0] is deep.included[0]
+
     def test_get_included_resources(self):
         """Test getting included resources by type."""
         email1 = PCOResource(
@@ -426,3 +503,153 @@ class TestPCORelationships:
         # Non-existent relationship
         missing_data = relationships.get_relationship_data("nonexistent")
         assert missing_data is None
+
+
+class TestPCOCompactResource:
+    """Test PCOCompactResource class."""
+
+    DOCUMENT = {
+        "data": [
+            {
+                "id": str(i),
+                "type": "Person",
+                "attributes": {"first_name": f"First {i}", "status": "active"},
+                "relationships": {
+                    "primary_campus": {"data": {"type": "Campus", "id": "1"}},
+                    "emails": {"data": [{"type": "Email", "id": f"e{i}"}]},
+                    "households": {"data": []},
+                    "school": {"data": None},
+                },
+            }
+            for i in range(2)
+        ],
+        "included": [{"id": "1", "type": "Campus", "attributes": {"name": "Main"}}],
+        "meta": {"total_count": 2},
+    }
+
+    def test_accessors(self):
+        """Test reading attributes and relationships."""
+        person = PCOCompactResource(self.DOCUMENT["data"][0])
+
+        assert person.id == "0"
+        assert person.type == "Person"
+        assert person.get_attribute("first_name") == "First 0"
+        assert person.get_attribute("missing", "default") == "default"
+        assert person.attributes == {"first_name": "First 0", "status": "active"}
+        assert person.get_relationship_data("primary_campus") == {
+            "type": "Campus",
+            "id": "1",
+        }
+        assert person.get_relationship_data("emails") == [{"type": "Email", "id": "e0"}]
+        assert person.get_relationship_data("households") == []
+        assert person.get_relationship_data("school") is None
+        assert person.get_relationship_data("missing") is None
+
+    def test_layouts_are_shared(self):
+        """Test that resources with the same keys share one layout."""
+        first, second = PCOCompactCollection.from_document(self.DOCUMENT)
+
+        assert first._attributes is second._attributes
+        assert first._relationships is second._relationships
+        assert not hasattr(first, "__dict__")
+
+    def test_model_dump_matches_pcoresource(self):
+        """Test that dumping round-trips through PCOResource."""
+        person = PCOCompactResource(self.DOCUMENT["data"][0])
+
+        resource = PCOResource(**person.model_dump())
+
+        assert resource.id == "0"
+        assert resource.get_attribute("status") == "active"
+        assert resource.model_dump(exclude_none=True)["relationships"]["emails"] == {
+            "data": [{"type": "Email", "id": "e0"}]
+        }
+
+    def test_collection(self):
+        """Test collection access and included lookups."""
+        collection = PCOCompactCollection.from_document(self.DOCUMENT)
+
+        assert len(collection) == 2
+        assert collection.meta.total_count == 2
+        assert (
+            collection.get_included_resource("Campus", "1").get_attribute("name")
+            == "Main"
+        )
+        assert collection[1] == PCOCompactResource(self.DOCUMENT["data"][1])
+
+    def test_related(self):
+        """Test resolving relationships from the included resources."""
+        collection = PCOCompactCollection.from_document(self.DOCUMENT)
+
+        assert collection[0].related("primary_campus").get_attribute("name") == "Main"
+        assert collection[0].related("emails") == []
+        assert collection[0].related("school") is None
+
+    def test_pickle_drops_resolver(self):
+        """Test that pickling keeps the data but not the page behind it."""
+        for collection in (
+            PCOCollection(**self.DOCUMENT),
+            PCORawCollection.from_document(self.DOCUMENT),
+            PCOCompactCollection.from_document(self.DOCUMENT),
+        ):
+            person = collection[0]
+            person.bind_resolver(lambda resource_type, resource_id: "campus")
+
+            copy = pickle.loads(pickle.dumps(person))
+
+            assert copy.model_dump() == person.model_dump()
+            assert copy.resolver is None
+            assert copy.related("primary_campus") is None
+
+
+class TestPCOIdentityMap:
+    """Test PCOIdentityMap class."""
+
+    def test_add_returns_existing_instance(self):
+        """Test that a resource is only stored once."""
+        identity_map = PCOIdentityMap()
+        first = PCOResource(id="1", type="Household")
+        second = PCOResource(id="1", type="Household")
+
+        assert identity_map.add(first) is first
+        assert identity_map.add(second) is first
+        assert len(identity_map) == 1
+        assert ("Household", "1") in identity_map
+        assert identity_map.get("Household", "1") is first
+
+    def test_add_included_deduplicates_across_pages(self):
+        """Test that pages share included instances."""
+        identity_map = PCOIdentityMap()
+        pages = [
+            PCOCollection(
+                included=[
+                    PCOResource(id="1", type="Campus"),
+                    PCOResource(id=str(page), type="Email"),
+                ]
+            )
+            for page in range(2, 4)
+        ]
+
+        for page in pages:
+            identity_map.add_included(page)
+
+        assert pages[0].included[0] is pages[1].included[0]
+        assert pages[1].get_included_resource("Campus", "1") is pages[0].included[0]
+        assert len(identity_map) == 3
+
+    def test_related_resolves_across_pages(self):
+        """Test resolving resources included on an earlier page."""
+        identity_map = PCOIdentityMap()
+        campus = {"data": {"type": "Campus", "id": "1"}}
+        first = PCOCollection(
+            data=[{"id": "1", "type": "Person", "relationships": {"campus": campus}}],
+            included=[{"id": "1", "type": "Campus"}],
+        )
+        second = PCOCollection(
+            data=[{"id": "2", "type": "Person", "relationships": {"campus": campus}}]
+        )
+
+        identity_map.add_included(first)
+        identity_map.add_included(second)
+
+        assert second[0].related("campus") is first.included[0]
@@ -0,0 +1,29 @@
+"""Unit tests for the pagination helpers."""
+
+from datetime import UTC, datetime
+
+from planning_center_api.pagination import (
+    format_timestamp,
+    parse_timestamp,
+    range_params,
+    truncate_timestamp,
+)
+
+
+def test_timestamps_round_trip():
+    """Test parsing, truncating and formatting API timestamps."""
+    parsed = parse_timestamp("2024-01-02T03:04:05.678Z")
+
+    assert parsed == datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=UTC)
+    assert parse_timestamp("2024-01-02T03:04:05").tzinfo is UTC
+    assert format_timestamp(truncate_timestamp(parsed)) == "2024-01-02T03:04:05Z"
+
+
+def test_range_params():
+    """Test building a half-open range filter."""
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+
+    assert range_params("created_at", start, "2024-02-01T00:00:00Z") == {
+        "where[created_at][gte]": "2024-01-01T00:00:00Z",
+        "where[created_at][lt]": "2024-02-01T00:00:00Z",
+    }
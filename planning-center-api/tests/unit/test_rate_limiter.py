@@ -0,0 +1,275 @@
+"""Unit tests for rate limiting."""
+
+import asyncio
+import multiprocessing
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from planning_center_api.config import PCOConfig
+from planning_center_api.rate_limiter import (
+    PCORateLimiter,
+    PCOSharedRateLimiter,
+    create_rate_limiter,
+    parse_numeric_header,
+)
+
+SHARED_LIMIT = 10
+SHARED_WINDOW = 0.25
+
+
+def _acquire_in_process(path: str, count: int) -> list[float]:
+    """Acquire ``count`` tokens from a shared limiter, returning timestamps."""
+    limiter = PCOSharedRateLimiter(
+        path, max_requests=SHARED_LIMIT, window_seconds=SHARED_WINDOW
+    )
+
+    async def run() -> list[float]:
+        timestamps = []
+        for _ in range(count):
+            await limiter.acquire()
+            timestamps.append(time.time())
+        return timestamps
+
+    try:
+        return asyncio.run(run())
+    finally:
+        limiter.close()
+
+
+class TestPCORateLimiter:
+    """Test PCORateLimiter class."""
+
+    @pytest.mark.asyncio
+    async def test_burst_within_capacity(self):
+        """Test that a full bucket lets a burst through without waiting."""
+        limiter = PCORateLimiter(max_requests=10, window_seconds=60)
+
+        start = time.monotonic()
+        for _ in range(10):
+            await limiter.acquire()
+
+        assert time.monotonic() - start < 0.05
+        assert limiter.get_rate_limit_info().requests_remaining == 0
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill(self):
+        """Test that an empty bucket waits for the next token."""
+        limiter = PCORateLimiter(max_requests=10, window_seconds=1)
+        for _ in range(10):
+            await limiter.acquire()
+
+        start = time.monotonic()
+        await limiter.acquire()
+
+        assert 0.05 <= time.monotonic() - start < 0.3
+
+    @pytest.mark.asyncio
+    async def test_waiters_released_in_fifo_order(self):
+        """Test that waiters are released in arrival order."""
+        limiter = PCORateLimiter(max_requests=20, window_seconds=1)
+        for _ in range(20):
+            await limiter.acquire()
+
+        released = []
+
+        async def waiter(index: int) -> None:
+            await limiter.acquire()
+            released.append(index)
+
+        await asyncio.gather(*(waiter(i) for i in range(5)))
+
+        assert released == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_sleeps_outside_lock(self):
+        """Test that a sleeping waiter does not hold the lock."""
+        limiter = PCORateLimiter(max_requests=1, window_seconds=60)
+        await limiter.acquire()
+
+        sleeper = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        assert not limiter.lock.locked()
+        sleeper.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await sleeper
+
+        # The cancelled reservation is handed back
+        assert limiter.tokens > -1
+
+    def test_get_rate_limit_info(self):
+        """Test rate limit information for an unused limiter."""
+        limiter = PCORateLimiter(max_requests=100, window_seconds=60)
+
+        info = limiter.get_rate_limit_info()
+
+        assert info.requests_remaining == 100
+        assert info.reset_time <= time.time()
+
+    def test_update_from_headers(self):
+        """Test adopting the server's limit and remaining budget."""
+        limiter = PCORateLimiter(max_requests=50, window_seconds=60)
+
+        limiter.update_from_headers(
+            {
+                "X-PCO-API-Request-Rate-Count": "80",
+                "X-PCO-API-Request-Rate-Limit": "100",
+                "X-PCO-API-Request-Rate-Period": "20",
+            }
+        )
+
+        assert limiter.max_requests == 100
+        assert limiter.window_seconds == 20
+        assert limiter.refill_rate == 5
+        assert limiter.get_rate_limit_info().requests_remaining == 20
+
+    def test_update_from_headers_missing_or_malformed(self):
+        """Test that unusable headers leave the limiter unchanged."""
+        limiter = PCORateLimiter(max_requests=50, window_seconds=60)
+
+        limiter.update_from_headers({"X-PCO-API-Request-Rate-Limit": "lots"})
+
+        assert limiter.max_requests == 50
+        assert limiter.get_rate_limit_info().requests_remaining == 50
+
+    @pytest.mark.asyncio
+    async def test_handle_rate_limit_error_drains_bucket(self):
+        """Test that a 429 empties the bucket before backing off."""
+        limiter = PCORateLimiter(max_requests=10, window_seconds=60)
+
+        with patch(
+            "planning_center_api.rate_limiter.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            await limiter.handle_rate_limit_error(attempt=2)
+
+        mock_sleep.assert_awaited_once_with(4.0)
+        assert limiter.get_rate_limit_info().requests_remaining == 0
+
+
+class TestPCOSharedRateLimiter:
+    """Test PCOSharedRateLimiter class."""
+
+    def test_state_shared_between_instances(self, tmp_path):
+        """Test that two limiters on one file draw from the same bucket."""
+        path = tmp_path / "limits.sqlite3"
+        first = PCOSharedRateLimiter(path, max_requests=5, window_seconds=60)
+        second = PCOSharedRateLimiter(path, max_requests=5, window_seconds=60)
+
+        for _ in range(3):
+            first._reserve()
+
+        assert second.get_rate_limit_info().requests_remaining == 2
+
+    def test_keys_are_independent(self, tmp_path):
+        """Test that different keys get separate buckets."""
+        path = tmp_path / "limits.sqlite3"
+        first = PCOSharedRateLimiter(path, key="a", max_requests=5)
+        second = PCOSharedRateLimiter(path, key="b", max_requests=5)
+
+        first._reserve()
+
+        assert second.get_rate_limit_info().requests_remaining == 5
+
+    def test_configured_limits_replace_stored_limits(self, tmp_path):
+        """Test that a limiter created with a lower limit isn't held to the old one."""
+        path = tmp_path / "limits.sqlite3"
+        first = PCOSharedRateLimiter(path, max_requests=100, window_seconds=60)
+        second = PCOSharedRateLimiter(path, max_requests=10, window_seconds=20)
+
+        for limiter in (first, second):
+            assert limiter.get_rate_limit_info().requests_remaining == 10
+            assert limiter.max_requests == 10
+            assert limiter.window_seconds == 20
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquire_and_header_updates(self, tmp_path):
+        """Test that bucket operations from worker threads don't interleave."""
+        limiter = PCOSharedRateLimiter(
+            tmp_path / "limits.sqlite3", max_requests=1000, window_seconds=1e9
+        )
+        headers = {"X-PCO-API-Request-Rate-Limit": "1000"}
+
+        await asyncio.gather(
+            *(limiter.acquire() for _ in range(20)),
+            *(limiter.observe_headers(headers) for _ in range(20)),
+        )
+
+        assert limiter.get_rate_limit_info().requests_remaining == 980
+
+    def test_close_reopens_on_use(self, tmp_path):
+        """Test that a closed limiter reconnects when used again."""
+        limiter = PCOSharedRateLimiter(tmp_path / "limits.sqlite3", max_requests=5)
+
+        limiter.close()
+        limiter._reserve()
+
+        assert limiter.get_rate_limit_info().requests_remaining == 4
+        limiter.close()
+
+    @pytest.mark.slow
+    def test_aggregate_rate_across_processes(self, tmp_path):
+        """Test that several processes together stay within the limit."""
+        path = str(tmp_path / "limits.sqlite3")
+        # Create the bucket before the workers start so its start time is known
+        PCOSharedRateLimiter(
+            path, max_requests=SHARED_LIMIT, window_seconds=SHARED_WINDOW
+        ).close()
+        start = time.time()
+
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(4) as pool:
+            results = pool.starmap(_acquire_in_process, [(path, 15)] * 4)
+
+        timestamps = sorted(ts for result in results for ts in result)
+        rate = SHARED_LIMIT / SHARED_WINDOW
+
+        assert len(timestamps) == 60
+        for granted, timestamp in enumerate(timestamps, start=1):
+            allowed = SHARED_LIMIT + rate * (timestamp - start)
+            assert granted <= allowed + 1
+
+    def test_create_rate_limiter(self, tmp_path):
+        """Test selecting the limiter backend from the configuration."""
+        memory = create_rate_limiter(PCOConfig())
+        shared = create_rate_limiter(
+            PCOConfig(
+                rate_limit_backend="sqlite",
+                rate_limit_path=str(tmp_path / "limits.sqlite3"),
+            )
+        )
+
+        assert type(memory) is PCORateLimiter
+        assert isinstance(shared, PCOSharedRateLimiter)
+        assert shared.key == "default"
+        with pytest.raises(ValueError, match="Unknown rate limit backend"):
+            create_rate_limiter(PCOConfig(rate_limit_backend="redis"))
+
+    def test_create_rate_limiter_keys_by_credentials(self, tmp_path):
+        """Test that clients with different credentials get separate buckets."""
+        path = str(tmp_path / "limits.sqlite3")
+        first, same, other, app = (
+            create_rate_limiter(
+                PCOConfig(rate_limit_backend="sqlite", rate_limit_path=path, **auth)
+            )
+            for auth in (
+                {"access_token": "token-1"},
+                {"access_token": "token-1"},
+                {"access_token": "token-2"},
+                {"app_id": "app", "secret": "secret"},
+            )
+        )
+
+        assert first.key == same.key
+        assert len({first.key, other.key, app.key}) == 3
+        assert "token-1" not in first.key
+
+
+def test_parse_numeric_header():
+    """Test reading numeric headers such as Retry-After."""
+    headers = {"Retry-After": "2.5", "X-Bad": "soon"}
+
+    assert parse_numeric_header(headers, "Retry-After") == 2.5
+    assert parse_numeric_header(headers, "X-Bad") is None
+    assert parse_numeric_header(headers, "X-Missing") is None
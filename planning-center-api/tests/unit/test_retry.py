@@ -0,0 +1,88 @@
+"""Unit tests for the retry policy and budget."""
+
+import httpx
+
+from planning_center_api.config import PCOConfig
+from planning_center_api.retry import PCORetryBudget, PCORetryPolicy, PCORetryRule
+
+
+class TestPCORetryPolicy:
+    """Test PCORetryPolicy class."""
+
+    def test_from_config(self):
+        """Test building the policy from the config's retry fields."""
+        policy = PCORetryPolicy.from_config(
+            PCOConfig(max_retries=5, retry_delay=0.5, backoff_factor=3.0)
+        )
+
+        assert (policy.max_retries, policy.base_delay, policy.backoff_factor) == (
+            5,
+            0.5,
+            3.0,
+        )
+
+        assert policy.rules[429].max_retries == 5
+        assert not PCORetryPolicy.from_config(
+            PCOConfig(max_retries=0)
+        ).should_retry_status(429, 0, idempotent=True)
+
+        custom = PCORetryPolicy(max_retries=1)
+        assert PCORetryPolicy.from_config(PCOConfig(retry_policy=custom)) is custom
+
+    def test_status_rules(self):
+        """Test per-status limits and idempotency requirements."""
+        policy = PCORetryPolicy(rules={429: PCORetryRule(1, idempotent_only=False)})
+
+        assert policy.should_retry_status(429, 0, idempotent=False)
+        assert not policy.should_retry_status(429, 1, idempotent=False)
+        assert not policy.should_retry_status(503, 0, idempotent=True)
+
+        default = PCORetryPolicy()
+        assert default.should_retry_status(503, 0, idempotent=True)
+        assert not default.should_retry_status(503, 0, idempotent=False)
+        assert not default.should_retry_status(500, 0, idempotent=True)
+
+    def test_network_errors(self):
+        """Test that only unsent requests are retried when not idempotent."""
+        policy = PCORetryPolicy(max_retries=2)
+        refused = httpx.ConnectError("refused")
+        timed_out = httpx.ReadTimeout("slow")
+
+        assert policy.should_retry_error(refused, 0, idempotent=False)
+        assert not policy.should_retry_error(timed_out, 0, idempotent=False)
+        assert policy.should_retry_error(timed_out, 1, idempotent=True)
+        assert not policy.should_retry_error(timed_out, 2, idempotent=True)
+
+    def test_delay(self):
+        """Test capped exponential backoff with full jitter."""
+        policy = PCORetryPolicy(base_delay=1.0, backoff_factor=2.0, max_delay=5.0)
+
+        delays = [policy.delay(2) for _ in range(200)]
+        assert all(0 <= delay <= 4.0 for delay in delays)
+        assert len(set(delays)) > 1
+        assert all(policy.delay(10) <= 5.0 for _ in range(20))
+        assert policy.delay(3, retry_after=4.5) == 4.5
+        assert policy.delay(3, retry_after=120.0) == 5.0
+
+        policy.jitter = False
+        assert policy.delay(2) == 4.0
+        assert policy.delay(10) == 5.0
+
+
+class TestPCORetryBudget:
+    """Test PCORetryBudget class."""
+
+    def test_retries_limited_to_share_of_requests(self):
+        """Test that retries beyond the floor need request volume."""
+        budget = PCORetryBudget(ratio=0.5, min_retries=2, window=60)
+        now = [0.0]
+        budget._clock = lambda: now[0]
+
+        for _ in range(4):
+            budget.record_request()
+
+        assert [budget.try_retry() for _ in range(5)] == [True] * 4 + [False]
+
+        # Retries leave the window along with the requests
+        now[0] = 61.0
+        assert budget.try_retry()
@@ -0,0 +1,51 @@
+"""Unit tests for JSON serialization."""
+
+import pytest
+
+from planning_center_api import serialization
+from planning_center_api.models.base import PCOCollection
+from planning_center_api.serialization import (
+    check_json_backend,
+    dumps,
+    loads,
+    validate_json,
+)
+
+DOCUMENT = b'{"data": [{"id": "1", "type": "Person", "attributes": {"name": " Ann "}}]}'
+
+
+class TestSerialization:
+    """Test JSON backend helpers."""
+
+    @pytest.mark.parametrize("backend", ["pydantic", "orjson", "json"])
+    def test_round_trip(self, backend):
+        """Test encoding and decoding with every backend."""
+        if backend == "orjson":
+            pytest.importorskip("orjson")
+        data = {"data": {"type": "Person", "attributes": {"first_name": "Ann"}}}
+
+        assert loads(dumps(data, backend), backend) == data
+
+    @pytest.mark.parametrize("backend", ["pydantic", "orjson", "json"])
+    def test_validate_json(self, backend):
+        """Test that every backend produces the same models."""
+        if backend == "orjson":
+            pytest.importorskip("orjson")
+
+        collection = validate_json(PCOCollection, DOCUMENT, backend)
+
+        assert collection == PCOCollection(
+            data=[{"id": "1", "type": "Person", "attributes": {"name": " Ann "}}]
+        )
+
+    def test_unknown_backend(self):
+        """Test that unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            check_json_backend("simdjson")
+
+    def test_missing_orjson(self, monkeypatch):
+        """Test a helpful error when orjson is selected but not installed."""
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        with pytest.raises(ImportError, match="fast-json"):
+            check_json_backend("orjson")
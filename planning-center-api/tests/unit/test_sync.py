@@ -0,0 +1,126 @@
+"""Unit tests for incremental sync."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from planning_center_api import PCOClient, PCOProduct
+from planning_center_api.config import PCOConfig
+from planning_center_api.models.base import PCOCollection, PCOResource
+from planning_center_api.sync import PCOSyncEngine, PCOSyncState, PCOSyncStore
+
+ROWS = [(str(i), f"2024-01-01T00:{i:02d}:00Z") for i in range(1, 8)]
+
+
+class TestPCOSyncStore:
+    """Test PCOSyncStore class."""
+
+    def test_state_round_trip(self, tmp_path):
+        """Test saving state and reading it back from another store."""
+        store = PCOSyncStore(tmp_path / "sync.sqlite3")
+        assert store.get(PCOProduct.PEOPLE, "people") == PCOSyncState()
+
+        store.save(PCOProduct.PEOPLE, "people", PCOSyncState("2024-01-01T00:00:00Z"))
+
+        reopened = PCOSyncStore(tmp_path / "sync.sqlite3")
+        assert reopened.get(PCOProduct.PEOPLE, "people").watermark == (
+            "2024-01-01T00:00:00Z"
+        )
+        reopened.reset(PCOProduct.PEOPLE, "people")
+        assert reopened.get(PCOProduct.PEOPLE, "people") == PCOSyncState()
+
+
+class TestPCOSyncEngine:
+    """Test PCOSyncEngine class."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a client whose HTTP client serves ROWS by updated_at."""
+        client = PCOClient(config=PCOConfig(access_token="test_token"))
+        client.requests = []
+
+        async def mock_get(**kwargs):
+            client.requests.append(kwargs)
+            since = kwargs.get("where[updated_at][gte]", "")
+            matching = [row for row in ROWS if row[1] >= since]
+            return PCOCollection(
+                data=[
+                    PCOResource(id=id_, type="Person", attributes={"updated_at": at})
+                    for id_, at in matching[: kwargs["per_page"]]
+                ]
+            )
+
+        mock_http_client = AsyncMock()
+        mock_http_client.get = AsyncMock(side_effect=mock_get)
+        with patch.object(client, "_ensure_client", return_value=mock_http_client):
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_sync_from_watermark(self, client, tmp_path):
+        """Test a full first pull, then an incremental one with overlap."""
+        engine = PCOSyncEngine(client, tmp_path / "sync.sqlite3", overlap=120)
+        seen = []
+
+        result = await engine.sync(
+            PCOProduct.PEOPLE, "people", lambda item: seen.append(item.id), per_page=3
+        )
+
+        assert seen == [row[0] for row in ROWS]
+        assert result.upserts == 7
+        assert result.watermark == "2024-01-01T00:07:00Z"
+        assert "where[updated_at][gte]" not in client.requests[0]
+
+        client.requests.clear()
+        seen.clear()
+        result = await engine.sync(
+            PCOProduct.PEOPLE, "people", lambda item: seen.append(item.id), per_page=3
+        )
+
+        assert client.requests[0]["where[updated_at][gte]"] == "2024-01-01T00:05:00Z"
+        assert seen == ["5", "6", "7"]
+        assert result.watermark == "2024-01-01T00:07:00Z"
+
+    @pytest.mark.asyncio
+    async def test_sync_resumes_from_checkpoint(self, client, tmp_path):
+        """Test that a crashed run resumes from its last checkpoint."""
+        engine = PCOSyncEngine(client, tmp_path / "sync.sqlite3", checkpoint_every=2)
+
+        async def failing_sink(item):
+            if item.id == "6":
+                raise RuntimeError("sink down")
+
+        with pytest.raises(RuntimeError):
+            await engine.sync(PCOProduct.PEOPLE, "people", failing_sink, per_page=3)
+
+        state = engine.store.get(PCOProduct.PEOPLE, "people")
+        assert state == PCOSyncState(checkpoint="2024-01-01T00:04:00Z")
+
+        client.requests.clear()
+        seen = []
+        result = await engine.sync(
+            PCOProduct.PEOPLE, "people", lambda item: seen.append(item.id), per_page=3
+        )
+
+        assert result.resumed
+        assert client.requests[0]["where[updated_at][gte]"] == "2024-01-01T00:04:00Z"
+        assert seen == ["4", "5", "6", "7"]
+        assert engine.store.get(PCOProduct.PEOPLE, "people") == PCOSyncState(
+            watermark="2024-01-01T00:07:00Z"
+        )
+
+    @pytest.mark.asyncio
+    async def test_buffering_sink_flushed_before_checkpoints(self, client, tmp_path):
+        """Test that a sink with flush is flushed before each checkpoint."""
+        engine = PCOSyncEngine(client, tmp_path / "sync.sqlite3", checkpoint_every=3)
+        events = []
+
+        class Sink:
+            def __call__(self, item):
+                events.append(item.id)
+
+            async def flush(self):
+                events.append("flush")
+
+        await engine.sync(PCOProduct.PEOPLE, "people", Sink(), per_page=3)
+
+        assert events == ["1", "2", "3", "flush", "4", "5", "6", "flush", "7", "flush"]
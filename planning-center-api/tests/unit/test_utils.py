@@ -1,12 +1,18 @@
 """Unit tests for utility functions."""
 
+import asyncio
+import gzip
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from decimal import Decimal
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from planning_center_api.models.base import PCOResource
+from planning_center_api.config import PCOProduct
+from planning_center_api.models.base import PCOCollection, PCOResource
 from planning_center_api.utils import (
     PCOBatchProcessor,
     PCODataAnalyzer,
@@ -23,6 +29,11 @@ from planning_center_api.utils import (
 )
 
 
+def _describe(person):
+    """Process a person in another process."""
+    return person.id, person.related("emails")
+
+
 class TestPCOBatchProcessor:
     """Test PCOBatchProcessor class."""
 
@@ -130,6 +141,119 @@ class TestPCOBatchProcessor:
         assert results[0].id == "1"
         assert results[1].id == "2"
 
+    @pytest.fixture
+    def many_people(self, processor):
+        """Serve 50 people from paginate_all, counting those fetched."""
+        fetched = []
+
+        async def mock_paginate_all(*args, **kwargs):
+            for i in range(50):
+                fetched.append(i)
+                yield PCOResource(id=str(i), type="people", attributes={"n": i})
+
+        processor.client.paginate_all = mock_paginate_all
+        return fetched
+
+    @pytest.mark.asyncio
+    async def test_pipeline_runs_async_processors_concurrently(
+        self, processor, many_people
+    ):
+        """Test that async processors overlap and results stream out."""
+        running = 0
+        peak = 0
+
+        async def enrich(person):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return person.get_attribute("n") * 2
+
+        results = [
+            result async for result in processor.pipeline_people(enrich, workers=8)
+        ]
+
+        assert sorted(results) == [i * 2 for i in range(50)]
+        assert peak == 8
+
+    @pytest.mark.asyncio
+    async def test_pipeline_applies_backpressure(self, processor, many_people):
+        """Test that fetching stops while results aren't consumed."""
+        pipeline = processor.pipeline(
+            PCOProduct.PEOPLE, "people", lambda person: person.id, queue_size=5
+        )
+        assert await anext(pipeline) == "0"
+        await asyncio.sleep(0.01)
+
+        # One consumed and five waiting results, one person held by each
+        # worker, five queued and one waiting to be queued
+        assert len(many_people) == 1 + 5 + 4 + 5 + 1
+        await pipeline.aclose()
+
+    @pytest.mark.asyncio
+    async def test_pipeline_with_executor(self, processor, many_people):
+        """Test running a plain callable in an executor."""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = [
+                result
+                async for result in processor.pipeline_people(
+                    lambda person: threading.current_thread().name, executor=executor
+                )
+            ]
+
+        assert len(results) == 50
+        assert threading.main_thread().name not in results
+
+    @pytest.mark.asyncio
+    async def test_pipeline_with_process_pool(self, processor):
+        """Test sending resources bound to their page to other processes."""
+        page = PCOCollection(
+            data=[
+                {
+                    "id": str(i),
+                    "type": "Person",
+                    "relationships": {
+                        "emails": {"data": [{"type": "Email", "id": "1"}]}
+                    },
+                }
+                for i in range(3)
+            ],
+            included=[{"id": "1", "type": "Email"}],
+        )
+        # A closure can't be pickled, so this fails unless resolvers are dropped
+        for person in page.data:
+            person.bind_resolver(lambda resource_type, resource_id: page.included[0])
+
+        async def mock_paginate_all(*args, **kwargs):
+            for person in page.data:
+                yield person
+
+        processor.client.paginate_all = mock_paginate_all
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            results = [
+                result
+                async for result in processor.pipeline_people(
+                    _describe, executor=executor
+                )
+            ]
+
+        assert sorted(results) == [("0", []), ("1", []), ("2", [])]
+
+    @pytest.mark.asyncio
+    async def test_pipeline_raises_processor_errors(self, processor, many_people):
+        """Test that a failing processor stops the pipeline."""
+
+        async def enrich(person):
+            if person.id == "3":
+                raise ValueError("bad record")
+            return person.id
+
+        with pytest.raises(ValueError, match="bad record"):
+            async for _ in processor.pipeline_people(enrich):
+                pass
+        assert len(many_people) < 50
+
 
 class TestPCODataExporter:
     """Test PCODataExporter class."""
@@ -186,14 +310,91 @@ class TestPCODataExporter:
         assert results[0]["type"] == "services"
         assert results[0]["attributes"]["name"] == "Service 1"
 
+    @pytest.mark.asyncio
+    async def test_export_people_streams_to_file(self, exporter, tmp_path):
+        """Test streaming people to a gzipped NDJSON file."""
+        requested = {}
+
+        async def mock_paginate_all(*args, **kwargs):
+            requested.update(kwargs)
+            for i in range(3):
+                yield PCOResource(id=str(i), type="Person", attributes={"n": i})
+
+        exporter.client.paginate_all = mock_paginate_all
+        exporter.client.config.json_backend = "json"
+        path = tmp_path / "people.ndjson.gz"
+
+        count = await exporter.export_people(path)
+
+        assert count == 3
+        assert requested["result_mode"] == "raw"
+        lines = gzip.decompress(path.read_bytes()).splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["0", "1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_export_resumable_continues_after_failure(self, exporter, tmp_path):
+        """Test resuming an interrupted export from its checkpoint."""
+        people = [
+            PCOResource(id=str(i), type="Person", attributes={"n": i})
+            for i in range(1, 8)
+        ]
+        requests = []
+
+        async def mock_paginate_all(*args, fail_after=None, **kwargs):
+            requests.append(kwargs)
+            after = int(kwargs.get("where[id][gt]", 0))
+            for count, person in enumerate(p for p in people if int(p.id) > after):
+                if count == fail_after:
+                    raise ConnectionError("connection reset")
+                yield person
+
+        async def mock_count(*args, **kwargs):
+            return len(people)
+
+        exporter.client.count = mock_count
+        exporter.client.config.default_per_page = 2
+        exporter.client.config.max_per_page = 100
+        exporter.client.config.json_backend = "json"
+        path = tmp_path / "people.csv"
+        checkpoint = tmp_path / "people.csv.checkpoint"
+
+        exporter.client.paginate_all = lambda *a, **k: mock_paginate_all(
+            *a, fail_after=5, **k
+        )
+        with pytest.raises(ConnectionError):
+            await exporter.export_resumable(PCOProduct.PEOPLE, "people", path, "csv")
+        assert json.loads(checkpoint.read_text())["cursor"] == "4"
+        assert len(path.read_text().splitlines()) == 6  # header and five rows
+
+        progress = []
+        exporter.client.paginate_all = mock_paginate_all
+        count = await exporter.export_resumable(
+            PCOProduct.PEOPLE,
+            "people",
+            path,
+            "csv",
+            progress=lambda rows, total: progress.append((rows, total)),
+        )
+
+        assert count == 7
+        assert requests[0]["keyset"] == "id"
+        assert requests[1]["where[id][gt]"] == "4"
+        assert path.read_text().splitlines() == [
+            "id,type,n",
+            *(f"{i},Person,{i}" for i in range(1, 8)),
+        ]
+        assert progress == [(4, 7), (6, 7), (7, 7)]
+        assert not checkpoint.exists()
+
 
 class TestPCODataAnalyzer:
     """Test PCODataAnalyzer class."""
 
     @pytest.fixture
     def mock_client(self):
-        """Create mock client."""
+        """Create mock client whose API doesn't report counts."""
         client = Mock()
+        client.count = AsyncMock(return_value=None)
         return client
 
     @pytest.fixture
@@ -201,6 +402,45 @@ class TestPCODataAnalyzer:
         """Create data analyzer."""
         return PCODataAnalyzer(mock_client)
 
+    @pytest.mark.asyncio
+    async def test_get_people_stats_from_counts(self, analyzer):
+        """Test reading people statistics from count queries alone."""
+
+        async def mock_count(product, resource, filter_params=None):
+            return 40 if filter_params == {"status": "active"} else 50
+
+        analyzer.client.count = mock_count
+        analyzer.client.paginate_all = Mock()
+
+        stats = await analyzer.get_people_stats()
+
+        assert stats == {
+            "total_people": 50,
+            "active_people": 40,
+            "inactive_people": 10,
+            "active_percentage": 80.0,
+        }
+        analyzer.client.paginate_all.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_count_by(self, analyzer):
+        """Test counting each value of a field concurrently."""
+        counts = {"Member": 7, "Visitor": 3}
+        analyzer.client.count = AsyncMock(
+            side_effect=lambda product, resource, filter_params: counts[
+                filter_params["membership"]
+            ]
+        )
+
+        result = await analyzer.count_by(
+            PCOProduct.PEOPLE, "people", "membership", ["Member", "Visitor"]
+        )
+
+        assert result == counts
+        assert analyzer.client.count.await_args_list[0].kwargs == {
+            "filter_params": {"membership": "Member"}
+        }
+
     @pytest.mark.asyncio
     async def test_get_people_stats(self, analyzer):
         """Test getting people statistics."""